@@ -0,0 +1,193 @@
+"""
+Модуль для замера времени пакетного поиска two_sum, запросов к TwoSumIndex
+потокового поиска two_sum_stream и параллельного k_sum.
+"""
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, List
+
+from main import (two_sum, two_sum_batch, numpy, TwoSumIndex, two_sum_stream,
+                  read_int64_chunks, write_int64_file, k_sum)
+
+
+def make_data(size: int, queries: int, seed: int = 1):
+    """
+    Создает массив случайных чисел и список целей.
+
+    Половина целей заведомо имеет решение (сумма двух случайных элементов),
+    половина - нет (нечетные суммы при четных элементах массива).
+
+    Args:
+        size: Размер массива.
+        queries: Количество целей.
+        seed: Начальное значение генератора.
+
+    Returns:
+        Кортеж (массив, цели).
+    """
+    rng = random.Random(seed)
+    nums = [rng.randrange(0, 10 ** 9, 2) for _ in range(size)]
+    targets = []
+    for q in range(queries):
+        if q % 2 == 0:
+            i, j = rng.sample(range(size), 2)
+            targets.append(nums[i] + nums[j])
+        else:
+            targets.append(rng.randrange(1, 2 * 10 ** 9, 2))
+    return nums, targets
+
+
+def measure(func: Callable[[], List], repeat: int = 3) -> float:
+    """
+    Замеряет минимальное время выполнения функции.
+
+    Args:
+        func: Функция без аргументов.
+        repeat: Количество запусков.
+
+    Returns:
+        Минимальное время в секундах.
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """
+    Сравнивает повторные вызовы two_sum с пакетным two_sum_batch.
+    """
+    print(f"{'Размер':>10} {'Целей':>7} {'two_sum x N, с':>16} {'batch Python, с':>16} {'batch NumPy, с':>16}")
+    print("-" * 70)
+    for size, queries in ((10_000, 1_000), (100_000, 1_000), (1_000_000, 200)):
+        nums, targets = make_data(size, queries)
+        array = numpy.asarray(nums) if numpy is not None else nums
+
+        repeated = measure(lambda: [two_sum(nums, t) for t in targets], repeat=1)
+        python = measure(lambda: two_sum_batch(nums, targets, use_numpy=False), repeat=1)
+        if numpy is not None:
+            vectorized = measure(lambda: two_sum_batch(array, targets, use_numpy=True))
+            vectorized_text = f"{vectorized:>16.3f}"
+        else:
+            vectorized_text = f"{'нет numpy':>16}"
+        print(f"{size:>10} {queries:>7} {repeated:>16.3f} {python:>16.3f} {vectorized_text}")
+
+
+def benchmark_index():
+    """
+    Сравнивает two_sum и TwoSumIndex на повторяющихся target.
+
+    Из 10000 запросов различных target всего 100, половина без решения;
+    между запросами изредка добавляются и удаляются числа.
+    """
+    size, queries, distinct = 100_000, 10_000, 100
+    nums, targets = make_data(size, distinct, seed=2)
+    rng = random.Random(3)
+    workload = [rng.choice(targets) for _ in range(queries)]
+
+    repeated = measure(lambda: [two_sum(nums, t) for t in workload[:100]], repeat=1) * queries / 100
+
+    start = time.perf_counter()
+    index = TwoSumIndex(nums)
+    build = time.perf_counter() - start
+
+    added = [nums[0]]
+    index.append(nums[0])
+
+    def run_index():
+        for q, target in enumerate(workload):
+            if q % 1000 == 999:
+                # Изменение массива: добавляем новое число и удаляем добавленное ранее
+                index.remove(added.pop())
+                added.append(rng.randrange(0, 10 ** 9, 2))
+                index.append(added[-1])
+            index.query(target)
+
+    # Первый прогон вычисляет ответы, второй в основном берет их из памяти
+    cold = measure(run_index, repeat=1)
+    warm = measure(run_index, repeat=1)
+
+    print()
+    print(f"{'Запросов':>10} {'two_sum x N, с':>16} {'индекс, с':>10} {'1-й прогон, с':>14} {'2-й прогон, с':>14}")
+    print("-" * 68)
+    print(f"{queries:>10} {repeated:>16.3f} {build:>10.3f} {cold:>14.3f} {warm:>14.3f}")
+    print(f"Среднее время запроса во 2-м прогоне: {warm / queries * 1e6:.1f} мкс")
+
+
+def benchmark_stream():
+    """
+    Сравнивает время и пиковую память two_sum по списку, прочитанному
+    из файла целиком, и two_sum_stream по тому же файлу int64.
+
+    Цель без решения - худший случай: просматривается весь массив.
+    Память замеряется отдельным запуском под tracemalloc, так как он
+    сильно замедляет выполнение.
+    """
+    size = 2_000_000
+    rng = random.Random(4)
+    target = 1  # нечетная сумма при четных числах - решения нет
+
+    def peak(func):
+        tracemalloc.start()
+        func()
+        memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return memory
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'nums.bin')
+        write_int64_file(path, (rng.randrange(0, 10 ** 12, 2) for _ in range(size)))
+
+        def load_and_search():
+            nums = [num for chunk in read_int64_chunks(path) for num in chunk]
+            return two_sum(nums, target)
+
+        variants = [
+            ("список + two_sum", load_and_search),
+            ("two_sum_stream", lambda: two_sum_stream(read_int64_chunks(path), target)),
+            ("two_sum_stream, 100000 в памяти",
+             lambda: two_sum_stream(read_int64_chunks(path), target, max_entries=100_000)),
+        ]
+        print()
+        print(f"{'Вариант (' + str(size) + ' чисел)':<36} {'Время, с':>10} {'Пик памяти, МБ':>16}")
+        print("-" * 64)
+        for label, func in variants:
+            elapsed = measure(func, repeat=1)
+            memory = peak(func)
+            print(f"{label:<36} {elapsed:>10.3f} {memory / 2 ** 20:>16.1f}")
+
+
+def benchmark_k_sum():
+    """
+    Замеряет масштабирование k_sum (все тройки) от 1 до N процессов.
+    """
+    size = 6000
+    rng = random.Random(5)
+    nums = [rng.randrange(-10 ** 6, 10 ** 6) for _ in range(size)]
+    target = 12345
+    cores = os.cpu_count() or 1
+
+    print()
+    print(f"3-sum, {size} чисел, ядер: {cores}")
+    print(f"{'Процессов':>10} {'Время, с':>10} {'Ускорение':>10} {'Троек':>8}")
+    print("-" * 41)
+    base = None
+    for workers in range(1, max(cores, 2) + 1):
+        found = []
+        elapsed = measure(lambda: found.append(k_sum(nums, target, 3, find_all=True, workers=workers)),
+                          repeat=1)
+        base = base or elapsed
+        print(f"{workers:>10} {elapsed:>10.3f} {base / elapsed:>9.2f}x {len(found[-1]):>8}")
+
+
+if __name__ == '__main__':
+    main()
+    benchmark_index()
+    benchmark_stream()
+    benchmark_k_sum()
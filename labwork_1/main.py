@@ -1,3 +1,53 @@
+import argparse
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left, insort
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, combinations, product
+from multiprocessing.shared_memory import SharedMemory
+
+try:
+    import numpy
+except ImportError:  # numpy - необязательная зависимость
+    numpy = None
+
+# Максимальное количество ячеек (цели x элементы), обрабатываемых NumPy за шаг
+BATCH_CELLS = 1 << 20
+
+# Граница модуля чисел, при которой target - num гарантированно помещается в int64
+INT64_SAFE = 1 << 62
+
+# Максимальное количество запомненных ответов TwoSumIndex
+INDEX_CACHE_SIZE = 100_000
+
+# Количество чисел в порции при чтении двоичного файла
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Количество символов в блоке при чтении текстового потока
+TEXT_BLOCK_SIZE = 1 << 16
+
+# Максимальное количество различных чисел в словаре потокового поиска
+STREAM_MAX_ENTRIES = 1 << 20
+
+# Количество разделов на диске при нехватке памяти
+STREAM_PARTITIONS = 64
+
+# Количество значений int64 в буфере записи раздела
+SPILL_BUFFER_SIZE = 1 << 12
+
+# Максимальная глубина повторного деления разделов
+SPILL_MAX_DEPTH = 8
+
+# Минимальное количество различных чисел, с которого k_sum запускает процессы
+KSUM_PARALLEL_MIN = 1000
+
+# Количество заданий k_sum на один процесс (для равномерной загрузки)
+KSUM_TASKS_PER_WORKER = 8
+
+
 def two_sum(nums, target):
     """
     Находит индексы двух чисел в массиве, которые в сумме дают target.
@@ -16,6 +66,606 @@ def two_sum(nums, target):
     
     return []  # Если решение не найдено
 
+def two_sum_batch(nums, targets, use_numpy=None):
+    """
+    Находит пары индексов для каждого target из списка за один проход.
+
+    Для каждой цели возвращается пара [i, j] (i < j) для наименьшего
+    числа, у которого есть дополнение до target (берутся первые вхождения
+    чисел), или [], если решения нет. Массив сортируется один раз; при
+    наличии NumPy дополнения ищутся через searchsorted сразу для всех
+    еще не решенных целей, иначе используется словарь первых вхождений,
+    построенный один раз на все цели.
+    """
+    targets = list(targets)
+    if use_numpy is None:
+        use_numpy = numpy is not None and _fits_int64(nums, targets)
+    if use_numpy:
+        return _two_sum_batch_numpy(nums, targets)
+    return _two_sum_batch_python(nums, targets)
+
+def _fits_int64(nums, targets):
+    """
+    Проверяет, что вычисления можно выполнить в int64 без переполнения.
+    """
+    if len(nums) == 0 or len(targets) == 0:
+        return True
+    try:
+        values = numpy.asarray(nums)
+    except (OverflowError, TypeError, ValueError):
+        return False
+    # dtype=int64 молча отбрасывает дробную часть - дробные числа идут
+    # в вариант без NumPy, как и слишком большие целые (dtype object)
+    if values.dtype.kind not in 'iu':
+        return False
+    return (int(numpy.abs(values).max()) < INT64_SAFE
+            and all(isinstance(t, (int, numpy.integer)) and abs(int(t)) < INT64_SAFE
+                    for t in targets))
+
+def _two_sum_batch_python(nums, targets):
+    """
+    Пакетный поиск без NumPy: словарь строится один раз на все цели.
+    """
+    first = {}   # число -> индекс первого вхождения
+    second = {}  # число -> индекс второго вхождения
+    for i, num in enumerate(nums):
+        if num not in first:
+            first[num] = i
+        elif num not in second:
+            second[num] = i
+    ordered = sorted(first.items())
+
+    results = []
+    for target in targets:
+        result = []
+        # Числа перебираются по возрастанию; после середины пары уже
+        # были бы найдены с меньшего числа
+        for num, i in ordered:
+            complement = target - num
+            if complement < num:
+                break
+            if complement == num:
+                if num in second:
+                    result = [i, second[num]]
+                    break
+            elif complement in first:
+                result = sorted([i, first[complement]])
+                break
+        results.append(result)
+    return results
+
+def _two_sum_batch_numpy(nums, targets):
+    """
+    Пакетный поиск на NumPy: searchsorted по отсортированному массиву.
+    """
+    results = [[] for _ in targets]
+    values = numpy.asarray(nums, dtype=numpy.int64)
+    n = len(values)
+    if n < 2 or not targets:
+        return results
+
+    goals = numpy.asarray(targets, dtype=numpy.int64)
+    # Стабильная сортировка: среди равных чисел первым идет меньший индекс
+    order = numpy.argsort(values, kind='stable')
+    sorted_values = values[order]
+    active = numpy.arange(len(goals))
+
+    # Числа перебираются блоками по возрастанию; дополнения в строке блока
+    # идут по убыванию, поэтому столбцы разворачиваются - searchsorted по
+    # возрастающим ключам работает намного быстрее, чем по случайным
+    start = 0
+    while start < n and active.size:
+        stop = min(n, start + max(1, BATCH_CELLS // active.size))
+        positions = numpy.arange(stop - 1, start - 1, -1)
+
+        complements = goals[active, None] - sorted_values[None, positions]
+        pos = numpy.minimum(numpy.searchsorted(sorted_values, complements), n - 1)
+        found = sorted_values[pos] == complements
+
+        # Число не может быть парой самому себе - берем следующее равное
+        itself = found & (pos == positions)
+        if itself.any():
+            nxt = numpy.minimum(pos + 1, n - 1)
+            found = numpy.where(itself, (nxt != pos) & (sorted_values[nxt] == complements), found)
+            pos = numpy.where(itself, nxt, pos)
+
+        solved = found.any(axis=1)
+        if solved.any():
+            # Наименьшее число - последний найденный столбец развернутого блока
+            columns = found.shape[1] - 1 - found[:, ::-1].argmax(axis=1)
+            for row in numpy.flatnonzero(solved):
+                column = columns[row]
+                pair = [int(order[positions[column]]), int(order[pos[row, column]])]
+                results[active[row]] = sorted(pair)
+            active = active[~solved]
+        start = stop
+
+    return results
+
+
+class TwoSumIndex:
+    """
+    Индекс массива для повторных запросов two_sum с разными target.
+
+    Индекс строится один раз: отсортированные различные числа и индексы
+    их вхождений. Запрос отвечает двумя указателями по отсортированным
+    числам за O(k), где k - количество различных чисел, а ответы
+    запоминаются, поэтому повторный target обходится в одно обращение
+    к словарю. Числа можно добавлять и удалять без перестроения индекса.
+    """
+
+    def __init__(self, nums=(), cache_size=INDEX_CACHE_SIZE):
+        self._positions = {}  # число -> возрастающий список индексов вхождений
+        self._values = []     # различные числа по возрастанию
+        self._size = 0        # следующий индекс для append
+        self._count = 0       # количество чисел в индексе
+        self._cache_size = cache_size
+        self._found = {}      # target -> найденная пара
+        self._missing = set()  # target, для которых пары нет
+        self._by_index = {}   # индекс -> target запомненных пар с этим индексом
+        for num in nums:
+            self._positions.setdefault(num, []).append(self._size)
+            self._size += 1
+        self._values = sorted(self._positions)
+        self._count = self._size
+
+    def __len__(self):
+        """
+        Возвращает количество чисел в индексе.
+        """
+        return self._count
+
+    def append(self, num):
+        """
+        Добавляет число в конец массива и возвращает его индекс.
+        """
+        index = self._size
+        self._size += 1
+        self._count += 1
+        indices = self._positions.get(num)
+        if indices is None:
+            self._positions[num] = [index]
+            insort(self._values, num)
+        else:
+            indices.append(index)
+        # Найденные пары остаются верными; пара могла появиться только
+        # для target, у которых новое число дополняет уже имеющееся
+        if self._missing:
+            self._missing = {
+                target for target in self._missing
+                if len(self._positions.get(target - num, ())) < (2 if target - num == num else 1)
+            }
+        return index
+
+    def remove(self, num):
+        """
+        Удаляет последнее вхождение числа и возвращает его индекс.
+        Индексы остальных чисел не меняются.
+        """
+        indices = self._positions.get(num)
+        if not indices:
+            raise ValueError(f"Число {num} отсутствует в индексе")
+        index = indices.pop()
+        self._count -= 1
+        if not indices:
+            del self._positions[num]
+            del self._values[bisect_left(self._values, num)]
+        # Пары с удаленным индексом больше не верны, отсутствие пары - верно
+        for target in self._by_index.pop(index, ()):
+            pair = self._found.pop(target, None)
+            if pair is not None:
+                other = pair[0] if pair[1] == index else pair[1]
+                self._by_index.get(other, set()).discard(target)
+        return index
+
+    def query(self, target):
+        """
+        Находит индексы двух чисел, которые в сумме дают target.
+        Возвращает пару [i, j] (i < j) или пустой список.
+        """
+        pair = self._found.get(target)
+        if pair is not None:
+            return list(pair)
+        if target in self._missing:
+            return []
+
+        pair = self._search(target)
+        if len(self._found) + len(self._missing) >= self._cache_size:
+            self._found.clear()
+            self._missing.clear()
+            self._by_index.clear()
+        if pair:
+            self._found[target] = pair
+            for index in pair:
+                self._by_index.setdefault(index, set()).add(target)
+        else:
+            self._missing.add(target)
+        return list(pair)
+
+    def _search(self, target):
+        """
+        Ищет пару двумя указателями по отсортированным различным числам.
+        """
+        values = self._values
+        lo, hi = 0, len(values) - 1
+        while lo <= hi:
+            total = values[lo] + values[hi]
+            if total < target:
+                lo += 1
+            elif total > target:
+                hi -= 1
+            elif lo < hi:
+                return tuple(sorted((self._positions[values[lo]][0], self._positions[values[hi]][0])))
+            else:
+                # Одно и то же число: нужны два вхождения
+                indices = self._positions[values[lo]]
+                return (indices[0], indices[1]) if len(indices) > 1 else ()
+        return ()
+
+def read_int64_chunks(path, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Читает двоичный файл чисел int64 (порядок байт платформы) порциями
+    по chunk_size чисел через отображение файла в память.
+    """
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size % 8:
+            raise ValueError(f"Размер файла {path} не кратен 8 байтам")
+        if size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mapped, 'madvise'):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mapped) as raw, raw.cast('q') as view:
+                for start in range(0, len(view), chunk_size):
+                    yield view[start:start + chunk_size].tolist()
+
+def write_int64_file(path, nums):
+    """
+    Записывает числа в двоичный файл int64 для read_int64_chunks.
+    """
+    buffer = array('q')
+    with open(path, 'wb') as file:
+        for num in nums:
+            buffer.append(num)
+            if len(buffer) >= STREAM_CHUNK_SIZE:
+                buffer.tofile(file)
+                del buffer[:]
+        buffer.tofile(file)
+
+def read_text_chunks(stream, block_size=TEXT_BLOCK_SIZE):
+    """
+    Читает целые числа, разделенные пробельными символами, из текстового
+    потока (файла или sys.stdin) блоками по block_size символов.
+    """
+    tail = ''
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        tokens = (tail + block).split()
+        # Последнее число может продолжиться в следующем блоке
+        tail = '' if block[-1].isspace() else tokens.pop()
+        if tokens:
+            yield [int(token) for token in tokens]
+    if tail:
+        yield [int(tail)]
+
+def two_sum_stream(chunks, target, max_entries=STREAM_MAX_ENTRIES,
+                   partitions=STREAM_PARTITIONS, spill_dir=None):
+    """
+    Находит индексы двух чисел с суммой target в потоке порций чисел
+    (например, из read_int64_chunks или read_text_chunks), не загружая
+    весь массив в память. Результат совпадает с two_sum для того же
+    массива.
+
+    Пока различных чисел не больше max_entries, поиск идет по словарю в
+    памяти, как в two_sum. Иначе словарь и остаток потока раскладываются
+    по partitions файлам во временном каталоге spill_dir так, что число
+    и его дополнение до target попадают в один файл, и файлы
+    обрабатываются по одному; слишком большие файлы делятся повторно.
+    Для записи на диск числа должны помещаться в int64.
+    """
+    if partitions < 2:
+        raise ValueError("Количество разделов должно быть не меньше 2")
+    num_map = {}
+    records = enumerate(chain.from_iterable(chunks))
+    for i, num in records:
+        complement = target - num
+        if complement in num_map:
+            return [num_map[complement], i]
+        num_map[num] = i
+        if len(num_map) > max_entries:
+            break
+    else:
+        return []
+
+    with tempfile.TemporaryDirectory(dir=spill_dir) as directory:
+        found = _two_sum_spilled(_drain(num_map, records), target, max_entries, partitions,
+                                 os.path.join(directory, 'part'), 0, float('inf'))
+    return [found[1], found[0]] if found else []
+
+def _drain(num_map, records):
+    """
+    Отдает содержимое словаря, освобождая его, а затем остаток потока.
+    """
+    while num_map:
+        yield num_map.popitem()
+    yield from ((num, i) for i, num in records)
+
+def _two_sum_spilled(records, target, max_entries, partitions, prefix, depth, limit):
+    """
+    Раскладывает пары (число, индекс) по разделам на диске и ищет в них
+    пару с наименьшим вторым индексом, меньшим limit. Возвращает (j, i)
+    или None.
+    """
+    paths = _spill(records, prefix, target, partitions, depth)
+    best = None
+    for path in paths:
+        found = _two_sum_partition(path, target, max_entries, partitions, depth + 1, limit)
+        os.remove(path)
+        if found is not None:
+            best = found
+            limit = found[0]
+    return best
+
+def _two_sum_partition(path, target, max_entries, partitions, depth, limit):
+    """
+    Ищет пару в одном разделе; раздел, не поместившийся в память,
+    делится повторно.
+    """
+    num_map = {}
+    records = _read_records(path)
+    for num, i in records:
+        # Пары в разделе идут по возрастанию индексов
+        if i >= limit:
+            return None
+        complement = target - num
+        if complement in num_map:
+            return i, num_map[complement]
+        num_map[num] = i
+        if len(num_map) > max_entries and depth < SPILL_MAX_DEPTH:
+            break
+    else:
+        return None
+    # Разделов ровно столько, чтобы каждый с запасом поместился в память
+    count = os.path.getsize(path) // 16
+    partitions = max(2, min(partitions, 2 * count // max_entries + 1))
+    return _two_sum_spilled(chain(num_map.items(), records), target, max_entries,
+                            partitions, path, depth, limit)
+
+def _spill(records, prefix, target, partitions, salt):
+    """
+    Записывает пары (число, индекс) в файлы разделов так, что число и
+    его дополнение до target попадают в один раздел. Порядок пар внутри
+    раздела сохраняется.
+    """
+    paths = [f"{prefix}.{p}" for p in range(partitions)]
+    buffers = [array('q') for _ in range(partitions)]
+    files = [open(path, 'wb') for path in paths]
+    try:
+        for num, i in records:
+            complement = target - num
+            # Соль - глубина деления: при повторном делении раздел
+            # распределяется по новым файлам, а не попадает в один
+            p = hash((salt, num if num < complement else complement)) % partitions
+            buffer = buffers[p]
+            buffer.append(num)
+            buffer.append(i)
+            if len(buffer) >= SPILL_BUFFER_SIZE:
+                buffer.tofile(files[p])
+                del buffer[:]
+        for buffer, file in zip(buffers, files):
+            buffer.tofile(file)
+    finally:
+        for file in files:
+            file.close()
+    return paths
+
+def _read_records(path):
+    """
+    Читает пары (число, индекс) из файла раздела.
+    """
+    with open(path, 'rb') as file:
+        while True:
+            data = file.read(SPILL_BUFFER_SIZE * 8)
+            if not data:
+                break
+            values = array('q')
+            values.frombytes(data)
+            yield from zip(values[::2], values[1::2])
+
+def k_sum(nums, target, k=3, find_all=False, workers=None):
+    """
+    Находит индексы k чисел массива, которые в сумме дают target.
+
+    При find_all=False возвращает список из k возрастающих индексов или
+    пустой список. Выбирается набор с лексикографически наименьшими
+    значениями чисел и первыми вхождениями этих чисел, поэтому ответ не
+    зависит от количества процессов. При find_all=True возвращает
+    отсортированный список всех кортежей возрастающих индексов.
+
+    Поиск идет по отсортированным различным числам: первые k-2 числа
+    перебираются вложенными циклами, последние два - двумя указателями,
+    то есть O(m^(k-1)) для m различных чисел. Диапазон первого числа
+    делится на задания для ProcessPoolExecutor с workers процессами (по
+    умолчанию - по числу ядер); числа и количества их вхождений
+    передаются процессам через разделяемую память, а не копированием
+    списков. Небольшие массивы и числа вне int64 обрабатываются в
+    текущем процессе.
+    """
+    if k < 2:
+        raise ValueError("k должно быть не меньше 2")
+    positions = {}  # число -> возрастающий список индексов вхождений
+    for i, num in enumerate(nums):
+        positions.setdefault(num, []).append(i)
+    values = sorted(positions)
+    counts = [len(positions[value]) for value in values]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    parallel = (workers > 1 and len(values) >= KSUM_PARALLEL_MIN
+                and -INT64_SAFE < values[0] and values[-1] < INT64_SAFE)
+    if parallel:
+        found = _k_sum_parallel(values, counts, k, target, find_all, workers)
+    else:
+        found = _k_sum_range(values, counts, k, target, 0, len(values), find_all)
+
+    if not find_all:
+        if not found:
+            return []
+        return sorted(i for group, size in _groups(found[0])
+                      for i in positions[values[group]][:size])
+    result = []
+    for combo in found:
+        choices = [combinations(positions[values[group]], size) for group, size in _groups(combo)]
+        result.extend(tuple(sorted(chain.from_iterable(parts))) for parts in product(*choices))
+    result.sort()
+    return result
+
+def _groups(combo):
+    """
+    Превращает неубывающий набор номеров различных чисел в пары
+    (номер, сколько раз число входит в набор).
+    """
+    groups = []
+    for d in combo:
+        if groups and groups[-1][0] == d:
+            groups[-1][1] += 1
+        else:
+            groups.append([d, 1])
+    return groups
+
+def _k_sum_parallel(values, counts, k, target, find_all, workers):
+    """
+    Распределяет диапазоны первого числа между процессами. Числа и
+    количества вхождений записываются в один блок разделяемой памяти.
+    """
+    n = len(values)
+    shared = SharedMemory(create=True, size=16 * n)
+    try:
+        with shared.buf.cast('q') as view:
+            view[:n] = array('q', values)
+            view[n:] = array('q', counts)
+        bounds = _split_work(n, k, workers * KSUM_TASKS_PER_WORKER)
+        with ProcessPoolExecutor(workers) as pool:
+            futures = [pool.submit(_k_sum_shared, shared.name, n, k, target, start, stop, find_all)
+                       for start, stop in bounds]
+            if find_all:
+                return [combo for future in futures for combo in future.result()]
+            # Задания упорядочены по первому числу: первый найденный
+            # по порядку заданий набор - наименьший
+            for future in futures:
+                found = future.result()
+                if found:
+                    for other in futures:
+                        other.cancel()
+                    return found
+            return []
+    finally:
+        shared.close()
+        shared.unlink()
+
+def _split_work(n, k, tasks):
+    """
+    Делит диапазон первого числа на отрезки примерно равной трудоемкости:
+    для первого числа с номером d перебор занимает около (n - d)^(k-2) шагов.
+    """
+    weights = [(n - d) ** (k - 2) for d in range(n)]
+    total = sum(weights)
+    bounds = []
+    start = 0
+    done = 0
+    for d, weight in enumerate(weights):
+        done += weight
+        if done * tasks >= total * (len(bounds) + 1) or d == n - 1:
+            bounds.append((start, d + 1))
+            start = d + 1
+    return bounds
+
+def _k_sum_shared(name, n, k, target, start, stop, find_all):
+    """
+    Задание процесса: читает числа из разделяемой памяти и ищет наборы
+    с первым числом из диапазона [start, stop).
+    """
+    shared = SharedMemory(name=name)
+    try:
+        with shared.buf.cast('q') as view:
+            # Локальный список быстрее при обращении по индексу, чем memoryview
+            values = view[:n].tolist()
+            counts = view[n:2 * n].tolist()
+    finally:
+        shared.close()
+    return _k_sum_range(values, counts, k, target, start, stop, find_all)
+
+def _k_sum_range(values, counts, k, target, start, stop, find_all):
+    """
+    Ищет наборы номеров различных чисел с первым номером из [start, stop).
+    """
+    found = []
+    last = values[-1] if values else 0
+    for d in range(start, stop):
+        value = values[d]
+        # Остальные числа не меньше value и не больше last
+        if value * k > target:
+            break
+        if value + last * (k - 1) < target:
+            continue
+        if _k_sum_search(values, counts, d, 1, k - 1, target - value, [d], found, find_all):
+            break
+    return found
+
+def _k_sum_search(values, counts, first, used, r, goal, chosen, found, find_all):
+    """
+    Рекурсивно выбирает еще r чисел с номерами от first (число с номером
+    first уже использовано used раз). Возвращает True, если найден
+    первый набор и поиск нужно остановить.
+    """
+    n = len(values)
+    if r == 1:
+        d = bisect_left(values, goal, first)
+        if d < n and values[d] == goal and counts[d] > (used if d == first else 0):
+            found.append((*chosen, d))
+            return not find_all
+        return False
+
+    if r == 2:
+        lo = first if counts[first] > used else first + 1
+        hi = n - 1
+        while lo <= hi:
+            total = values[lo] + values[hi]
+            if total < goal:
+                lo += 1
+            elif total > goal:
+                hi -= 1
+            else:
+                # Одно и то же число дважды - нужно два свободных вхождения
+                spare = counts[lo] - (used if lo == first else 0)
+                if lo < hi or spare >= 2:
+                    found.append((*chosen, lo, hi))
+                    if not find_all:
+                        return True
+                lo += 1
+                hi -= 1
+        return False
+
+    last = values[-1]
+    for d in range(first, n):
+        value = values[d]
+        if value * r > goal:
+            break
+        if value + last * (r - 1) < goal:
+            continue
+        taken = used + 1 if d == first else 1
+        if taken > counts[d]:
+            continue
+        chosen.append(d)
+        stop = _k_sum_search(values, counts, d, taken, r - 1, goal - value, chosen, found, find_all)
+        chosen.pop()
+        if stop:
+            return True
+    return False
+
 def get_user_input():
     """
     Получает ввод от пользователя с клавиатуры.
@@ -89,5 +739,46 @@ def main():
         else:
             print("Неверный выбор! Пожалуйста, введите 1 или 2.")
 
+def stream_main(argv=None):
+    """
+    Потоковый поиск из командной строки: числа читаются из файла или
+    стандартного ввода порциями.
+    """
+    parser = argparse.ArgumentParser(
+        description="Потоковый поиск индексов двух чисел, сумма которых равна target")
+    parser.add_argument('target', type=int, help="целевое значение")
+    parser.add_argument('path', nargs='?', default='-',
+                        help="файл с числами ('-' или не указан - стандартный ввод)")
+    parser.add_argument('--int64', action='store_true',
+                        help="двоичный файл чисел int64 вместо текста")
+    parser.add_argument('--max-entries', type=int, default=STREAM_MAX_ENTRIES,
+                        help="максимальное количество чисел в памяти")
+    parser.add_argument('--spill-dir', help="каталог для временных файлов")
+    args = parser.parse_args(argv)
+    if args.int64 and args.path == '-':
+        parser.error("двоичный формат читается только из файла")
+
+    try:
+        if args.int64:
+            chunks = read_int64_chunks(args.path)
+            result = two_sum_stream(chunks, args.target, args.max_entries, spill_dir=args.spill_dir)
+        elif args.path == '-':
+            result = two_sum_stream(read_text_chunks(sys.stdin), args.target,
+                                    args.max_entries, spill_dir=args.spill_dir)
+        else:
+            with open(args.path, encoding='utf-8') as stream:
+                result = two_sum_stream(read_text_chunks(stream), args.target,
+                                        args.max_entries, spill_dir=args.spill_dir)
+    except (OSError, ValueError) as error:
+        parser.error(str(error))
+
+    if result:
+        print(f"Найдены индексы: {result}")
+    else:
+        print("Решение не найдено: нет двух чисел, дающих в сумме target")
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1:
+        stream_main()
+    else:
+        main()
\ No newline at end of file
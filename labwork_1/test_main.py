@@ -1,5 +1,12 @@
+import io
+import itertools
+import os
+import random
+import tempfile
 import unittest
-from main import two_sum
+from main import (two_sum, two_sum_batch, numpy, TwoSumIndex, two_sum_stream,
+                  read_int64_chunks, read_text_chunks, write_int64_file, k_sum,
+                  KSUM_PARALLEL_MIN)
 
 class TestTwoSum(unittest.TestCase):
     
@@ -135,5 +142,156 @@ class TestTwoSum(unittest.TestCase):
         result2 = two_sum(nums_reversed, target)
         self.assertEqual(sorted(result2), [1, 2])
 
+
+class TestTwoSumBatch(unittest.TestCase):
+
+    def check_batch(self, use_numpy):
+        nums = [3, 2, 4, 3, -1]
+        targets = [6, 7, 1, 100, 2, 5]
+        result = two_sum_batch(nums, targets, use_numpy=use_numpy)
+        self.assertEqual(result, [[1, 2], [0, 2], [1, 4], [], [0, 4], [0, 1]])
+
+    def test_batch_python(self):
+        self.check_batch(use_numpy=False)
+
+    @unittest.skipIf(numpy is None, "numpy не установлен")
+    def test_batch_numpy(self):
+        self.check_batch(use_numpy=True)
+
+    def test_batch_matches_two_sum(self):
+        nums = list(range(-50, 50, 3))
+        targets = list(range(-120, 120))
+        for target, result in zip(targets, two_sum_batch(nums, targets)):
+            if two_sum(nums, target):
+                self.assertLess(result[0], result[1])
+                self.assertEqual(nums[result[0]] + nums[result[1]], target)
+            else:
+                self.assertEqual(result, [])
+
+    def test_batch_empty(self):
+        self.assertEqual(two_sum_batch([], [1, 2]), [[], []])
+        self.assertEqual(two_sum_batch([5], [10]), [[]])
+        self.assertEqual(two_sum_batch([1, 2], []), [])
+
+    def test_batch_big_numbers_fallback(self):
+        nums = [10 ** 20, 1, 10 ** 20 + 1]
+        self.assertEqual(two_sum_batch(nums, [2 * 10 ** 20 + 1]), [[0, 2]])
+
+    def test_batch_float_fallback(self):
+        self.assertEqual(two_sum_batch([1.5, 2.5], [4]), [two_sum([1.5, 2.5], 4)])
+        self.assertEqual(two_sum_batch([1.5, 2.5], [4]), [[0, 1]])
+
+
+class TestTwoSumIndex(unittest.TestCase):
+
+    def test_query(self):
+        index = TwoSumIndex([2, 7, 11, 15])
+        self.assertEqual(index.query(9), [0, 1])
+        self.assertEqual(index.query(26), [2, 3])
+        self.assertEqual(index.query(4), [])
+        self.assertEqual(index.query(9), [0, 1])
+        self.assertEqual(len(index), 4)
+
+    def test_duplicates(self):
+        index = TwoSumIndex([3, 2, 3])
+        self.assertEqual(index.query(6), [0, 2])
+        index.remove(3)
+        self.assertEqual(index.query(6), [])
+
+    def test_append_and_remove(self):
+        index = TwoSumIndex([1, 2])
+        self.assertEqual(index.query(10), [])
+        self.assertEqual(index.append(8), 2)
+        self.assertEqual(index.query(10), [1, 2])
+
+        self.assertEqual(index.remove(2), 1)
+        self.assertEqual(index.query(10), [])
+        self.assertEqual(index.query(9), [0, 2])
+        with self.assertRaises(ValueError):
+            index.remove(2)
+
+    def test_build_from_iterator(self):
+        index = TwoSumIndex(iter([4, 6]))
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.append(1), 2)
+        self.assertEqual(index.query(7), [1, 2])
+
+        empty = TwoSumIndex()
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty.append(5), 0)
+
+    def test_matches_two_sum(self):
+        nums = [5, -3, 8, 0, -3, 12, 7]
+        index = TwoSumIndex(nums)
+        for target in range(-10, 25):
+            result = index.query(target)
+            if two_sum(nums, target):
+                self.assertEqual(nums[result[0]] + nums[result[1]], target)
+            else:
+                self.assertEqual(result, [])
+
+
+class TestTwoSumStream(unittest.TestCase):
+
+    def test_stream(self):
+        chunks = [[2, 7], [11], [15]]
+        self.assertEqual(two_sum_stream(chunks, 9), [0, 1])
+        self.assertEqual(two_sum_stream(chunks, 26), [2, 3])
+        self.assertEqual(two_sum_stream(chunks, 4), [])
+        self.assertEqual(two_sum_stream([], 4), [])
+
+    def test_spill_matches_two_sum(self):
+        rng = random.Random(1)
+        for _ in range(200):
+            nums = [rng.randrange(-30, 30) for _ in range(rng.randrange(60))]
+            chunks = [nums[i:i + 7] for i in range(0, len(nums), 7)]
+            target = rng.randrange(-60, 60)
+            result = two_sum_stream(chunks, target, max_entries=3, partitions=2)
+            self.assertEqual(result, two_sum(nums, target))
+
+    def test_int64_file(self):
+        nums = [-5, 10 ** 12, 3, 7, -10 ** 12]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'nums.bin')
+            write_int64_file(path, nums)
+            self.assertEqual([n for chunk in read_int64_chunks(path, 2) for n in chunk], nums)
+            self.assertEqual(two_sum_stream(read_int64_chunks(path, 2), 0), [1, 4])
+
+    def test_text_chunks(self):
+        stream = io.StringIO("12 -3\n 45   6\n7")
+        chunks = list(read_text_chunks(stream, block_size=4))
+        self.assertEqual([n for chunk in chunks for n in chunk], [12, -3, 45, 6, 7])
+
+
+class TestKSum(unittest.TestCase):
+
+    def test_three_sum(self):
+        self.assertEqual(k_sum([-1, 0, 1, 2, -1, -4], 0, 3), [0, 3, 4])
+        self.assertEqual(k_sum([-1, 0, 1, 2, -1, -4], 0, 3, find_all=True),
+                         [(0, 1, 2), (0, 3, 4), (1, 2, 4)])
+        self.assertEqual(k_sum([1, 2, 3], 100, 3), [])
+        self.assertEqual(k_sum([2, 7, 11, 15], 9, 2), [0, 1])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(2)
+        for _ in range(200):
+            nums = [rng.randrange(-5, 6) for _ in range(rng.randrange(10))]
+            target, k = rng.randrange(-8, 9), rng.choice([2, 3, 4])
+            expected = [c for c in itertools.combinations(range(len(nums)), k)
+                        if sum(nums[i] for i in c) == target]
+            self.assertEqual(k_sum(nums, target, k, find_all=True, workers=1), expected)
+
+    def test_parallel(self):
+        rng = random.Random(3)
+        nums = [rng.randrange(-10 ** 5, 10 ** 5) for _ in range(KSUM_PARALLEL_MIN + 200)]
+        target = nums[3] + nums[50] + nums[700]
+        self.assertEqual(k_sum(nums, target, 3, workers=2), k_sum(nums, target, 3, workers=1))
+        self.assertEqual(k_sum(nums, target, 3, find_all=True, workers=2),
+                         k_sum(nums, target, 3, find_all=True, workers=1))
+
+    def test_invalid_k(self):
+        with self.assertRaises(ValueError):
+            k_sum([1, 2], 3, k=1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
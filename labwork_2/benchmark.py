@@ -0,0 +1,169 @@
+"""
+Модуль для замера времени бинарного поиска guess_number на больших диапазонах
+сравнения методов поиска по количеству попыток и времени и пакетного
+поиска guess_many.
+"""
+import random
+import time
+from typing import Callable
+
+from main import guess_number, guess_many, clear_sorted_cache, choose_method, METHODS, numpy
+
+
+# Размер диапазона и количество поисков
+SIZE = 10_000_000
+QUERIES = 20
+
+
+def legacy_binary(target, numbers):
+    """
+    Бинарный поиск в прежнем виде: сортировка списка при каждом вызове.
+    """
+    sorted_numbers = sorted(numbers)
+    left, right = 0, len(sorted_numbers) - 1
+    attempts = 0
+    while left <= right:
+        mid = (left + right) // 2
+        attempts += 1
+        if sorted_numbers[mid] == target:
+            return target, attempts
+        elif sorted_numbers[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+    raise ValueError("Целевое число отсутствует в списке")
+
+
+def measure(func: Callable[[], object]) -> float:
+    """
+    Замеряет время одного выполнения функции.
+
+    Args:
+        func: Функция без аргументов.
+
+    Returns:
+        Время в секундах.
+    """
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    """
+    Сравнивает прежний поиск по списку с поиском по списку с запомненным
+    отсортированным представлением, по заранее отсортированному списку
+    и по range.
+    """
+    rng = random.Random(1)
+    targets = [rng.randrange(SIZE) for _ in range(QUERIES)]
+
+    numbers = list(range(SIZE))
+
+    def run_legacy():
+        return [legacy_binary(t, numbers) for t in targets]
+
+    def run_cached():
+        clear_sorted_cache()
+        return [guess_number(t, numbers, 'binary') for t in targets]
+
+    def run_presorted():
+        return [guess_number(t, numbers, 'binary', presorted=True) for t in targets]
+
+    def run_range():
+        return [guess_number(t, range(SIZE), 'binary') for t in targets]
+
+    expected = run_range()
+    print(f"{'Вариант (' + str(SIZE) + ' чисел, ' + str(QUERIES) + ' поисков)':<48} {'Время, с':>10}")
+    print("-" * 59)
+    for label, func in (("список, sorted() на каждый поиск", run_legacy),
+                        ("список, запомненное представление", run_cached),
+                        ("список, presorted=True", run_presorted),
+                        ("range без материализации", run_range)):
+        assert func() == expected
+        print(f"{label:<48} {measure(func):>10.4f}")
+
+
+def benchmark_methods():
+    """
+    Сравнивает методы поиска на равномерных (range) и неравномерных
+    (квадраты чисел) отсортированных данных: среднее количество попыток
+    и время на QUERIES поисков.
+    """
+    rng = random.Random(2)
+    datasets = (
+        ("range", range(SIZE)),
+        ("квадраты", [i * i for i in range(SIZE // 10)]),
+    )
+    for label, numbers in datasets:
+        targets = [numbers[rng.randrange(len(numbers))] for _ in range(QUERIES)]
+        # Линейный поиск в начале данных, чтобы замер не длился минутами
+        near_start = [numbers[rng.randrange(1000)] for _ in range(QUERIES)]
+        print()
+        print(f"{label}, {len(numbers)} чисел, auto -> {choose_method(numbers, presorted=True)}")
+        print(f"{'Метод':<14} {'Попыток':>10} {'Время, мс':>10} {'Попыток (начало)':>18}")
+        print("-" * 55)
+        for method in METHODS:
+            searched = targets if method != 'linear' else near_start
+            start = time.perf_counter()
+            attempts = [guess_number(t, numbers, method, presorted=True)[1] for t in searched]
+            elapsed = (time.perf_counter() - start) * 1000
+            first = [guess_number(t, numbers, method, presorted=True)[1] for t in near_start]
+            mean = sum(attempts) / len(attempts)
+            mean_text = f"{mean:>10.1f}" if method != 'linear' else f"{'-':>10}"
+            print(f"{method:<14} {mean_text} {elapsed:>10.3f} {sum(first) / len(first):>18.1f}")
+
+
+def benchmark_many():
+    """
+    Сравнивает цикл вызовов guess_number с guess_many для 100000 целей в
+    перемешанном списке из 1000000 чисел.
+    """
+    size, count = 1_000_000, 100_000
+    rng = random.Random(3)
+    numbers = list(range(size))
+    rng.shuffle(numbers)
+    targets = [rng.randrange(size + size // 10) for _ in range(count)]
+    sorted_targets = sorted(targets)
+
+    print()
+    print(f"{'Вариант (' + str(count) + ' целей, ' + str(size) + ' чисел)':<48} {'Время, с':>10}")
+    print("-" * 59)
+
+    def loop(method, sample):
+        results = []
+        for target in sample:
+            try:
+                results.append(guess_number(target, numbers, method))
+            except ValueError:
+                results.append(None)
+        return results
+
+    # Линейный цикл слишком долгий - замер на 100 целях с пересчетом
+    linear = measure(lambda: loop('linear', targets[:100])) * count / 100
+    print(f"{'цикл guess_number, linear (оценка)':<48} {linear:>10.3f}")
+    print(f"{'guess_many, linear':<48} {measure(lambda: guess_many(targets, numbers, 'linear')):>10.3f}")
+
+    clear_sorted_cache()
+    expected = loop('binary', targets)
+    variants = [
+        ("цикл guess_number, binary (кэш сортировки)", lambda: loop('binary', targets)),
+        ("guess_many, binary", lambda: guess_many(targets, numbers, 'binary')),
+        ("guess_many, binary, отсортированные цели", lambda: guess_many(sorted_targets, numbers, 'binary')),
+    ]
+    if numpy is not None:
+        array = numpy.asarray(numbers)
+        guess_many(targets[:1], array, 'binary')  # сортировка массива запоминается
+        variants.append(("guess_many, binary, массив NumPy", lambda: guess_many(targets, array, 'binary')))
+    for label, func in variants:
+        elapsed = measure(func)
+        result = func()
+        if 'отсортированные' not in label:
+            assert result == expected
+        print(f"{label:<48} {elapsed:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
+    benchmark_methods()
+    benchmark_many()
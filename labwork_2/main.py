@@ -1,13 +1,48 @@
 import sys
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import islice
 
-def guess_number(target, numbers, method='linear'):
+try:
+    import numpy
+except ImportError:  # numpy - необязательная зависимость
+    numpy = None
+
+# Количество запоминаемых отсортированных представлений списков
+SORTED_CACHE_SIZE = 8
+
+# id(numbers) -> (numbers, длина, отсортированное представление)
+_sorted_cache = OrderedDict()
+
+# id(numbers) -> (numbers, длина, упорядочена ли по возрастанию) для 'auto'
+_is_sorted_cache = OrderedDict()
+
+# Поддерживаемые методы поиска
+METHODS = ('linear', 'binary', 'bisect', 'interpolation', 'exponential', 'auto')
+
+UNKNOWN_METHOD_MESSAGE = ("Неизвестный метод. Используйте 'linear', 'binary', 'bisect', "
+                          "'interpolation', 'exponential' или 'auto'")
+
+# Размер, до которого метод 'auto' выбирает линейный поиск
+AUTO_LINEAR_MAX = 32
+
+# Количество контрольных точек и допустимое отклонение (доля размаха значений)
+# при проверке равномерности распределения для метода 'auto'
+UNIFORM_PROBES = 8
+UNIFORM_TOLERANCE = 0.05
+
+def guess_number(target, numbers, method='linear', presorted=False):
     """
     Угадывает число в списке с использованием указанного метода.
 
     Args:
         target (int): Число, которое нужно угадать.
-        numbers (list): Список чисел для поиска.
-        method (str): Метод поиска ('linear' или 'binary').
+        numbers (list, tuple или range): Последовательность чисел для поиска.
+        method (str): Метод поиска: 'linear', 'binary', 'bisect',
+            'interpolation', 'exponential' или 'auto' (выбор по данным,
+            см. choose_method).
+        presorted (bool): Последовательность уже отсортирована по возрастанию,
+            поиск не сортирует ее и не запоминает.
 
     Returns:
         tuple: Кортеж (угаданное число, количество попыток).
@@ -15,15 +50,240 @@ def guess_number(target, numbers, method='linear'):
     Raises:
         ValueError: Если метод неизвестен или список пуст.
     """
-    if not numbers:
+    if len(numbers) == 0:
         raise ValueError("Список чисел не может быть пустым")
 
+    if method == 'auto':
+        method = choose_method(numbers, presorted)
+        # Поиск по отсортированным данным выбирается, только если данные
+        # уже отсортированы - сортировать и запоминать их не нужно
+        presorted = presorted or method != 'linear'
+
     if method == 'linear':
         return _linear_search(target, numbers)
     elif method == 'binary':
-        return _binary_search(target, numbers)
+        return _binary_search(target, sorted_view(numbers, presorted))
+    elif method == 'bisect':
+        return _bisect_search(target, sorted_view(numbers, presorted))
+    elif method == 'interpolation':
+        return _interpolation_search(target, sorted_view(numbers, presorted))
+    elif method == 'exponential':
+        return _exponential_search(target, sorted_view(numbers, presorted))
     else:
-        raise ValueError("Неизвестный метод. Используйте 'linear' или 'binary'")
+        raise ValueError(UNKNOWN_METHOD_MESSAGE)
+
+
+def guess_many(targets, numbers, method='linear', presorted=False):
+    """
+    Угадывает сразу много чисел в одной последовательности.
+
+    Последовательность сортируется один раз на все цели. Для
+    отсортированных целей границы вхождений ищутся слиянием: поиск каждой
+    следующей цели начинается с позиции предыдущей. Для массива NumPy
+    позиции всех целей находит numpy.searchsorted, а попытки бинарного
+    поиска и bisect считаются векторно. Метод 'auto' всегда выбирает
+    среди методов по отсортированным данным (кроме коротких
+    последовательностей), так как сортировка выполняется один раз.
+
+    Args:
+        targets (iterable): Числа, которые нужно угадать.
+        numbers (list, tuple, range или numpy.ndarray): Последовательность чисел.
+        method (str): Метод поиска, как в guess_number.
+        presorted (bool): Последовательность уже отсортирована по возрастанию.
+
+    Returns:
+        list: Для каждой цели кортеж (угаданное число, количество попыток)
+        с теми же попытками, что и у guess_number, или None, если числа
+        нет в последовательности.
+
+    Raises:
+        ValueError: Если метод неизвестен или список пуст.
+    """
+    if len(numbers) == 0:
+        raise ValueError("Список чисел не может быть пустым")
+    if method not in METHODS:
+        raise ValueError(UNKNOWN_METHOD_MESSAGE)
+
+    targets = list(targets)
+    if numpy is not None and isinstance(numbers, numpy.ndarray):
+        return _guess_many_numpy(targets, numbers, method, presorted)
+
+    if method == 'auto':
+        method = _choose_batch_method(numbers, presorted)
+    if method == 'linear':
+        # Попытки линейного поиска - позиция первого вхождения
+        first = {}
+        for attempts, num in enumerate(numbers, 1):
+            if num not in first:
+                first[num] = attempts
+        return [(target, first[target]) if target in first else None for target in targets]
+
+    view = sorted_view(numbers, presorted)
+    size = len(view)
+    ordered = all(a <= b for a, b in zip(targets, targets[1:]))
+    low = 0
+    results = []
+    known = {}
+    for target in targets:
+        result = known.get(target, False)
+        if result is not False:
+            results.append(result)
+            continue
+
+        if method == 'binary' or method == 'bisect':
+            first = bisect_left(view, target, low)
+            if ordered:
+                low = first
+            if first == size or view[first] != target:
+                result = None
+            elif method == 'binary':
+                result = target, _binary_attempts(size, first, bisect_right(view, target, first))
+            else:
+                result = target, _bisect_attempts(size, first)
+        else:
+            search = _interpolation_search if method == 'interpolation' else _exponential_search
+            try:
+                result = search(target, view)
+            except ValueError:
+                result = None
+        known[target] = result
+        results.append(result)
+    return results
+
+
+def _choose_batch_method(numbers, presorted):
+    """
+    Выбирает метод для guess_many(..., 'auto'): сортировка выполняется один
+    раз на все цели, поэтому линейный поиск выбирается только для коротких
+    последовательностей.
+    """
+    if len(numbers) <= AUTO_LINEAR_MAX:
+        return 'linear'
+    return 'interpolation' if _is_uniform(sorted_view(numbers, presorted)) else 'bisect'
+
+
+def _guess_many_numpy(targets, numbers, method, presorted):
+    """
+    Пакетный поиск в массиве NumPy через numpy.searchsorted.
+    """
+    goals = numpy.asarray(targets)
+    if method == 'auto':
+        method = _choose_batch_method(numbers, presorted)
+
+    if method == 'linear':
+        values, first_index = numpy.unique(numbers, return_index=True)
+        positions = numpy.minimum(numpy.searchsorted(values, goals), len(values) - 1)
+        found = values[positions] == goals
+        attempts = first_index[positions] + 1
+    elif method == 'binary' or method == 'bisect':
+        view = sorted_view(numbers, presorted)
+        size = len(view)
+        first = numpy.searchsorted(view, goals, side='left')
+        found = view[numpy.minimum(first, size - 1)] == goals
+        if method == 'binary':
+            stop = numpy.searchsorted(view, goals, side='right')
+            attempts = _binary_attempts_numpy(size, first, stop, found)
+        else:
+            attempts = _bisect_attempts_numpy(size, first)
+    else:
+        # Интерполяционный и экспоненциальный поиск не векторизуются:
+        # отсортированный массив один раз переводится в список
+        view = sorted_view(numbers, presorted).tolist()
+        return guess_many(goals.tolist(), view, method, presorted=True)
+
+    return [(target, count) if hit else None
+            for target, count, hit in zip(goals.tolist(), attempts.tolist(), found.tolist())]
+
+
+def _binary_attempts_numpy(size, first, stop, found):
+    """
+    Векторный подсчет попыток бинарного поиска (см. _binary_attempts).
+    """
+    left = numpy.zeros_like(first)
+    right = numpy.full_like(first, size - 1)
+    mid = (left + right) // 2
+    attempts = numpy.ones_like(first)
+    active = found & ~((first <= mid) & (mid < stop))
+    while active.any():
+        go_right = mid < first
+        left = numpy.where(active & go_right, mid + 1, left)
+        right = numpy.where(active & ~go_right, mid - 1, right)
+        mid = (left + right) // 2
+        attempts += active
+        active &= ~((first <= mid) & (mid < stop))
+    return attempts
+
+
+def _bisect_attempts_numpy(size, first):
+    """
+    Векторный подсчет сравнений bisect_left (см. _bisect_attempts).
+    """
+    lo = numpy.zeros_like(first)
+    hi = numpy.full_like(first, size)
+    attempts = numpy.zeros_like(first)
+    active = lo < hi
+    while active.any():
+        mid = (lo + hi) // 2
+        go_right = mid < first
+        lo = numpy.where(active & go_right, mid + 1, lo)
+        hi = numpy.where(active & ~go_right, mid, hi)
+        attempts += active
+        active = lo < hi
+    return attempts
+
+
+def choose_method(numbers, presorted=False):
+    """
+    Выбирает самый дешевый метод поиска по характеристикам данных.
+
+    Выбор зависит только от самих данных (размер, упорядоченность,
+    равномерность), а не от предыдущих вызовов. Короткие и
+    неотсортированные последовательности просматриваются линейно: один
+    проход дешевле сортировки. Для отсортированных данных (range,
+    presorted=True или список по возрастанию) выбирается интерполяционный
+    поиск при равномерном распределении значений и bisect в остальных
+    случаях. Упорядоченность списка запоминается так же, как в sorted_view,
+    поэтому повторные вызовы для того же списка не просматривают его заново.
+
+    Args:
+        numbers (list, tuple или range): Последовательность чисел.
+        presorted (bool): Последовательность уже отсортирована.
+
+    Returns:
+        str: Название метода.
+    """
+    if len(numbers) <= AUTO_LINEAR_MAX:
+        return 'linear'
+    if not (presorted or isinstance(numbers, range) or _is_sorted(numbers)):
+        return 'linear'
+    if _is_uniform(sorted_view(numbers, presorted=True)):
+        return 'interpolation'
+    return 'bisect'
+
+
+def _is_sorted(numbers):
+    """
+    Проверяет, что последовательность упорядочена по возрастанию
+    (проход останавливается на первой инверсии, результат запоминается).
+    """
+    return _remember(_is_sorted_cache, numbers,
+                     lambda: all(a <= b for a, b in zip(numbers, islice(numbers, 1, None))))
+
+
+def _is_uniform(sorted_numbers):
+    """
+    Проверяет по контрольным точкам, что значения распределены равномерно:
+    значение в каждой точке близко к линейной интерполяции между крайними.
+    """
+    last = len(sorted_numbers) - 1
+    low, high = sorted_numbers[0], sorted_numbers[last]
+    spread = high - low
+    for probe in range(1, UNIFORM_PROBES):
+        index = probe * last // UNIFORM_PROBES
+        expected = low + spread * index / last
+        if abs(sorted_numbers[index] - expected) > spread * UNIFORM_TOLERANCE:
+            return False
+    return True
 
 
 def _linear_search(target, numbers):
@@ -40,28 +300,194 @@ def _linear_search(target, numbers):
     raise ValueError("Целевое число отсутствует в списке")
 
 
-def _binary_search(target, numbers):
+def sorted_view(numbers, presorted=False):
+    """
+    Возвращает отсортированное по возрастанию представление последовательности.
+
+    range не материализуется: возрастающий возвращается как есть, убывающий -
+    развернутым range. Массив NumPy сортируется через numpy.sort.
+    Отсортированная копия остальных последовательностей
+    запоминается по идентичности объекта (и длине), поэтому повторные поиски
+    в том же списке не сортируют его заново. После изменения списка на месте
+    без изменения длины нужно вызвать clear_sorted_cache().
+
+    Args:
+        numbers (list, tuple или range): Последовательность чисел.
+        presorted (bool): Последовательность уже отсортирована.
+
+    Returns:
+        Последовательность с доступом по индексу, отсортированная по возрастанию.
+    """
+    if presorted:
+        return numbers
+    if isinstance(numbers, range):
+        return numbers if numbers.step > 0 else numbers[::-1]
+    is_array = numpy is not None and isinstance(numbers, numpy.ndarray)
+    return _remember(_sorted_cache, numbers,
+                     lambda: numpy.sort(numbers) if is_array else sorted(numbers))
+
+
+def _remember(cache, numbers, compute):
+    """
+    Возвращает запомненный для объекта результат compute() или вычисляет
+    и запоминает его по идентичности объекта и длине (не более
+    SORTED_CACHE_SIZE объектов).
+    """
+    key = id(numbers)
+    entry = cache.get(key)
+    # Объект хранится в кэше, поэтому его id не может достаться другому объекту
+    if entry is not None and entry[0] is numbers and entry[1] == len(numbers):
+        cache.move_to_end(key)
+        return entry[2]
+
+    value = compute()
+    cache[key] = (numbers, len(numbers), value)
+    if len(cache) > SORTED_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def clear_sorted_cache():
     """
-    Бинарный поиск числа в отсортированном списке.
+    Сбрасывает запомненные отсортированные представления и упорядоченность
+    списков.
+    """
+    _sorted_cache.clear()
+    _is_sorted_cache.clear()
+
 
-    Предварительно сортирует список и выполняет классический бинарный поиск.
+def _binary_search(target, sorted_numbers):
+    """
+    Бинарный поиск числа в отсортированной последовательности.
+
+    Границы вхождений числа находятся через bisect, а количество попыток
+    классического бинарного поиска считается по индексам.
+    """
+    first = bisect_left(sorted_numbers, target)
+    if first == len(sorted_numbers) or sorted_numbers[first] != target:
+        raise ValueError("Целевое число отсутствует в списке")
+    stop = bisect_right(sorted_numbers, target, first)
+    return target, _binary_attempts(len(sorted_numbers), first, stop)
+
+
+def _binary_attempts(size, first, stop):
+    """
+    Считает попытки классического бинарного поиска числа, занимающего
+    позиции [first, stop): средний элемент левее вхождений - поиск идет
+    вправо, правее - влево, иначе число угадано.
+    """
+    left, right = 0, size - 1
+    attempts = 1
+    mid = (left + right) // 2
+    while not first <= mid < stop:
+        if mid < first:
+            left = mid + 1
+        else:
+            right = mid - 1
+        mid = (left + right) // 2
+        attempts += 1
+    return attempts
+
+
+def _bisect_search(target, sorted_numbers):
+    """
+    Поиск левой границы вхождений числа через bisect.
+
+    Попытки - сравнения, которые выполняет bisect_left; они
+    восстанавливаются по найденному индексу без повторного обращения к
+    элементам.
+    """
+    first = bisect_left(sorted_numbers, target)
+    if first == len(sorted_numbers) or sorted_numbers[first] != target:
+        raise ValueError("Целевое число отсутствует в списке")
+    return target, _bisect_attempts(len(sorted_numbers), first)
+
+
+def _bisect_attempts(size, first):
+    """
+    Считает сравнения bisect_left, вернувшего позицию first.
+    """
+    lo, hi = 0, size
+    attempts = 0
+    while lo < hi:
+        mid = (lo + hi) // 2
+        attempts += 1
+        if mid < first:
+            lo = mid + 1
+        else:
+            hi = mid
+    return attempts
+
+
+def _interpolation_search(target, sorted_numbers):
+    """
+    Интерполяционный поиск в отсортированной последовательности.
+
+    Позиция очередной попытки оценивается линейной интерполяцией между
+    значениями на границах отрезка. На равномерно распределенных данных
+    требуется O(log log n) попыток, на неравномерных - до O(n).
     """
-    sorted_numbers = sorted(numbers)
     left, right = 0, len(sorted_numbers) - 1
     attempts = 0
 
+    while left <= right:
+        low, high = sorted_numbers[left], sorted_numbers[right]
+        if not low <= target <= high:
+            break
+        if high == low:
+            mid = left
+        else:
+            mid = left + int((target - low) * (right - left) // (high - low))
+        mid_val = sorted_numbers[mid]
+        attempts += 1
+
+        if mid_val == target:
+            return target, attempts
+        elif mid_val < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    raise ValueError("Целевое число отсутствует в списке")
+
+
+def _exponential_search(target, sorted_numbers):
+    """
+    Экспоненциальный (галопирующий) поиск в отсортированной последовательности.
+
+    Проверяет элементы с индексами 0, 1, 2, 4, 8, ... до первого не
+    меньшего target, затем выполняет бинарный поиск внутри найденного
+    отрезка. Требует O(log i) попыток, где i - позиция числа, поэтому
+    выгоден для чисел в начале последовательности.
+    """
+    size = len(sorted_numbers)
+    attempts = 1
+    if sorted_numbers[0] == target:
+        return target, attempts
+
+    bound = 1
+    while bound < size:
+        mid_val = sorted_numbers[bound]
+        attempts += 1
+        if mid_val == target:
+            return target, attempts
+        if mid_val > target:
+            break
+        bound *= 2
+
+    left, right = bound // 2 + 1, min(bound, size) - 1
     while left <= right:
         mid = (left + right) // 2
         mid_val = sorted_numbers[mid]
         attempts += 1
-        
+
         if mid_val == target:
             return target, attempts
         elif mid_val < target:
             left = mid + 1
         else:
             right = mid - 1
-    
+
     raise ValueError("Целевое число отсутствует в списке")
 
 
@@ -75,7 +501,7 @@ def input_parameters():
     target = int(input("Введите загаданное число: "))
     start = int(input("Начало диапазона: "))
     end = int(input("Конец диапазона: "))
-    method = input("Метод (linear/binary): ").strip().lower()
+    method = input("Метод (linear/binary/bisect/interpolation/exponential/auto): ").strip().lower()
     
     return target, start, end, method
 
@@ -86,7 +512,7 @@ def main():
     """
     print("=== Игра 'Угадай число' ===")
     target, start, end, method = input_parameters()
-    numbers = list(range(start, end + 1))
+    numbers = range(start, end + 1)
     
     try:
         result, attempts = guess_number(target, numbers, method)
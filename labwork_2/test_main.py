@@ -2,7 +2,9 @@ import unittest
 from unittest.mock import patch
 import io
 import sys
-from main import guess_number, input_parameters, main
+import time
+from main import (guess_number, input_parameters, main, sorted_view, clear_sorted_cache,
+                  choose_method, METHODS, guess_many, numpy)
 
 
 class TestGuessNumber(unittest.TestCase):
@@ -56,6 +58,30 @@ class TestGuessNumber(unittest.TestCase):
         numbers = [-5, -3, 0, 1, 4]
         self.assertEqual(guess_number(-3, numbers, 'binary'), (-3, 3))
 
+    def test_binary_search_range(self):
+        numbers = range(1, 1001)
+        self.assertEqual(guess_number(999, numbers, 'binary'),
+                         guess_number(999, list(numbers), 'binary'))
+        self.assertEqual(guess_number(3, range(10, 0, -1), 'binary'),
+                         guess_number(3, list(range(10, 0, -1)), 'binary'))
+        result, attempts = guess_number(9_999_999, range(10 ** 7), 'binary')
+        self.assertEqual(result, 9_999_999)
+        self.assertLessEqual(attempts, 24)
+
+    def test_binary_search_presorted(self):
+        numbers = [1, 2, 3, 4, 5]
+        self.assertEqual(guess_number(1, numbers, 'binary', presorted=True), (1, 2))
+
+    def test_sorted_view_cache(self):
+        clear_sorted_cache()
+        numbers = [5, 2, 8, 1, 9]
+        view = sorted_view(numbers)
+        self.assertEqual(view, [1, 2, 5, 8, 9])
+        self.assertIs(sorted_view(numbers), view)
+        numbers.append(0)
+        self.assertEqual(sorted_view(numbers), [0, 1, 2, 5, 8, 9])
+        self.assertEqual(sorted_view(range(5, 0, -1)), range(1, 6))
+
     # Тесты на особые случаи
     def test_single_element_found(self):
         numbers = [42]
@@ -77,7 +103,9 @@ class TestGuessNumber(unittest.TestCase):
     def test_invalid_method(self):
         with self.assertRaises(ValueError) as context:
             guess_number(1, [1, 2, 3], 'invalid')
-        self.assertEqual(str(context.exception), "Неизвестный метод. Используйте 'linear' или 'binary'")
+        self.assertEqual(str(context.exception),
+                         "Неизвестный метод. Используйте 'linear', 'binary', 'bisect', "
+                         "'interpolation', 'exponential' или 'auto'")
 
     # Тесты на отсутствующие элементы
     def test_number_not_in_list_linear(self):
@@ -105,6 +133,128 @@ class TestGuessNumber(unittest.TestCase):
         self.assertEqual(result, 999)
         self.assertLess(attempts, 15)
 
+    # Тесты дополнительных методов
+    def test_all_methods_agree(self):
+        numbers = [7, -3, 12, 0, 7, 25, 4, 4, 18]
+        for method in METHODS:
+            for target in set(numbers):
+                result, attempts = guess_number(target, numbers, method)
+                self.assertEqual(result, target)
+                self.assertGreaterEqual(attempts, 1)
+            with self.assertRaises(ValueError):
+                guess_number(5, numbers, method)
+
+    def test_interpolation_attempts(self):
+        numbers = range(1, 1_000_001)
+        _, binary = guess_number(765_432, numbers, 'binary')
+        _, interpolation = guess_number(765_432, numbers, 'interpolation')
+        self.assertEqual(interpolation, 1)
+        self.assertLess(interpolation, binary)
+
+        # На неравномерных данных интерполяция требует больше попыток
+        squares = [i * i for i in range(10_000)]
+        _, skewed = guess_number(50 * 50, squares, 'interpolation', presorted=True)
+        self.assertGreater(skewed, 1)
+
+    def test_exponential_attempts(self):
+        numbers = range(1, 1_000_001)
+        _, binary = guess_number(5, numbers, 'binary')
+        _, exponential = guess_number(5, numbers, 'exponential')
+        _, bisect = guess_number(5, numbers, 'bisect')
+        self.assertLess(exponential, binary)
+        self.assertLess(exponential, bisect)
+
+    def test_auto_method(self):
+        clear_sorted_cache()
+        self.assertEqual(choose_method([3, 1, 2]), 'linear')
+        self.assertEqual(choose_method(range(1000)), 'interpolation')
+        squares = [i * i for i in range(1000)]
+        self.assertEqual(choose_method(squares, presorted=True), 'bisect')
+
+        self.assertEqual(choose_method(squares), 'bisect')
+        self.assertEqual(choose_method(list(range(1000))), 'interpolation')
+
+        # Выбор не зависит от того, искали ли в списке раньше
+        descending = list(range(1000, 0, -1))
+        self.assertEqual(choose_method(descending), 'linear')
+        self.assertEqual(guess_number(500, descending, 'auto'), (500, 501))
+        guess_number(1, descending, 'binary')
+        self.assertEqual(choose_method(descending), 'linear')
+        self.assertEqual(guess_number(500, descending, 'auto'), (500, 501))
+
+    def test_auto_method_remembers_order(self):
+        class CountingList(list):
+            scans = 0
+
+            def __iter__(self):
+                CountingList.scans += 1
+                return super().__iter__()
+
+        clear_sorted_cache()
+        numbers = CountingList(i * i for i in range(1000))
+        self.assertEqual(choose_method(numbers), 'bisect')
+        scans = CountingList.scans
+        self.assertGreater(scans, 0)
+        for _ in range(3):
+            self.assertEqual(choose_method(numbers), 'bisect')
+            self.assertEqual(guess_number(81, numbers, 'auto'), (81, 10))
+        self.assertEqual(CountingList.scans, scans)
+
+        # После изменения длины список проверяется заново
+        numbers.append(-1)
+        self.assertEqual(choose_method(numbers), 'linear')
+        self.assertGreater(CountingList.scans, scans)
+
+    def test_wall_time(self):
+        numbers = range(1_000_000)
+        timings = {}
+        for method in ('linear', 'binary', 'bisect', 'interpolation'):
+            start = time.perf_counter()
+            guess_number(999_990, numbers, method)
+            timings[method] = time.perf_counter() - start
+        for method in ('binary', 'bisect', 'interpolation'):
+            self.assertLess(timings[method], timings['linear'])
+
+    # Тесты пакетного поиска
+    def test_guess_many_matches_guess_number(self):
+        numbers = [9, -2, 5, 5, 0, 14, 3, 8, -7, 5]
+        targets = [5, 100, -7, 14, 9, 5, 1, 0]
+        for method in METHODS:
+            expected = []
+            for target in targets:
+                try:
+                    expected.append(guess_number(target, numbers, method))
+                except ValueError:
+                    expected.append(None)
+            if method != 'auto':
+                self.assertEqual(guess_many(targets, numbers, method), expected)
+            self.assertEqual(guess_many(sorted(targets), numbers, 'binary'),
+                             [guess_many([t], numbers, 'binary')[0] for t in sorted(targets)])
+
+    @unittest.skipIf(numpy is None, "numpy не установлен")
+    def test_guess_many_numpy(self):
+        numbers = list(range(1000, 0, -3))
+        targets = [1, 997, 500, 2, 1000, 4]
+        for method in METHODS:
+            clear_sorted_cache()
+            self.assertEqual(guess_many(targets, numpy.array(numbers), method),
+                             guess_many(targets, numbers, method))
+
+    def test_guess_many_iterator_targets(self):
+        expected = guess_many([1, 2], list(range(10)), 'binary')
+        self.assertEqual(guess_many(iter([1, 2]), list(range(10)), 'binary'), expected)
+        if numpy is not None:
+            self.assertEqual(guess_many(iter([1, 2]), numpy.arange(10), 'binary'), expected)
+            self.assertEqual(guess_many((t for t in [1, 2]), numpy.arange(10), 'linear'),
+                             guess_many([1, 2], list(range(10)), 'linear'))
+
+    def test_guess_many_errors(self):
+        self.assertEqual(guess_many([], [1, 2, 3], 'binary'), [])
+        with self.assertRaises(ValueError):
+            guess_many([1], [], 'binary')
+        with self.assertRaises(ValueError):
+            guess_many([1], [1, 2, 3], 'invalid')
+
     # Тест с нулевыми значениями
     def test_zero_values(self):
         numbers = [0, 0, 0, 1, 2]
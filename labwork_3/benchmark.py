@@ -0,0 +1,74 @@
+"""
+Модуль для сравнения рекурсивных и итеративных генераторов бинарного
+дерева по времени построения и пиковой памяти для разных высот и
+форматов (словарь, список, namedtuple, плоский массив).
+"""
+import gc
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+from main import (gen_bin_tree, gen_bin_tree_list, gen_bin_tree_namedtuple, gen_bin_tree_array,
+                  gen_bin_tree_iter, gen_bin_tree_list_iter, gen_bin_tree_namedtuple_iter)
+
+
+# Высоты деревьев (2^height - 1 узлов)
+HEIGHTS = (10, 14, 18, 20)
+
+# Формат -> (рекурсивный генератор, итеративный генератор)
+FORMATS = (
+    ("dict", gen_bin_tree, gen_bin_tree_iter),
+    ("list", gen_bin_tree_list, gen_bin_tree_list_iter),
+    ("namedtuple", gen_bin_tree_namedtuple, gen_bin_tree_namedtuple_iter),
+)
+
+
+def measure(func: Callable[[], object]) -> Tuple[float, float]:
+    """
+    Замеряет время и пиковую память одного построения дерева.
+
+    Время и память замеряются в разных запусках: tracemalloc
+    замедляет выделение памяти в несколько раз.
+
+    Args:
+        func: Функция без аргументов.
+
+    Returns:
+        (время в секундах, пиковая память в МБ)
+    """
+    gc.collect()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del result
+    return elapsed, peak / 2 ** 20
+
+
+def main():
+    """
+    Выводит матрицу высота x формат: время и пиковую память рекурсивного
+    и итеративного построения, а также плоского массива.
+    """
+    print(f"{'Высота':>6} {'Формат':<11} {'Рекурсия, с':>12} {'Итерация, с':>12} "
+          f"{'Рекурсия, МБ':>13} {'Итерация, МБ':>13}")
+    print("-" * 72)
+    for height in HEIGHTS:
+        for label, recursive, iterative in FORMATS:
+            assert recursive(8, 6) == iterative(8, 6)
+            rec_time, rec_peak = measure(lambda: recursive(height, 6))
+            iter_time, iter_peak = measure(lambda: iterative(height, 6))
+            print(f"{height:>6} {label:<11} {rec_time:>12.4f} {iter_time:>12.4f} "
+                  f"{rec_peak:>13.1f} {iter_peak:>13.1f}")
+        array_time, array_peak = measure(lambda: gen_bin_tree_array(height, 6))
+        print(f"{height:>6} {'array':<11} {'-':>12} {array_time:>12.4f} {'-':>13} {array_peak:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,26 @@
-from collections import namedtuple
-from typing import Optional
+from array import array
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+try:
+    import numpy
+except ImportError:  # numpy - необязательная зависимость
+    numpy = None
+
+
+# Узел дерева для gen_bin_tree_namedtuple и heap_to_namedtuple
+Node = namedtuple('Node', ['root', 'left', 'right'])
+
+# Границы значений int64 для массива узлов
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# Количество родителей уровня, потомки которых вычисляются за один шаг
+# без NumPy (ограничивает временные списки Python)
+LEVEL_BLOCK = 1 << 16
+
+# Количество узлов, запоминаемых LazyTree
+LAZY_CACHE_SIZE = 4096
 
 
 def gen_bin_tree(height: int = 5, root: int = 6) -> Optional[dict]:
@@ -86,8 +107,6 @@ def gen_bin_tree_namedtuple(height: int = 5, root: int = 6) -> Optional[object]:
     if height < 1:
         return None
     
-    Node = namedtuple('Node', ['root', 'left', 'right'])
-    
     if height == 1:
         return Node(root, None, None)
     
@@ -101,6 +120,410 @@ def gen_bin_tree_namedtuple(height: int = 5, root: int = 6) -> Optional[object]:
     )
 
 
+def gen_bin_tree_iter(height: int = 5, root: int = 6) -> Optional[dict]:
+    """
+    Итеративно генерирует бинарное дерево в виде словаря.
+
+    Значения узлов вычисляются по уровням сверху вниз, а словари
+    собираются снизу вверх, без рекурсии. Результат равен gen_bin_tree.
+
+    Args:
+        height: Высота дерева (количество уровней).
+        root: Значение корневого узла.
+
+    Returns:
+        Словарь формата gen_bin_tree или None если высота меньше 1.
+    """
+    return _build_bottom_up(height, root, lambda value, left, right: {'root': value, 'left': left, 'right': right})
+
+
+def gen_bin_tree_list_iter(height: int = 5, root: int = 6) -> Optional[list]:
+    """
+    Итеративно генерирует бинарное дерево в виде списка.
+
+    Args:
+        height: Высота дерева (количество уровней).
+        root: Значение корневого узла.
+
+    Returns:
+        Список формата gen_bin_tree_list или None если высота меньше 1.
+    """
+    return _build_bottom_up(height, root, lambda value, left, right: [value, left, right])
+
+
+def gen_bin_tree_namedtuple_iter(height: int = 5, root: int = 6) -> Optional[Node]:
+    """
+    Итеративно генерирует бинарное дерево с использованием namedtuple.
+
+    Args:
+        height: Высота дерева (количество уровней).
+        root: Значение корневого узла.
+
+    Returns:
+        Node формата gen_bin_tree_namedtuple или None если высота меньше 1.
+    """
+    return _build_bottom_up(height, root, Node)
+
+
+def _build_bottom_up(height: int, root: int, make_node: Callable[[int, Any, Any], Any]) -> Any:
+    """
+    Вычисляет значения всех уровней и собирает из них вложенное дерево.
+
+    Args:
+        height: Высота дерева.
+        root: Значение корневого узла.
+        make_node: Функция (значение, левое, правое) -> узел.
+
+    Returns:
+        Корневой узел или None если высота меньше 1.
+    """
+    if height < 1:
+        return None
+    levels = [[root]]
+    for _ in range(1, height):
+        levels.append([child for value in levels[-1] for child in (value * 2 - 2, value + 4)])
+    # Уровни запрашиваются от нижнего к корню - собранные освобождаются
+    return _assemble(height, lambda depth: levels.pop(), make_node)
+
+
+def gen_bin_tree_array(height: int = 5, root: int = 6,
+                       use_numpy: Optional[bool] = None) -> Optional[Any]:
+    """
+    Генерирует бинарное дерево в виде плоского массива int64 (куча).
+
+    Узел с индексом i имеет потомков с индексами 2 * i + 1 и 2 * i + 2,
+    уровень k занимает индексы [2^k - 1, 2^(k+1) - 1). Дерево строится
+    по уровням: потомки всего уровня вычисляются сразу (2 * r - 2 и
+    r + 4), через NumPy или блоками array('q'). На узел приходится
+    8 байт, поэтому дерево высотой 25 (33 554 431 узел) занимает 256 МБ.
+
+    Args:
+        height: Высота дерева (количество уровней).
+        root: Значение корневого узла.
+        use_numpy: Использовать NumPy (по умолчанию - если установлен).
+
+    Returns:
+        numpy.ndarray (int64) или array('q') из 2^height - 1 значений,
+        или None если высота меньше 1.
+
+    Raises:
+        OverflowError: Если значения узлов не помещаются в int64.
+    """
+    if height < 1:
+        return None
+    if use_numpy is None:
+        use_numpy = numpy is not None
+
+    # Границы значений проверяются заранее: NumPy при переполнении молча
+    # искажает значения, а array('q') упал бы посреди построения
+    low = high = root
+    for level in range(height):
+        if low < INT64_MIN or high > INT64_MAX:
+            raise OverflowError(f"Значения уровня {level + 1} не помещаются в int64")
+        low, high = min(low * 2 - 2, low + 4), max(high * 2 - 2, high + 4)
+
+    size = (1 << height) - 1
+    tree = numpy.empty(size, dtype=numpy.int64) if use_numpy else array('q', [root])
+    tree[0] = root
+    for level in range(1, height):
+        start, stop = (1 << (level - 1)) - 1, (1 << level) - 1
+        if use_numpy:
+            parents = tree[start:stop]
+            children = tree[stop:2 * stop + 1]
+            numpy.multiply(parents, 2, out=children[0::2])
+            children[0::2] -= 2
+            numpy.add(parents, 4, out=children[1::2])
+        else:
+            for block in range(start, stop, LEVEL_BLOCK):
+                parents = tree[block:min(block + LEVEL_BLOCK, stop)]
+                children = array('q', bytes(16 * len(parents)))
+                children[0::2] = array('q', [r * 2 - 2 for r in parents])
+                children[1::2] = array('q', [r + 4 for r in parents])
+                tree.extend(children)
+    return tree
+
+
+def heap_to_dict(tree: Any) -> Optional[dict]:
+    """
+    Преобразует дерево-массив в словарь формата gen_bin_tree.
+
+    Args:
+        tree: Массив узлов из gen_bin_tree_array (или None).
+
+    Returns:
+        Словарь, равный gen_bin_tree для тех же высоты и корня.
+    """
+    return _heap_to_nested(tree, lambda root, left, right: {'root': root, 'left': left, 'right': right})
+
+
+def heap_to_list(tree: Any) -> Optional[list]:
+    """
+    Преобразует дерево-массив в список формата gen_bin_tree_list.
+
+    Args:
+        tree: Массив узлов из gen_bin_tree_array (или None).
+
+    Returns:
+        Список, равный gen_bin_tree_list для тех же высоты и корня.
+    """
+    return _heap_to_nested(tree, lambda root, left, right: [root, left, right])
+
+
+def heap_to_namedtuple(tree: Any) -> Optional[Node]:
+    """
+    Преобразует дерево-массив в Node формата gen_bin_tree_namedtuple.
+
+    Args:
+        tree: Массив узлов из gen_bin_tree_array (или None).
+
+    Returns:
+        Node, равный gen_bin_tree_namedtuple для тех же высоты и корня.
+    """
+    return _heap_to_nested(tree, Node)
+
+
+def _heap_to_nested(tree: Any, make_node: Callable[[int, Any, Any], Any]) -> Any:
+    """
+    Собирает вложенное дерево из массива снизу вверх, по уровням.
+
+    Args:
+        tree: Массив узлов в порядке кучи.
+        make_node: Функция (значение, левое, правое) -> узел.
+
+    Returns:
+        Корневой узел или None для пустого дерева.
+
+    Raises:
+        ValueError: Если длина массива не равна 2^h - 1.
+    """
+    if tree is None or len(tree) == 0:
+        return None
+    size = len(tree)
+    if size & (size + 1):
+        raise ValueError("Длина массива дерева должна быть равна 2^h - 1")
+
+    return _assemble(size.bit_length(),
+                     lambda depth: _level_values(tree, (1 << depth) - 1, (1 << (depth + 1)) - 1),
+                     make_node)
+
+
+def _assemble(height: int, level_values: Callable[[int], List[int]],
+              make_node: Callable[[int, Any, Any], Any]) -> Any:
+    """
+    Собирает вложенное дерево снизу вверх: сначала листья, затем уровни
+    выше, каждый узел из значения и двух уже собранных потомков.
+
+    Args:
+        height: Высота дерева (>= 1).
+        level_values: Функция номер уровня -> значения узлов уровня;
+            вызывается для уровней от нижнего к корню.
+        make_node: Функция (значение, левое, правое) -> узел.
+
+    Returns:
+        Корневой узел.
+    """
+    nodes = [make_node(value, None, None) for value in level_values(height - 1)]
+    for depth in range(height - 2, -1, -1):
+        # Потомки идут парами подряд: zip по одному итератору дает пары
+        children = iter(nodes)
+        nodes = [make_node(value, left, right)
+                 for value, left, right in zip(level_values(depth), children, children)]
+    return nodes[0]
+
+
+def _level_values(tree: Any, start: int, stop: int) -> List[int]:
+    """Возвращает значения узлов [start, stop) как список целых Python."""
+    chunk = tree[start:stop]
+    return chunk.tolist() if hasattr(chunk, 'tolist') else list(chunk)
+
+
+class LazyTree:
+    """
+    Бинарное дерево, значения узлов которого вычисляются при обращении.
+
+    Дерево полностью задается корнем и функциями ветвления, поэтому узлы
+    не хранятся: значение узла вычисляется по пути от корня или от
+    ближайшего запомненного предка. Запрошенные узлы хранятся в LRU-кэше,
+    так что часто запрашиваемые узлы не пересчитываются. Узлы адресуются индексом в
+    порядке кучи (потомки узла i - 2 * i + 1 и 2 * i + 2) или путем от
+    корня. Дерево высотой 60 и больше можно опрашивать, не строя его.
+    """
+
+    def __init__(
+        self,
+        height: int = 5,
+        root: int = 6,
+        left_branch: Callable[[int], int] = lambda r: r * 2 - 2,
+        right_branch: Callable[[int], int] = lambda r: r + 4,
+        cache_size: int = LAZY_CACHE_SIZE
+    ):
+        """
+        Инициализация дерева.
+
+        Args:
+            height: Высота дерева (количество уровней).
+            root: Значение корневого узла.
+            left_branch: Функция для вычисления левого потомка.
+            right_branch: Функция для вычисления правого потомка.
+            cache_size: Количество запоминаемых узлов.
+        """
+        self.height = max(height, 0)
+        self.root = root
+        self.left_branch = left_branch
+        self.right_branch = right_branch
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: 'OrderedDict[int, Any]' = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """Количество узлов дерева (2^height - 1)."""
+        return (1 << self.height) - 1
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        """
+        Возвращает значение узла по индексу в порядке кучи или по ключу
+        пути вида "root_left_right".
+
+        Raises:
+            IndexError: Если узла нет в дереве.
+            ValueError: Если ключ пути некорректен.
+        """
+        if isinstance(key, str):
+            parts = key.split('_')
+            if parts[0] != 'root':
+                raise ValueError(f"Ключ пути должен начинаться с 'root': {key!r}")
+            return self.value_at(parts[1:])
+        if not 0 <= key < self.size:
+            raise IndexError(f"Узел {key} отсутствует в дереве высотой {self.height}")
+        return self._value(key)
+
+    def value_at(self, path: Iterable[str]) -> Any:
+        """
+        Возвращает значение узла по пути от корня.
+
+        Args:
+            path: Последовательность 'left' и 'right' (пустая - корень).
+
+        Returns:
+            Значение узла.
+
+        Raises:
+            IndexError: Если путь длиннее высоты дерева.
+            ValueError: Если шаг пути не 'left' и не 'right'.
+        """
+        return self[self.index_of(path)]
+
+    @staticmethod
+    def index_of(path: Iterable[str]) -> int:
+        """
+        Переводит путь от корня в индекс узла в порядке кучи.
+
+        Args:
+            path: Последовательность 'left' и 'right'.
+
+        Returns:
+            Индекс узла.
+
+        Raises:
+            ValueError: Если шаг пути не 'left' и не 'right'.
+        """
+        index = 0
+        for step in path:
+            if step == 'left':
+                index = 2 * index + 1
+            elif step == 'right':
+                index = 2 * index + 2
+            else:
+                raise ValueError(f"Шаг пути должен быть 'left' или 'right': {step!r}")
+        return index
+
+    def level(self, depth: int) -> Iterator[Any]:
+        """
+        Генератор значений узлов уровня слева направо.
+
+        Узлы уровня обходятся в глубину со стеком высотой depth, поэтому
+        память не зависит от ширины уровня, а каждый узел выше уровня
+        вычисляется один раз за обход.
+
+        Args:
+            depth: Номер уровня (0 - корень).
+
+        Raises:
+            IndexError: Если уровня нет в дереве.
+        """
+        if not 0 <= depth < self.height:
+            raise IndexError(f"Уровень {depth} отсутствует в дереве высотой {self.height}")
+        return self._iter_level(depth)
+
+    def _iter_level(self, depth: int) -> Iterator[Any]:
+        """Обход уровня в глубину (генератор для level)."""
+        left_branch, right_branch = self.left_branch, self.right_branch
+        stack = [(0, self.root)]
+        while stack:
+            level, value = stack.pop()
+            if level == depth:
+                yield value
+                continue
+            stack.append((level + 1, right_branch(value)))
+            stack.append((level + 1, left_branch(value)))
+
+    def levels(self) -> Iterator[Iterator[Any]]:
+        """Генератор уровней дерева сверху вниз; каждый уровень - генератор значений."""
+        for depth in range(self.height):
+            yield self.level(depth)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Значения узлов в порядке обхода по уровням (порядок кучи)."""
+        for level in self.levels():
+            yield from level
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Статистика кэша узлов.
+
+        Returns:
+            Словарь с количеством попаданий, промахов и запомненных узлов.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache)}
+
+    def _value(self, index: int) -> Any:
+        """
+        Вычисляет значение узла от ближайшего запомненного предка.
+        """
+        cache = self._cache
+        if index in cache:
+            self.hits += 1
+            cache.move_to_end(index)
+            return cache[index]
+        self.misses += 1
+
+        path = []
+        node = index
+        while node and node not in cache:
+            path.append(node)
+            node = (node - 1) // 2
+        if node:
+            cache.move_to_end(node)
+            value = cache[node]
+        else:
+            value = self.root
+
+        left_branch, right_branch = self.left_branch, self.right_branch
+        for node in reversed(path):
+            # Нечетный индекс - левый потомок, четный - правый
+            value = left_branch(value) if node % 2 else right_branch(value)
+
+        # Запоминается только запрошенный узел: промежуточные узлы пути
+        # вытеснили бы из кэша действительно часто запрашиваемые
+        if self.cache_size > 0:
+            cache[index] = value
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return value
+
+
 def demonstrate_trees():
     """Демонстрация работы всех функций генерации деревьев."""
     print("Дерево в виде словаря (высота 3):")
@@ -1,5 +1,7 @@
 import unittest
-from main import gen_bin_tree, gen_bin_tree_list, gen_bin_tree_namedtuple
+from main import (gen_bin_tree, gen_bin_tree_list, gen_bin_tree_namedtuple, gen_bin_tree_array,
+                  gen_bin_tree_iter, gen_bin_tree_list_iter, gen_bin_tree_namedtuple_iter,
+                  heap_to_dict, heap_to_list, heap_to_namedtuple, numpy, LazyTree)
 
 
 class TestBinaryTree(unittest.TestCase):
@@ -87,5 +89,69 @@ class TestBinaryTree(unittest.TestCase):
         self.assertEqual(dict_tree['right']['root'], named_tree.right.root)
 
 
+    def test_array_representation(self):
+        """Тест представления в виде массива (кучи)."""
+        tree = gen_bin_tree_array(3, 6, use_numpy=False)
+        self.assertEqual(list(tree), [6, 10, 10, 18, 14, 18, 14])
+        self.assertIsNone(gen_bin_tree_array(0, 6))
+
+    @unittest.skipIf(numpy is None, "numpy не установлен")
+    def test_array_numpy(self):
+        """Тест совпадения массивов NumPy и array('q')."""
+        self.assertEqual(gen_bin_tree_array(10, -3, use_numpy=True).tolist(),
+                         gen_bin_tree_array(10, -3, use_numpy=False).tolist())
+
+    def test_array_converters(self):
+        """Тест преобразования массива в существующие форматы."""
+        for height in range(1, 7):
+            tree = gen_bin_tree_array(height, 6)
+            self.assertEqual(heap_to_dict(tree), gen_bin_tree(height, 6))
+            self.assertEqual(heap_to_list(tree), gen_bin_tree_list(height, 6))
+            self.assertEqual(heap_to_namedtuple(tree), gen_bin_tree_namedtuple(height, 6))
+        with self.assertRaises(ValueError):
+            heap_to_dict([1, 2])
+
+    def test_array_overflow(self):
+        """Тест выхода значений за пределы int64."""
+        with self.assertRaises(OverflowError):
+            gen_bin_tree_array(64, 6)
+
+
+    def test_lazy_tree(self):
+        """Тест ленивого дерева: значения совпадают с массивом."""
+        tree = LazyTree(4, 6)
+        self.assertEqual(list(tree), list(gen_bin_tree_array(4, 6)))
+        self.assertEqual(tree.value_at(['left', 'right']), 14)
+        self.assertEqual(tree['root_left_left'], 18)
+        self.assertEqual([list(level) for level in tree.levels()][1], [10, 10])
+        with self.assertRaises(IndexError):
+            tree[tree.size]
+
+    def test_lazy_tree_deep(self):
+        """Тест глубокого ленивого дерева без построения."""
+        tree = LazyTree(64, 6, cache_size=16)
+        self.assertEqual(tree[tree.size - 1], 6 + 4 * 63)
+        self.assertEqual(next(tree.level(63)), 2 ** 65 + 2)
+        self.assertLessEqual(tree.cache_info()['size'], 16)
+        tree[tree.size - 1]
+        self.assertEqual(tree.cache_info()['hits'], 1)
+
+    def test_iterative_builders(self):
+        """Тест итеративных генераторов: результат совпадает с рекурсивным."""
+        for height in range(0, 8):
+            for root in (6, -3, 0, 2 ** 70):
+                self.assertEqual(gen_bin_tree_iter(height, root), gen_bin_tree(height, root))
+                self.assertEqual(gen_bin_tree_list_iter(height, root), gen_bin_tree_list(height, root))
+                self.assertEqual(gen_bin_tree_namedtuple_iter(height, root),
+                                 gen_bin_tree_namedtuple(height, root))
+        self.assertEqual(gen_bin_tree_iter(), gen_bin_tree())
+
+    def test_iterative_namedtuple_type(self):
+        """Тест типа узлов итеративного namedtuple-дерева."""
+        tree = gen_bin_tree_namedtuple_iter(3, 6)
+        self.assertEqual(type(tree), type(gen_bin_tree_namedtuple(3, 6)))
+        self.assertEqual(tree.left.right.root, 14)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
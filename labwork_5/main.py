@@ -1,5 +1,8 @@
-from collections import deque
-from typing import Any, Callable, Optional, Union
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union
+
+# Количество узлов, запоминаемых LazyTree
+LAZY_CACHE_SIZE = 4096
 
 def gen_bin_tree(
     height: int = 5,
@@ -94,6 +97,192 @@ def gen_bin_tree_deque(
     
     return tree
 
+class LazyTree:
+    """
+    Бинарное дерево, значения узлов которого вычисляются при обращении.
+
+    Дерево полностью задается корнем и функциями ветвления, поэтому узлы
+    не хранятся: значение узла вычисляется по пути от корня или от
+    ближайшего запомненного предка. Запрошенные узлы хранятся в LRU-кэше,
+    так что часто запрашиваемые узлы не пересчитываются. Узлы адресуются индексом в
+    порядке кучи (потомки узла i - 2 * i + 1 и 2 * i + 2) или путем от
+    корня. Дерево высотой 60 и больше можно опрашивать, не строя его.
+    """
+
+    def __init__(
+        self,
+        height: int = 5,
+        root: int = 6,
+        left_branch: Callable[[int], int] = lambda r: r * 2 - 2,
+        right_branch: Callable[[int], int] = lambda r: r + 4,
+        cache_size: int = LAZY_CACHE_SIZE
+    ):
+        """
+        Инициализация дерева.
+
+        Args:
+            height: Высота дерева (количество уровней).
+            root: Значение корневого узла.
+            left_branch: Функция для вычисления левого потомка.
+            right_branch: Функция для вычисления правого потомка.
+            cache_size: Количество запоминаемых узлов.
+        """
+        self.height = max(height, 0)
+        self.root = root
+        self.left_branch = left_branch
+        self.right_branch = right_branch
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache: 'OrderedDict[int, Any]' = OrderedDict()
+
+    @property
+    def size(self) -> int:
+        """Количество узлов дерева (2^height - 1)."""
+        return (1 << self.height) - 1
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        """
+        Возвращает значение узла по индексу в порядке кучи или по ключу
+        пути вида "root_left_right".
+
+        Raises:
+            IndexError: Если узла нет в дереве.
+            ValueError: Если ключ пути некорректен.
+        """
+        if isinstance(key, str):
+            parts = key.split('_')
+            if parts[0] != 'root':
+                raise ValueError(f"Ключ пути должен начинаться с 'root': {key!r}")
+            return self.value_at(parts[1:])
+        if not 0 <= key < self.size:
+            raise IndexError(f"Узел {key} отсутствует в дереве высотой {self.height}")
+        return self._value(key)
+
+    def value_at(self, path: Iterable[str]) -> Any:
+        """
+        Возвращает значение узла по пути от корня.
+
+        Args:
+            path: Последовательность 'left' и 'right' (пустая - корень).
+
+        Returns:
+            Значение узла.
+
+        Raises:
+            IndexError: Если путь длиннее высоты дерева.
+            ValueError: Если шаг пути не 'left' и не 'right'.
+        """
+        return self[self.index_of(path)]
+
+    @staticmethod
+    def index_of(path: Iterable[str]) -> int:
+        """
+        Переводит путь от корня в индекс узла в порядке кучи.
+
+        Args:
+            path: Последовательность 'left' и 'right'.
+
+        Returns:
+            Индекс узла.
+
+        Raises:
+            ValueError: Если шаг пути не 'left' и не 'right'.
+        """
+        index = 0
+        for step in path:
+            if step == 'left':
+                index = 2 * index + 1
+            elif step == 'right':
+                index = 2 * index + 2
+            else:
+                raise ValueError(f"Шаг пути должен быть 'left' или 'right': {step!r}")
+        return index
+
+    def level(self, depth: int) -> Iterator[Any]:
+        """
+        Генератор значений узлов уровня слева направо.
+
+        Узлы уровня обходятся в глубину со стеком высотой depth, поэтому
+        память не зависит от ширины уровня, а каждый узел выше уровня
+        вычисляется один раз за обход.
+
+        Args:
+            depth: Номер уровня (0 - корень).
+
+        Raises:
+            IndexError: Если уровня нет в дереве.
+        """
+        if not 0 <= depth < self.height:
+            raise IndexError(f"Уровень {depth} отсутствует в дереве высотой {self.height}")
+        return self._iter_level(depth)
+
+    def _iter_level(self, depth: int) -> Iterator[Any]:
+        """Обход уровня в глубину (генератор для level)."""
+        left_branch, right_branch = self.left_branch, self.right_branch
+        stack = [(0, self.root)]
+        while stack:
+            level, value = stack.pop()
+            if level == depth:
+                yield value
+                continue
+            stack.append((level + 1, right_branch(value)))
+            stack.append((level + 1, left_branch(value)))
+
+    def levels(self) -> Iterator[Iterator[Any]]:
+        """Генератор уровней дерева сверху вниз; каждый уровень - генератор значений."""
+        for depth in range(self.height):
+            yield self.level(depth)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Значения узлов в порядке обхода по уровням (порядок кучи)."""
+        for level in self.levels():
+            yield from level
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Статистика кэша узлов.
+
+        Returns:
+            Словарь с количеством попаданий, промахов и запомненных узлов.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._cache)}
+
+    def _value(self, index: int) -> Any:
+        """
+        Вычисляет значение узла от ближайшего запомненного предка.
+        """
+        cache = self._cache
+        if index in cache:
+            self.hits += 1
+            cache.move_to_end(index)
+            return cache[index]
+        self.misses += 1
+
+        path = []
+        node = index
+        while node and node not in cache:
+            path.append(node)
+            node = (node - 1) // 2
+        if node:
+            cache.move_to_end(node)
+            value = cache[node]
+        else:
+            value = self.root
+
+        left_branch, right_branch = self.left_branch, self.right_branch
+        for node in reversed(path):
+            # Нечетный индекс - левый потомок, четный - правый
+            value = left_branch(value) if node % 2 else right_branch(value)
+
+        # Запоминается только запрошенный узел: промежуточные узлы пути
+        # вытеснили бы из кэша действительно часто запрашиваемые
+        if self.cache_size > 0:
+            cache[index] = value
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return value
+
 if __name__ == "__main__":
     # Пример использования
     tree_dict = gen_bin_tree()
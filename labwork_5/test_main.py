@@ -1,6 +1,6 @@
 import unittest
 from collections import deque
-from main import gen_bin_tree, gen_bin_tree_deque
+from main import gen_bin_tree, gen_bin_tree_deque, LazyTree
 
 class TestBinTree(unittest.TestCase):
     
@@ -66,5 +66,28 @@ class TestBinTree(unittest.TestCase):
         
         self.assertEqual(sorted(dict_values), sorted(deque_values))
 
+    def test_lazy_tree(self):
+        """Тест ленивого дерева: значения совпадают со словарем"""
+        tree = gen_bin_tree(height=4, root=8)
+        lazy = LazyTree(height=4, root=8)
+        for key, value in tree.items():
+            self.assertEqual(lazy[key], value)
+        self.assertEqual(list(lazy), [value for _, value in gen_bin_tree_deque(height=4, root=8)])
+
+    def test_lazy_tree_custom_branches(self):
+        """Тест ленивого дерева с пользовательскими функциями ветвления"""
+        lazy = LazyTree(height=3, root=5, left_branch=lambda r: r + 1, right_branch=lambda r: r - 1)
+        self.assertEqual(list(lazy.level(2)), [7, 5, 5, 3])
+        self.assertEqual(lazy.value_at(["right", "left"]), 5)
+
+    def test_lazy_tree_deep(self):
+        """Тест глубокого дерева (высота 80) без построения"""
+        lazy = LazyTree(height=80, root=6)
+        self.assertEqual(lazy.value_at(["right"] * 79), 6 + 4 * 79)
+        first = next(lazy.level(79))
+        self.assertEqual(first, 2 ** 81 + 2)
+        with self.assertRaises(IndexError):
+            lazy.level(80)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
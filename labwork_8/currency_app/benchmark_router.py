@@ -0,0 +1,109 @@
+"""
+Микробенчмарк диспетчеризации запросов.
+
+Сравнивает прежнюю цепочку if/elif (==, startswith, endswith) с
+скомпилированной таблицей маршрутов Router на типичных путях приложения.
+"""
+
+import timeit
+from typing import Callable, List, Optional, Tuple
+
+from server import CurrencyTrackerServer
+
+
+# Пути запросов (метод, путь) для замера
+REQUESTS: List[Tuple[str, str]] = [
+    ('GET', '/'),
+    ('GET', '/currencies'),
+    ('GET', '/static/css/style.css'),
+    ('GET', '/api/users'),
+    ('GET', '/api/users/42'),
+    ('POST', '/api/users/42/subscribe'),
+    ('GET', '/api/currencies/R01235'),
+    ('GET', '/api/exchange'),
+    ('GET', '/missing'),
+]
+
+
+def dispatch_if_elif(method: str, path: str) -> Optional[str]:
+    """Диспетчеризация цепочкой if/elif, как в do_GET/handle_api до таблицы маршрутов."""
+    if method == 'GET' and path == '/':
+        return 'handle_index'
+    elif method == 'GET' and path == '/users':
+        return 'handle_users'
+    elif method == 'GET' and path == '/user':
+        return 'handle_user'
+    elif method == 'GET' and path == '/currencies':
+        return 'handle_currencies'
+    elif method == 'GET' and path == '/author':
+        return 'handle_author'
+    elif method == 'GET' and path.startswith('/static/'):
+        return 'handle_static'
+    elif path.startswith('/api/'):
+        api_path = path[5:]
+        if api_path == 'users' and method == 'GET':
+            return 'api_get_users'
+        elif api_path.startswith('users/') and method == 'GET':
+            return 'api_get_user'
+        elif api_path == 'users' and method == 'POST':
+            return 'api_create_user'
+        elif api_path.startswith('users/') and method == 'PUT':
+            return 'api_update_user'
+        elif api_path.startswith('users/') and method == 'DELETE':
+            return 'api_delete_user'
+        elif api_path.endswith('/subscribe') and method == 'POST':
+            return 'api_subscribe_user'
+        elif api_path.endswith('/unsubscribe') and method == 'POST':
+            return 'api_unsubscribe_user'
+        elif api_path == 'currencies' and method == 'GET':
+            return 'api_get_currencies'
+        elif api_path.startswith('currencies/') and method == 'GET':
+            return 'api_get_currency'
+        elif api_path == 'exchange' and method == 'GET':
+            return 'api_calculate_exchange'
+    return None
+
+
+def dispatch_router(method: str, path: str) -> Optional[str]:
+    """Диспетчеризация через скомпилированную таблицу маршрутов."""
+    match = CurrencyTrackerServer.router.match(method, path)
+    return match.handler if match else None
+
+
+def measure(func: Callable[[str, str], Optional[str]], method: str, path: str,
+            number: int = 100000) -> float:
+    """
+    Замерить среднее время одного вызова диспетчера в микросекундах.
+
+    Args:
+        func: Функция диспетчеризации
+        method: HTTP-метод
+        path: Путь запроса
+        number: Количество вызовов в одном прогоне
+
+    Returns:
+        Время одного вызова в микросекундах (лучший из 5 прогонов)
+    """
+    timer = timeit.Timer(lambda: func(method, path))
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+def main():
+    """Запустить бенчмарк и вывести таблицу результатов."""
+    print(f"{'Запрос':<36} {'if/elif, мкс':>14} {'Router, мкс':>14}")
+    print("-" * 66)
+
+    total_chain = total_router = 0.0
+    for method, path in REQUESTS:
+        chain_time = measure(dispatch_if_elif, method, path)
+        router_time = measure(dispatch_router, method, path)
+        total_chain += chain_time
+        total_router += router_time
+        print(f"{method + ' ' + path:<36} {chain_time:>14.3f} {router_time:>14.3f}")
+
+    print("-" * 66)
+    print(f"{'Итого':<36} {total_chain:>14.3f} {total_router:>14.3f}")
+
+
+if __name__ == '__main__':
+    main()
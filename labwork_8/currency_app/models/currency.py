@@ -2,11 +2,14 @@
 Модель валюты.
 
 Содержит информацию о валюте: код, название, курс и номинал.
+Курс хранится как целое число с фиксированной точкой (utils.fixed_point).
 """
 
-from typing import Any
+from typing import Any, Optional
 from datetime import datetime
 
+from utils.fixed_point import parse_scaled, to_float, unit_rate
+
 
 class Currency:
     """Класс, представляющий валюту."""
@@ -37,7 +40,7 @@ class Currency:
         self._num_code = num_code
         self._char_code = char_code
         self._name = name
-        self._value = value
+        self._value_units = parse_scaled(value)
         self._nominal = nominal
         self._last_updated = last_updated or datetime.now()
     
@@ -102,16 +105,24 @@ class Currency:
     @property
     def value(self) -> float:
         """Получить курс валюты."""
-        return self._value
+        return to_float(self._value_units)
     
     @value.setter
     def value(self, value: float) -> None:
         """Установить курс валюты."""
-        if not isinstance(value, (int, float)):
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
             raise TypeError("Курс должен быть числом")
-        if value <= 0:
+        # Проверяется уже масштабированное значение: 0.00001 > 0, но
+        # при 4 знаках после запятой превращается в 0
+        units = parse_scaled(value)
+        if units <= 0:
             raise ValueError("Курс должен быть положительным числом")
-        self._value = float(value)
+        self._value_units = units
+    
+    @property
+    def value_units(self) -> int:
+        """Получить курс в десятитысячных долях рубля."""
+        return self._value_units
     
     @property
     def nominal(self) -> int:
@@ -151,7 +162,10 @@ class Currency:
         """
         if custom_nominal <= 0:
             raise ValueError("Номинал должен быть положительным числом")
-        return (self._value / self._nominal) * custom_nominal
+        if isinstance(custom_nominal, int):
+            # Без округления до 4 знаков: у VND курс за единицу 0.00364812
+            return unit_rate(self._value_units * custom_nominal, self._nominal)
+        return (self.value / self._nominal) * custom_nominal
     
     def to_dict(self) -> dict[str, Any]:
         """
@@ -8,29 +8,39 @@ import json
 import os
 import sys
 import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, unquote
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
+from html import escape
+
+from markupsafe import Markup
 
 # Добавляем текущую директорию в путь для импорта модулей
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-# Импортируем Jinja2
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
 # Импортируем модели
 from models import Author, App, User, Currency, UserCurrency
 
 # Импортируем утилиты
 from utils.currencies_api import (
-    get_currencies, 
+    get_rate_units, 
     get_currency_details, 
     get_all_currencies,
     calculate_exchange,
     get_currency_history
 )
+from utils.compression import compress_response
+from utils.static_assets import StaticAssetStore
+from utils.project_stats import ProjectStatsCache, count_lines_of_code, count_project_files
+from utils.router import Router
+from utils.templates import create_environment, warm_up, resolve_template
+from utils.render_cache import RenderCache
+from utils.events import EventBroadcaster, PeriodicTask
+from utils.fixed_point import to_float
+from utils.pagination import decode_cursor, encode_cursor, page_after, parse_fields, parse_limit, project
 
 # Импортируем конфигурацию
 from config import current_config as config
@@ -44,6 +54,12 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Поля, доступные для выборки через ?fields= в API списков
+USER_FIELDS = ('id', 'name', 'subscriptions', 'subscribed_currencies')
+CURRENCY_FIELDS = ('id', 'num_code', 'char_code', 'name', 'value', 'nominal',
+                   'last_updated', 'value_per_unit')
+
+
 @dataclass
 class RequestContext:
     """Контекст HTTP-запроса."""
@@ -72,14 +88,47 @@ class RequestContext:
 class CurrencyTrackerServer(BaseHTTPRequestHandler):
     """HTTP-сервер приложения Currency Tracker."""
     
-    # Инициализация Jinja2
-    env = Environment(
-        loader=FileSystemLoader('templates'),
-        autoescape=select_autoescape(['html', 'xml']),
-        trim_blocks=True,
-        lstrip_blocks=True
+    # Инициализация Jinja2 (с кэшем байт-кода на диске)
+    env = create_environment(
+        config.TEMPLATE_DIR,
+        bytecode_cache_dir=config.TEMPLATE_BYTECODE_CACHE_DIR,
+        auto_reload=config.TEMPLATE_AUTO_RELOAD
+    )
+    
+    # Шаблон страницы ошибки (ищется один раз; None - шаблона нет)
+    error_template = None
+    error_template_resolved = False
+    
+    # Статические файлы: читаются, сжимаются и получают отпечатки один раз
+    static_assets = StaticAssetStore(
+        config.STATIC_DIR,
+        memory_limit=config.STATIC_MEMORY_LIMIT,
+        compress_assets=config.COMPRESSION_ENABLED,
+        compression_min_size=config.COMPRESSION_MIN_SIZE,
+        compression_level=config.STATIC_COMPRESSION_LEVEL,
+        max_age=config.STATIC_MAX_AGE
+    )
+    env.globals['static_url'] = static_assets.url_for
+    
+    # Статистика проекта для страницы об авторе (пересчитывается при изменении файлов)
+    project_stats = ProjectStatsCache(
+        check_interval=config.PROJECT_STATS_CHECK_INTERVAL
     )
     
+    # Кэш отрендеренных страниц и фрагментов (сбрасывается при обновлении курсов)
+    render_cache = RenderCache(max_entries=config.RENDER_CACHE_MAX_ENTRIES)
+    
+    # Поток изменений курсов для клиентов (Server-Sent Events)
+    rate_events = EventBroadcaster()
+    
+    # Обычные запросы выполняются по одному, как в однопоточном сервере;
+    # потоки событий работают параллельно и блокировку не держат
+    request_lock = threading.Lock()
+    streaming_handlers = frozenset({'api_rates_stream'})
+    # Обработчики, которые берут блокировку сами: запрос к API ЦБ РФ
+    # выполняется без нее, под блокировкой - только применение курсов
+    self_locking_handlers = frozenset({'handle_currencies'})
+    
     # Состояние приложения
     app_data = {
         'app': App(
@@ -92,16 +141,66 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
         ),
         'users': [],
         'currencies': [],
+        'currencies_by_code': {},
         'subscriptions': [],
         'last_currency_update': None
     }
     
+    # Данные создаются один раз, а не при каждом запросе
+    app_data_initialized = False
+    
     # Текущий пользователь (для простоты используем первого)
     current_user_id = 1
     
+    # Таблица маршрутов: (метод, шаблон пути, имя обработчика).
+    # Параметры пути передаются обработчику позиционно после контекста.
+    router = Router.from_table([
+        ('GET', '/', 'handle_index'),
+        ('GET', '/users', 'handle_users'),
+        ('GET', '/user', 'handle_user'),
+        ('GET', '/currencies', 'handle_currencies'),
+        ('GET', '/author', 'handle_author'),
+        ('GET', '/static/{path:path}', 'handle_static'),
+        ('GET', '/api/users', 'api_get_users'),
+        ('POST', '/api/users', 'api_create_user'),
+        ('GET', '/api/users/{id}', 'api_get_user'),
+        ('PUT', '/api/users/{id}', 'api_update_user'),
+        ('DELETE', '/api/users/{id}', 'api_delete_user'),
+        ('POST', '/api/users/{id}/subscribe', 'api_subscribe_user'),
+        ('POST', '/api/users/{id}/unsubscribe', 'api_unsubscribe_user'),
+        ('GET', '/api/currencies', 'api_get_currencies'),
+        ('GET', '/api/currencies/{id}', 'api_get_currency'),
+        ('GET', '/api/exchange', 'api_calculate_exchange'),
+        ('GET', '/api/rates/stream', 'api_rates_stream'),
+    ])
+    
+    @classmethod
+    def init_templates(cls):
+        """Скомпилировать все шаблоны заранее и найти шаблон ошибки."""
+        count = warm_up(cls.env)
+        cls.get_error_template()
+        logger.info(f"Шаблонов загружено: {count}")
+    
+    @classmethod
+    def get_error_template(cls):
+        """Получить шаблон страницы ошибки (поиск выполняется один раз)."""
+        if not cls.error_template_resolved:
+            cls.error_template = resolve_template(cls.env, 'error.html')
+            cls.error_template_resolved = True
+        return cls.error_template
+    
+    @classmethod
+    def init_static_assets(cls):
+        """Загрузить статические файлы (выполняется один раз при старте)."""
+        count = cls.static_assets.load()
+        logger.info(f"Статических файлов загружено: {count}")
+    
     def __init__(self, *args, **kwargs):
         """Инициализация сервера."""
-        self.initialize_app_data()
+        with self.request_lock:
+            if not CurrencyTrackerServer.app_data_initialized:
+                self.initialize_app_data()
+                CurrencyTrackerServer.app_data_initialized = True
         super().__init__(*args, **kwargs)
     
     def initialize_app_data(self):
@@ -143,11 +242,17 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
                     # Подписка уже существует
                     pass
         
+        # Списки хранятся упорядоченными по ID: по этому порядку работает
+        # курсорная пагинация API (новые пользователи получают max(id) + 1)
+        users.sort(key=lambda u: u.id)
+        currencies.sort(key=lambda c: c.id)
+        
         # Обновляем состояние
         self.app_data.update({
             'app': app,
             'users': users,
             'currencies': currencies,
+            'currencies_by_code': {c.char_code: c for c in currencies},
             'subscriptions': subscriptions,
             'last_currency_update': datetime.now()
         })
@@ -159,48 +264,33 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
     
     def do_GET(self):
         """Обработка GET-запросов."""
-        try:
-            # Парсим URL
-            parsed_url = urlparse(self.path)
-            path = parsed_url.path
-            query_params = parse_qs(parsed_url.query)
-            
-            # Создаем контекст запроса
-            context = RequestContext(
-                path=path,
-                query_params=query_params,
-                method='GET',
-                headers=dict(self.headers)
-            )
-            
-            # Маршрутизация
-            if path == '/':
-                self.handle_index(context)
-            elif path == '/users':
-                self.handle_users(context)
-            elif path == '/user':
-                self.handle_user(context)
-            elif path == '/currencies':
-                self.handle_currencies(context)
-            elif path == '/author':
-                self.handle_author(context)
-            elif path.startswith('/static/'):
-                self.handle_static(context)
-            elif path.startswith('/api/'):
-                self.handle_api(context)
-            else:
-                self.handle_404(context)
-                
-        except Exception as e:
-            logger.error(f"Error processing GET request: {e}")
-            self.handle_error(500, str(e))
+        self.handle_request('GET')
     
     def do_POST(self):
         """Обработка POST-запросов."""
+        self.handle_request('POST')
+    
+    def do_PUT(self):
+        """Обработка PUT-запросов."""
+        self.handle_request('PUT')
+    
+    def do_DELETE(self):
+        """Обработка DELETE-запросов."""
+        self.handle_request('DELETE')
+    
+    def handle_request(self, method: str):
+        """
+        Разобрать запрос и передать его обработчику из таблицы маршрутов.
+        
+        Args:
+            method: HTTP-метод запроса
+        """
         try:
             # Читаем тело запроса
-            content_length = int(self.headers.get('Content-Length', 0))
-            body = self.rfile.read(content_length) if content_length > 0 else None
+            body = None
+            if method != 'GET':
+                content_length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(content_length) if content_length > 0 else None
             
             # Парсим URL
             parsed_url = urlparse(self.path)
@@ -211,19 +301,31 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
             context = RequestContext(
                 path=path,
                 query_params=query_params,
-                method='POST',
+                method=method,
                 headers=dict(self.headers),
                 body=body
             )
             
-            # Маршрутизация API
-            if path.startswith('/api/'):
-                self.handle_api(context)
-            else:
-                self.handle_404(context)
+            # Маршрутизация
+            match = self.router.match(method, path)
+            if match is not None and (match.handler in self.streaming_handlers
+                                      or match.handler in self.self_locking_handlers):
+                getattr(self, match.handler)(context, *match.params.values())
+                return
+            
+            allowed = self.router.allowed_methods(path) if match is None else None
+            with self.request_lock:
+                if match is not None:
+                    getattr(self, match.handler)(context, *match.params.values())
+                elif allowed:
+                    self.handle_405(allowed)
+                elif path.startswith('/api/'):
+                    self.handle_error(404, "API endpoint not found")
+                else:
+                    self.handle_404(context)
                 
         except Exception as e:
-            logger.error(f"Error processing POST request: {e}")
+            logger.error(f"Error processing {method} request: {e}")
             self.handle_error(500, str(e))
     
     def handle_index(self, context: RequestContext):
@@ -243,10 +345,7 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
         }
         
         html_content = template.render(**template_data)
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.send_html_response(200, html_content)
     
     def handle_users(self, context: RequestContext):
         """Обработка страницы пользователей."""
@@ -266,10 +365,7 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
         }
         
         html_content = template.render(**template_data)
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.send_html_response(200, html_content)
     
     def handle_user(self, context: RequestContext):
         """Обработка страницы конкретного пользователя."""
@@ -287,87 +383,139 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
                 self.handle_error(404, "User not found")
                 return
             
-            # Получаем подписки пользователя
+            # Страница зависит от версии курсов, имени и подписок пользователя
             user_currency_ids = user.get_subscribed_currency_ids()
-            subscriptions = [
-                c for c in self.app_data['currencies'] 
-                if c.id in user_currency_ids
-            ]
-            
-            # Подготавливаем данные для графика
-            chart_data = self.generate_chart_data(subscriptions)
-            
-            template = self.env.get_template('user.html')
-            
-            template_data = {
-                'user': user,
-                'subscriptions': subscriptions,
-                'all_currencies': self.app_data['currencies'],
-                'chart_data': chart_data,
-                'app_version': config.APP_VERSION,
-                'author_name': config.AUTHOR_NAME,
-                'author_group': config.AUTHOR_GROUP
-            }
+            cache_key = ('user', user.id, user.name, tuple(user_currency_ids))
             
-            html_content = template.render(**template_data)
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(html_content.encode('utf-8'))
+            html_content = self.render_cache.get_or_render(
+                cache_key,
+                lambda: self.render_user_page(user, user_currency_ids)
+            )
+            self.send_html_response(200, html_content)
             
         except ValueError:
             self.handle_error(400, "Invalid user ID")
     
+    def render_user_page(self, user: User, user_currency_ids: List[str]) -> str:
+        """
+        Отрендерить страницу пользователя.
+        
+        Args:
+            user: Пользователь
+            user_currency_ids: ID валют, на которые подписан пользователь
+        
+        Returns:
+            HTML содержимое страницы
+        """
+        subscriptions = [
+            c for c in self.app_data['currencies'] 
+            if c.id in user_currency_ids
+        ]
+        
+        # Подготавливаем данные для графика
+        chart_data = self.generate_chart_data(subscriptions)
+        
+        template = self.env.get_template('user.html')
+        
+        template_data = {
+            'user': user,
+            'subscriptions': subscriptions,
+            'all_currencies': self.app_data['currencies'],
+            'chart_data': chart_data,
+            'app_version': config.APP_VERSION,
+            'author_name': config.AUTHOR_NAME,
+            'author_group': config.AUTHOR_GROUP
+        }
+        
+        return template.render(**template_data)
+    
     def handle_currencies(self, context: RequestContext):
-        """Обработка страницы валют."""
-        # Проверяем, нужно ли обновить курсы
+        """Обработка страницы валют (request_lock берется внутри)."""
+        # Проверяем, нужно ли обновить курсы: загрузка идет без блокировки
         refresh = context.get_first_param('refresh')
         if refresh == 'true':
             self.update_currencies_from_api()
         
-        template = self.env.get_template('currencies.html')
+        with self.request_lock:
+            # Получаем текущего пользователя
+            current_user = next(
+                (u for u in self.app_data['users'] if u.id == self.current_user_id), 
+                None
+            )
+            subscribed_ids = tuple(current_user.get_subscribed_currency_ids()) if current_user else None
+            
+            html_content = self.render_cache.get_or_render(
+                ('currencies', current_user.id if current_user else None, subscribed_ids),
+                lambda: self.render_currencies_page(current_user, subscribed_ids)
+            )
+            self.send_html_response(200, html_content)
+    
+    def render_currencies_page(self, current_user: Optional[User],
+                               subscribed_ids: Optional[Tuple[str, ...]]) -> str:
+        """
+        Отрендерить страницу валют.
+        
+        Список валют рендерится отдельным фрагментом: он не зависит от
+        ID пользователя, поэтому общий для всех пользователей с одинаковыми
+        подписками.
+        
+        Args:
+            current_user: Текущий пользователь или None
+            subscribed_ids: ID валют, на которые подписан пользователь
+        
+        Returns:
+            HTML содержимое страницы
+        """
+        current_user_data = current_user.to_dict() if current_user else None
         
-        # Получаем текущего пользователя
-        current_user = next(
-            (u for u in self.app_data['users'] if u.id == self.current_user_id), 
-            None
+        currency_list = self.render_cache.get_or_render(
+            ('currency_list', subscribed_ids),
+            lambda: self.env.get_template('currency_list.html').render(
+                currencies=self.get_currencies_view(),
+                current_user=current_user_data
+            )
         )
         
-        # Подготавливаем данные валют
-        currencies_data = []
-        for currency in self.app_data['currencies']:
-            currency_dict = currency.to_dict()
-            # Форматируем дату для отображения
-            currency_dict['last_updated'] = self.format_datetime(currency.last_updated)
-            currencies_data.append(currency_dict)
+        template = self.env.get_template('currencies.html')
         
         template_data = {
-            'currencies': currencies_data,
-            'current_user': current_user.to_dict() if current_user else None,
+            'currencies': self.app_data['currencies'],
+            'currency_list': Markup(currency_list),
+            'current_user': current_user_data,
             'last_update': self.format_datetime(self.app_data['last_currency_update']),
             'app_version': config.APP_VERSION,
             'author_name': config.AUTHOR_NAME,
             'author_group': config.AUTHOR_GROUP
         }
         
-        html_content = template.render(**template_data)
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        return template.render(**template_data)
+    
+    def get_currencies_view(self) -> List[Dict[str, Any]]:
+        """
+        Подготовить данные валют для отображения.
+        
+        Returns:
+            Список словарей валют с отформатированной датой обновления
+        """
+        currencies_data = []
+        for currency in self.app_data['currencies']:
+            currency_dict = currency.to_dict()
+            # Форматируем дату для отображения
+            currency_dict['last_updated'] = self.format_datetime(currency.last_updated)
+            currencies_data.append(currency_dict)
+        return currencies_data
     
     def handle_author(self, context: RequestContext):
         """Обработка страницы об авторе."""
         template = self.env.get_template('author.html')
         
-        # Подсчитываем статистику проекта
-        lines_of_code = self.count_lines_of_code()
-        files_count = self.count_project_files()
+        # Статистика проекта берется из памяти, диск не читается
+        stats = self.project_stats.get()
         
         template_data = {
             'author': self.app_data['app'].author,
-            'lines_of_code': lines_of_code,
-            'files_count': files_count,
+            'lines_of_code': stats['lines_of_code'],
+            'files_count': stats['files_count'],
             'models_count': 5,  # Author, App, User, Currency, UserCurrency
             'templates_count': 6,  # Все шаблоны
             'app_version': config.APP_VERSION,
@@ -376,95 +524,88 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
         }
         
         html_content = template.render(**template_data)
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.send_html_response(200, html_content)
     
-    def handle_static(self, context: RequestContext):
+    def handle_static(self, context: RequestContext, file_path: str):
         """Обработка статических файлов."""
         try:
-            # Безопасно получаем путь к файлу
-            static_path = unquote(context.path)
+            # Безопасно получаем путь к файлу (без префикса /static/)
+            static_path = unquote(file_path)
             
             # Защита от directory traversal
             if '..' in static_path:
                 self.handle_error(403, "Access denied")
                 return
             
-            # Определяем MIME-тип
-            mime_types = {
-                '.css': 'text/css',
-                '.js': 'application/javascript',
-                '.png': 'image/png',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.gif': 'image/gif',
-                '.svg': 'image/svg+xml',
-                '.ico': 'image/x-icon',
-                '.json': 'application/json'
-            }
-            
-            # Полный путь к файлу
-            file_path = os.path.join('.', static_path.lstrip('/'))
+            if not self.static_assets.loaded:
+                self.init_static_assets()
             
-            if not os.path.exists(file_path):
+            # Файлы подготовлены при старте - здесь только поиск в словаре
+            found = self.static_assets.lookup(static_path)
+            if found is None:
                 self.handle_error(404, "File not found")
                 return
             
-            # Определяем расширение файла
-            _, ext = os.path.splitext(file_path)
-            content_type = mime_types.get(ext.lower(), 'application/octet-stream')
-            
-            # Читаем и отправляем файл
-            with open(file_path, 'rb') as f:
-                content = f.read()
-            
-            self.send_response(200)
-            self.send_header('Content-type', content_type)
-            self.send_header('Content-Length', str(len(content)))
-            self.end_headers()
-            self.wfile.write(content)
+            asset, immutable = found
+            self.static_assets.send(self, asset, immutable)
             
         except Exception as e:
             logger.error(f"Error serving static file: {e}")
             self.handle_error(500, str(e))
     
-    def handle_api(self, context: RequestContext):
-        """Обработка API запросов."""
-        api_path = context.path[4:]  # Убираем '/api/'
-        
-        # Маршрутизация API
-        if api_path == 'users' and context.method == 'GET':
-            self.api_get_users(context)
-        elif api_path.startswith('users/') and context.method == 'GET':
-            self.api_get_user(context, api_path[6:])
-        elif api_path == 'users' and context.method == 'POST':
-            self.api_create_user(context)
-        elif api_path.startswith('users/') and context.method == 'PUT':
-            self.api_update_user(context, api_path[6:])
-        elif api_path.startswith('users/') and context.method == 'DELETE':
-            self.api_delete_user(context, api_path[6:])
-        elif api_path.endswith('/subscribe') and context.method == 'POST':
-            self.api_subscribe_user(context, api_path[:-10])
-        elif api_path.endswith('/unsubscribe') and context.method == 'POST':
-            self.api_unsubscribe_user(context, api_path[:-11])
-        elif api_path == 'currencies' and context.method == 'GET':
-            self.api_get_currencies(context)
-        elif api_path.startswith('currencies/') and context.method == 'GET':
-            self.api_get_currency(context, api_path[11:])
-        elif api_path == 'exchange' and context.method == 'GET':
-            self.api_calculate_exchange(context)
-        else:
-            self.handle_error(404, "API endpoint not found")
+    def get_page_params(self, context: RequestContext, allowed_fields: Tuple[str, ...], key_type: type):
+        """
+        Разобрать параметры постраничной выдачи (cursor, limit, fields).
+        
+        Args:
+            context: Контекст запроса
+            allowed_fields: Поля, которые можно запросить через ?fields=
+            key_type: Тип ключа записей (int для пользователей, str для валют)
+        
+        Returns:
+            (ключ начала страницы, размер страницы, поля или None)
+        
+        Raises:
+            ValueError: Если параметры некорректны
+        """
+        after = decode_cursor(context.get_first_param('cursor'))
+        # Ключ другого типа нельзя сравнить с ключами списка (bool - не int)
+        if after is not None and type(after) is not key_type:
+            raise ValueError("Некорректный курсор")
+        limit = parse_limit(
+            context.get_first_param('limit'),
+            default=config.API_PAGE_SIZE,
+            maximum=config.API_MAX_PAGE_SIZE
+        )
+        fields = parse_fields(context.get_first_param('fields'), allowed_fields)
+        return after, limit, fields
     
     def api_get_users(self, context: RequestContext):
-        """API: Получить список пользователей."""
-        users_data = [user.to_dict() for user in self.app_data['users']]
+        """
+        API: Получить список пользователей.
+        
+        Параметры: cursor, limit, fields, q (поиск по имени).
+        """
+        try:
+            after, limit, fields = self.get_page_params(context, USER_FIELDS, int)
+        except ValueError as e:
+            self.send_json_response(400, {'success': False, 'message': str(e)})
+            return
+        
+        query = (context.get_first_param('q') or '').casefold()
+        predicate = (lambda u: query in u.name.casefold()) if query else None
+        
+        users, next_key = page_after(self.app_data['users'], lambda u: u.id, after, limit, predicate)
+        
+        # Подписки сериализуются, только если они запрошены
+        include_subscriptions = fields is None or not set(fields) <= {'id', 'name'}
+        users_data = [project(user.to_dict(include_subscriptions), fields) for user in users]
+        
         response = {
             'success': True,
             'users': users_data,
-            'count': len(users_data)
+            'count': len(users_data),
+            'next_cursor': encode_cursor(next_key) if next_key is not None else None
         }
         self.send_json_response(200, response)
     
@@ -654,12 +795,40 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
             self.send_json_response(500, {'success': False, 'message': str(e)})
     
     def api_get_currencies(self, context: RequestContext):
-        """API: Получить список валют."""
-        currencies_data = [currency.to_dict() for currency in self.app_data['currencies']]
+        """
+        API: Получить список валют.
+        
+        Параметры: cursor, limit, fields, char_code (точный код),
+        q (поиск по коду и названию).
+        """
+        try:
+            after, limit, fields = self.get_page_params(context, CURRENCY_FIELDS, str)
+        except ValueError as e:
+            self.send_json_response(400, {'success': False, 'message': str(e)})
+            return
+        
+        char_code = context.get_first_param('char_code')
+        query = (context.get_first_param('q') or '').casefold()
+        
+        if char_code:
+            # Точный код ищется по индексу, без обхода списка
+            currency = self.app_data['currencies_by_code'].get(char_code.upper())
+            source = [currency] if currency is not None else []
+        else:
+            source = self.app_data['currencies']
+        
+        predicate = None
+        if query:
+            predicate = lambda c: query in c.char_code.casefold() or query in c.name.casefold()
+        
+        currencies, next_key = page_after(source, lambda c: c.id, after, limit, predicate)
+        currencies_data = [project(currency.to_dict(), fields) for currency in currencies]
+        
         response = {
             'success': True,
             'currencies': currencies_data,
             'count': len(currencies_data),
+            'next_cursor': encode_cursor(next_key) if next_key is not None else None,
             'last_update': self.app_data['last_currency_update'].isoformat() if self.app_data['last_currency_update'] else None
         }
         self.send_json_response(200, response)
@@ -716,78 +885,157 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
         except Exception as e:
             self.send_json_response(500, {'success': False, 'message': str(e)})
     
+    def api_rates_stream(self, context: RequestContext):
+        """API: поток изменений курсов валют (Server-Sent Events)."""
+        self.rate_events.stream(
+            self,
+            keepalive_interval=config.SSE_KEEPALIVE_INTERVAL,
+            retry_ms=config.SSE_RETRY_MS
+        )
+    
     def handle_404(self, context: RequestContext):
         """Обработка 404 ошибки (страница не найдена)."""
-        error_template = self.env.get_template('error.html') if os.path.exists('templates/error.html') else None
-        
-        if error_template:
-            html_content = error_template.render(
-                error_code=404,
-                error_message="Страница не найдена",
-                app_version=config.APP_VERSION,
-                author_name=config.AUTHOR_NAME,
-                author_group=config.AUTHOR_GROUP
-            )
-            self.send_response(404)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(html_content.encode('utf-8'))
-        else:
-            error_message = "404 - Страница не найдена"
-            self.send_error(404, error_message)
+        self.send_html_response(404, self.render_error_page(404, "Страница не найдена"))
+    
+    def handle_405(self, allowed: List[str]):
+        """
+        Обработка 405 ошибки (путь существует, но не для этого метода).
+        
+        Args:
+            allowed: Методы, зарегистрированные для пути (заголовок Allow)
+        """
+        html_content = self.render_error_page(405, "Метод не поддерживается")
+        self.send_html_response(405, html_content, {'Allow': ', '.join(allowed)})
     
     def handle_error(self, status_code: int, message: str):
         """Обработка ошибок."""
+        self.send_html_response(status_code, self.render_error_page(status_code, message))
+    
+    def render_error_page(self, status_code: int, message: str) -> str:
+        """
+        Отрендерить страницу ошибки.
+        
+        Без шаблона (или при ошибке рендеринга) возвращается простая
+        HTML-страница: send_error для этого не подходит - текст ошибки он
+        кодирует в latin-1 и на русском сообщении падает с UnicodeEncodeError.
+        
+        Args:
+            status_code: HTTP статус
+            message: Сообщение об ошибке
+        
+        Returns:
+            HTML содержимое страницы
+        """
         try:
-            error_template = self.env.get_template('error.html') if os.path.exists('templates/error.html') else None
-            
+            error_template = self.get_error_template()
             if error_template:
-                html_content = error_template.render(
+                return error_template.render(
                     error_code=status_code,
                     error_message=message,
                     app_version=config.APP_VERSION,
                     author_name=config.AUTHOR_NAME,
                     author_group=config.AUTHOR_GROUP
                 )
-                self.send_response(status_code)
-                self.send_header('Content-type', 'text/html; charset=utf-8')
-                self.end_headers()
-                self.wfile.write(html_content.encode('utf-8'))
-            else:
-                self.send_error(status_code, message)
         except Exception as e:
             logger.error(f"Error rendering error page: {e}")
-            self.send_error(status_code, message)
+        return f"<h1>Ошибка {status_code}</h1><p>{escape(message)}</p>"
     
     def send_json_response(self, status_code: int, data: Dict[str, Any]):
         """Отправить JSON ответ."""
         json_data = json.dumps(data, ensure_ascii=False, indent=2)
+        self.send_body(status_code, 'application/json; charset=utf-8', json_data.encode('utf-8'))
+    
+    def send_html_response(self, status_code: int, html_content: str,
+                           headers: Optional[Dict[str, str]] = None):
+        """Отправить HTML ответ."""
+        self.send_body(status_code, 'text/html; charset=utf-8', html_content.encode('utf-8'), headers)
+    
+    def send_body(self, status_code: int, content_type: str, body: bytes,
+                  headers: Optional[Dict[str, str]] = None):
+        """
+        Отправить тело ответа, сжимая его при поддержке клиентом.
+        
+        Args:
+            status_code: HTTP статус
+            content_type: Значение заголовка Content-type
+            body: Тело ответа
+            headers: Дополнительные заголовки ответа
+        """
+        encoding = None
+        if config.COMPRESSION_ENABLED:
+            request_headers = getattr(self, 'headers', None)
+            body, encoding = compress_response(
+                body,
+                request_headers.get('Accept-Encoding') if request_headers else None,
+                min_size=config.COMPRESSION_MIN_SIZE,
+                level=config.COMPRESSION_LEVEL
+            )
         
         self.send_response(status_code)
-        self.send_header('Content-type', 'application/json; charset=utf-8')
-        self.send_header('Content-Length', str(len(json_data.encode('utf-8'))))
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
-        self.wfile.write(json_data.encode('utf-8'))
+        self.wfile.write(body)
     
-    def update_currencies_from_api(self):
-        """Обновить курсы валют из API."""
+    @classmethod
+    def update_currencies_from_api(cls):
+        """
+        Обновить курсы валют из API.
+        
+        Курсы загружаются без request_lock; блокировка берется только на
+        применение изменений, сброс кэша и рассылку события, поэтому
+        вызывать метод нужно без удержания request_lock.
+        """
         try:
             # Получаем актуальные курсы
-            currency_codes = [c.char_code for c in self.app_data['currencies']]
-            new_rates = get_currencies(currency_codes, config.CURRENCY_API_URL, config.CURRENCY_API_TIMEOUT)
-            
-            # Обновляем курсы в существующих объектах Currency
-            for currency in self.app_data['currencies']:
-                if currency.char_code in new_rates:
-                    currency.value = new_rates[currency.char_code]
-                    currency.last_updated = datetime.now()
+            currency_codes = [c.char_code for c in cls.app_data['currencies']]
+            new_rates = get_rate_units(currency_codes, config.CURRENCY_API_URL, config.CURRENCY_API_TIMEOUT)
             
-            self.app_data['last_currency_update'] = datetime.now()
+            with cls.request_lock:
+                cls.apply_rates(new_rates)
             logger.info("Курсы валют успешно обновлены")
             
         except Exception as e:
             logger.error(f"Ошибка при обновлении курсов валют: {e}")
     
+    @classmethod
+    def apply_rates(cls, new_rates: Dict[str, Tuple[int, int]]):
+        """
+        Применить загруженные курсы (вызывается под request_lock).
+        
+        Args:
+            new_rates: Код валюты -> (курс за номинал в единицах, номинал)
+        """
+        # Обновляем курсы в существующих объектах Currency: курс за
+        # номинал и номинал переносятся без деления и округления
+        changed = {}
+        for currency in cls.app_data['currencies']:
+            if currency.char_code in new_rates:
+                value_units, nominal = new_rates[currency.char_code]
+                if (value_units, nominal) != (currency.value_units, currency.nominal):
+                    changed[currency.char_code] = {
+                        'value': to_float(value_units),
+                        'nominal': nominal
+                    }
+                currency.value = to_float(value_units)
+                currency.nominal = nominal
+                currency.last_updated = datetime.now()
+        
+        cls.app_data['last_currency_update'] = datetime.now()
+        cls.render_cache.invalidate()
+        
+        # Клиентам отправляются только изменившиеся курсы
+        if changed:
+            cls.rate_events.publish('rates', {
+                'rates': changed,
+                'updated_at': cls.app_data['last_currency_update'].isoformat()
+            })
+    
     def generate_chart_data(self, currencies: List[Currency]) -> Dict[str, Any]:
         """
         Генерировать данные для графика динамики курсов.
@@ -880,65 +1128,32 @@ class CurrencyTrackerServer(BaseHTTPRequestHandler):
     
     def count_lines_of_code(self) -> int:
         """Подсчитать количество строк кода в проекте."""
-        total_lines = 0
-        
-        # Расширения файлов Python
-        python_extensions = ('.py',)
-        
-        # Директории для подсчета
-        directories = ['models', 'templates', 'static', 'utils', '.']
-        
-        for directory in directories:
-            if not os.path.exists(directory):
-                continue
-            
-            for root, dirs, files in os.walk(directory):
-                # Пропускаем служебные директории
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
-                
-                for file in files:
-                    filepath = os.path.join(root, file)
-                    
-                    # Считаем только Python файлы и HTML/JS/CSS
-                    if file.endswith(python_extensions) or file.endswith(('.html', '.js', '.css')):
-                        try:
-                            with open(filepath, 'r', encoding='utf-8') as f:
-                                lines = f.readlines()
-                                total_lines += len(lines)
-                        except:
-                            pass
-        
-        return total_lines
+        return count_lines_of_code()
     
     def count_project_files(self) -> int:
         """Подсчитать количество файлов в проекте."""
-        total_files = 0
-        
-        # Директории для подсчета
-        directories = ['models', 'templates', 'static', 'utils', '.']
-        
-        for directory in directories:
-            if not os.path.exists(directory):
-                continue
-            
-            for root, dirs, files in os.walk(directory):
-                # Пропускаем служебные директории
-                dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
-                
-                # Считаем только определенные типы файлов
-                for file in files:
-                    if file.endswith(('.py', '.html', '.js', '.css', '.txt', '.md')):
-                        total_files += 1
-        
-        return total_files
-
+        return count_project_files()
 
 def run_server():
     """Запустить сервер."""
     server_address = (config.SERVER_HOST, config.SERVER_PORT)
+    # Курсы обновляются на сервере, клиенты получают изменения через
+    # /api/rates/stream и сами страницу не перезагружают
+    rate_refresher = PeriodicTask(
+        CurrencyTrackerServer.update_currencies_from_api,
+        config.CURRENCY_UPDATE_INTERVAL.total_seconds(),
+        name='rate-refresher'
+    )
     
     try:
-        httpd = HTTPServer(server_address, CurrencyTrackerServer)
+        # Статика читается и сжимается один раз до приема запросов
+        CurrencyTrackerServer.init_templates()
+        CurrencyTrackerServer.init_static_assets()
+        CurrencyTrackerServer.project_stats.start()
+        rate_refresher.start()
+        # Каждое соединение обслуживается в своем потоке, чтобы потоки
+        # событий (/api/rates/stream) не блокировали остальные запросы
+        httpd = ThreadingHTTPServer(server_address, CurrencyTrackerServer)
         
         print("=" * 60)
         print(f"Сервер Currency Tracker запущен!")
@@ -953,6 +1168,7 @@ def run_server():
         print("  /currencies    - Курсы валют")
         print("  /author        - Информация об авторе")
         print("  /api/*         - API endpoints")
+        print("  /api/rates/stream - Поток изменений курсов (SSE)")
         print("=" * 60)
         print("Нажмите Ctrl+C для остановки сервера")
         print("=" * 60)
@@ -961,6 +1177,8 @@ def run_server():
         httpd.serve_forever()
         
     except KeyboardInterrupt:
+        rate_refresher.stop()
+        CurrencyTrackerServer.rate_events.close()
         print("\nСервер остановлен пользователем")
     except Exception as e:
         print(f"Ошибка при запуске сервера: {e}")
@@ -94,6 +94,34 @@ class TestServer(unittest.TestCase):
         written_data = json.loads(call_args.decode('utf-8'))
         self.assertEqual(written_data, test_data)
     
+    @patch('server.CurrencyTrackerServer.send_response')
+    @patch('server.CurrencyTrackerServer.send_header')
+    @patch('server.CurrencyTrackerServer.end_headers')
+    @patch('server.CurrencyTrackerServer.wfile')
+    def test_response_headers_not_echoed(self, mock_wfile, mock_end_headers, mock_send_header, mock_send_response):
+        """Тест: заголовки запроса не попадают в ответ (POST и 405)."""
+        self.server.headers = {
+            'Host': 'localhost:8080',
+            'Accept-Encoding': 'identity',
+            'Content-Type': 'application/json',
+            'Content-Length': '2',
+            'X-Secret': 'token'
+        }
+        
+        self.server.send_json_response(201, {'success': True})
+        sent = [call[0] for call in mock_send_header.call_args_list]
+        self.assertEqual([name for name, _ in sent].count('Content-Length'), 1)
+        self.assertNotIn('X-Secret', [name for name, _ in sent])
+        self.assertNotIn('Host', [name for name, _ in sent])
+        
+        mock_send_header.reset_mock()
+        with patch.object(self.server, 'get_error_template', return_value=None):
+            self.server.handle_405(['GET', 'POST'])
+        sent = [call[0] for call in mock_send_header.call_args_list]
+        mock_send_response.assert_called_with(405)
+        self.assertIn(('Allow', 'GET, POST'), sent)
+        self.assertNotIn('X-Secret', [name for name, _ in sent])
+    
     def test_generate_chart_data(self):
         """Тест генерации данных для графика."""
         # Создаем тестовые валюты
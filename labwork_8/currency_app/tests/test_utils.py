@@ -0,0 +1,521 @@
+"""
+Тесты для вспомогательных модулей приложения.
+"""
+
+import unittest
+import sys
+import os
+import gzip
+import tempfile
+import threading
+from io import BytesIO
+from unittest.mock import Mock, patch
+
+# Добавляем путь для импорта модулей
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.compression import (
+    parse_accept_encoding,
+    negotiate_encoding,
+    compress_response,
+    select_variant
+)
+from utils.static_assets import StaticAssetStore, IMMUTABLE_CACHE_CONTROL
+from utils.project_stats import ProjectStatsCache
+from utils.router import Router
+from utils.templates import create_environment, warm_up, resolve_template
+from utils.render_cache import RenderCache
+from utils.events import EventBroadcaster, PeriodicTask, format_event
+from utils.pagination import decode_cursor, encode_cursor, page_after, parse_fields, parse_limit
+from utils.fixed_point import (
+    Money,
+    divide_half_up,
+    exchange_many,
+    parse_scaled,
+    parse_scaled_many,
+    to_float,
+    unit_rate
+)
+from utils.currencies_api import calculate_exchange, get_currencies, get_rate_units, parse_snapshot
+
+
+class TestCompression(unittest.TestCase):
+    """Тесты для сжатия ответов."""
+
+    def test_parse_accept_encoding(self):
+        """Тест разбора заголовка Accept-Encoding."""
+        result = parse_accept_encoding('gzip, deflate;q=0.5, identity;q=0')
+        self.assertEqual(result['gzip'], 1.0)
+        self.assertEqual(result['deflate'], 0.5)
+        self.assertEqual(result['identity'], 0.0)
+        self.assertEqual(parse_accept_encoding(None), {})
+
+        result = parse_accept_encoding('br;foo=1;q=0, gzip; level=9 ; Q=0.3')
+        self.assertEqual(result, {'br': 0.0, 'gzip': 0.3})
+        self.assertIsNone(negotiate_encoding('gzip;foo=1;q=0'))
+
+    def test_negotiate_encoding(self):
+        """Тест выбора кодировки."""
+        self.assertEqual(negotiate_encoding('gzip, deflate'), 'gzip')
+        self.assertIsNone(negotiate_encoding('gzip;q=0'))
+        self.assertIsNone(negotiate_encoding('identity'))
+        self.assertIsNone(negotiate_encoding(''))
+
+    def test_compress_response_threshold(self):
+        """Тест: маленькие ответы не сжимаются."""
+        body, encoding = compress_response(b'{"success": true}', 'gzip', min_size=1024)
+        self.assertEqual(body, b'{"success": true}')
+        self.assertIsNone(encoding)
+
+    def test_compress_response_gzip(self):
+        """Тест сжатия большого ответа."""
+        data = b'<tr><td>USD</td></tr>' * 200
+        body, encoding = compress_response(data, 'gzip', min_size=1024)
+        self.assertEqual(encoding, 'gzip')
+        self.assertLess(len(body), len(data))
+        self.assertEqual(gzip.decompress(body), data)
+
+    def test_select_variant(self):
+        """Тест выбора заранее сжатого варианта."""
+        variants = {'identity': b'plain', 'gzip': b'compressed'}
+        self.assertEqual(select_variant(variants, 'gzip, br'), (b'compressed', 'gzip'))
+        self.assertEqual(select_variant(variants, None), (b'plain', None))
+        self.assertEqual(select_variant(variants, 'gzip;q=0'), (b'plain', None))
+
+    def test_encoding_quality_preference(self):
+        """Тест: выбирается кодировка с наибольшим весом q клиента."""
+        variants = {'identity': b'plain', 'gzip': b'gz', 'br': b'br'}
+        with patch('utils.compression.SUPPORTED_ENCODINGS', ('br', 'gzip')):
+            self.assertEqual(negotiate_encoding('gzip;q=1, br;q=0.5'), 'gzip')
+            self.assertEqual(negotiate_encoding('gzip, br'), 'br')
+            self.assertEqual(select_variant(variants, 'gzip;q=1, br;q=0.5'), (b'gz', 'gzip'))
+            self.assertEqual(select_variant(variants, 'gzip;q=0.5, br'), (b'br', 'br'))
+            self.assertEqual(select_variant(variants, 'gzip, br'), (b'br', 'br'))
+
+
+class TestStaticAssetStore(unittest.TestCase):
+    """Тесты для хранилища статических файлов."""
+
+    def setUp(self):
+        """Подготовка тестов."""
+        self.tmp = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.tmp.name, 'css'))
+        with open(os.path.join(self.tmp.name, 'css', 'style.css'), 'wb') as f:
+            f.write(b'body { color: red; }\n' * 100)
+        with open(os.path.join(self.tmp.name, 'big.png'), 'wb') as f:
+            f.write(b'\x89PNG' * 1000)
+
+        self.store = StaticAssetStore(self.tmp.name, memory_limit=3000)
+        self.store.load()
+
+        self.handler = Mock()
+        self.handler.headers = {}
+        self.handler.connection = None
+        self.written = BytesIO()
+        self.handler.wfile = self.written
+
+    def tearDown(self):
+        """Удаление временных файлов."""
+        self.tmp.cleanup()
+
+    def test_load_and_fingerprint(self):
+        """Тест загрузки и отпечатков файлов."""
+        asset, immutable = self.store.lookup('css/style.css')
+        self.assertFalse(immutable)
+        self.assertIn('gzip', asset.variants)
+
+        url = self.store.url_for('css/style.css')
+        self.assertEqual(url, f'/static/css/style.{asset.digest}.css')
+        self.assertEqual(self.store.lookup(url[len('/static/'):]), (asset, True))
+        self.assertIsNone(self.store.lookup('css/missing.css'))
+
+    def test_send_immutable(self):
+        """Тест отправки файла по адресу с отпечатком."""
+        asset, _ = self.store.lookup('css/style.css')
+        self.handler.headers = {'Accept-Encoding': 'gzip'}
+        self.store.send(self.handler, asset, True)
+
+        self.handler.send_response.assert_called_once_with(200)
+        self.handler.send_header.assert_any_call('Cache-Control', IMMUTABLE_CACHE_CONTROL)
+        self.handler.send_header.assert_any_call('Content-Encoding', 'gzip')
+        self.assertEqual(gzip.decompress(self.written.getvalue()), asset.variants['identity'])
+
+    def test_send_not_modified(self):
+        """Тест ответа 304 при совпадении ETag."""
+        asset, _ = self.store.lookup('css/style.css')
+        self.handler.headers = {'If-None-Match': asset.etag}
+        self.store.send(self.handler, asset, False)
+
+        self.handler.send_response.assert_called_once_with(304)
+        self.assertEqual(self.written.getvalue(), b'')
+
+    def test_send_large_file(self):
+        """Тест отправки большого файла без хранения в памяти."""
+        asset, _ = self.store.lookup('big.png')
+        self.assertFalse(asset.in_memory)
+        self.store.send(self.handler, asset, False)
+
+        self.assertEqual(self.written.getvalue(), b'\x89PNG' * 1000)
+
+
+
+class TestProjectStatsCache(unittest.TestCase):
+    """Тесты для кэша статистики проекта."""
+
+    def setUp(self):
+        """Подготовка тестов."""
+        self.tmp = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.tmp.name, 'main.py'), 'w') as f:
+            f.write('line1\nline2\n')
+        self.cache = ProjectStatsCache([self.tmp.name])
+
+    def tearDown(self):
+        """Удаление временных файлов."""
+        self.tmp.cleanup()
+
+    def test_get_is_cached(self):
+        """Тест: повторный вызов не обходит файлы."""
+        self.assertEqual(self.cache.get(), {'lines_of_code': 2, 'files_count': 1})
+
+        with patch('os.walk') as mock_walk:
+            self.assertEqual(self.cache.get()['lines_of_code'], 2)
+            mock_walk.assert_not_called()
+
+    def test_refresh_if_changed(self):
+        """Тест пересчета при изменении файлов."""
+        self.cache.get()
+        self.assertFalse(self.cache.refresh_if_changed())
+
+        with open(os.path.join(self.tmp.name, 'style.css'), 'w') as f:
+            f.write('body {}\n')
+
+        self.assertTrue(self.cache.refresh_if_changed())
+        self.assertEqual(self.cache.get(), {'lines_of_code': 3, 'files_count': 2})
+
+
+
+class TestRouter(unittest.TestCase):
+    """Тесты для таблицы маршрутов."""
+
+    def setUp(self):
+        """Подготовка тестов."""
+        self.router = Router.from_table([
+            ('GET', '/', 'index'),
+            ('GET', '/api/users', 'list_users'),
+            ('POST', '/api/users', 'create_user'),
+            ('GET', '/api/users/{id}', 'get_user'),
+            ('DELETE', '/api/users/{id}', 'delete_user'),
+            ('POST', '/api/users/{id}/subscribe', 'subscribe'),
+            ('GET', '/static/{path:path}', 'static'),
+        ])
+
+    def test_static_routes(self):
+        """Тест точных путей с таблицей методов."""
+        self.assertEqual(self.router.match('GET', '/').handler, 'index')
+        self.assertEqual(self.router.match('GET', '/api/users').handler, 'list_users')
+        self.assertEqual(self.router.match('POST', '/api/users').handler, 'create_user')
+        self.assertIsNone(self.router.match('PUT', '/api/users'))
+
+    def test_path_params(self):
+        """Тест параметров пути."""
+        match = self.router.match('POST', '/api/users/42/subscribe')
+        self.assertEqual(match.handler, 'subscribe')
+        self.assertEqual(match.params, {'id': '42'})
+
+        match = self.router.match('DELETE', '/api/users/7')
+        self.assertEqual(match, ('delete_user', {'id': '7'}))
+        self.assertIsNone(self.router.match('GET', '/api/users/42/subscribe'))
+
+    def test_rest_of_path(self):
+        """Тест параметра-остатка пути."""
+        match = self.router.match('GET', '/static/css/style.css')
+        self.assertEqual(match.params, {'path': 'css/style.css'})
+        self.assertIsNone(self.router.match('GET', '/missing'))
+
+    def test_allowed_methods(self):
+        """Тест методов известного пути (для ответа 405)."""
+        self.assertEqual(self.router.allowed_methods('/api/users'), ['GET', 'POST'])
+        self.assertEqual(self.router.allowed_methods('/api/users/42'), ['DELETE', 'GET'])
+        self.assertEqual(self.router.allowed_methods('/api/users/42/subscribe'), ['POST'])
+        self.assertEqual(self.router.allowed_methods('/static/css/style.css'), ['GET'])
+        self.assertEqual(self.router.allowed_methods('/missing'), [])
+
+    def test_invalid_routes(self):
+        """Тест некорректных шаблонов."""
+        with self.assertRaises(ValueError):
+            self.router.add('GET', '/api/users', 'duplicate')
+        with self.assertRaises(ValueError):
+            self.router.add('GET', '/api/users/{user_id}/orders', 'conflict')
+        with self.assertRaises(ValueError):
+            self.router.add('GET', '/files/{path:path}/meta', 'not_last')
+
+
+class TestTemplates(unittest.TestCase):
+    """Тесты для настройки шаблонизатора."""
+
+    def setUp(self):
+        """Подготовка тестов."""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.template_dir = os.path.join(self.tmp.name, 'templates')
+        self.cache_dir = os.path.join(self.tmp.name, 'cache')
+        os.makedirs(self.template_dir)
+        for name in ('base.html', 'index.html'):
+            with open(os.path.join(self.template_dir, name), 'w') as f:
+                f.write('<p>{{ value }}</p>')
+
+    def tearDown(self):
+        """Удаление временных файлов."""
+        self.tmp.cleanup()
+
+    def test_warm_up_fills_bytecode_cache(self):
+        """Тест: все шаблоны компилируются при старте и сохраняются на диск."""
+        env = create_environment(self.template_dir, self.cache_dir, auto_reload=False)
+        self.assertEqual(warm_up(env), 2)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 2)
+
+        # Новое окружение берет байт-код из кэша
+        env = create_environment(self.template_dir, self.cache_dir, auto_reload=False)
+        self.assertEqual(env.get_template('index.html').render(value=1), '<p>1</p>')
+
+    def test_resolve_template(self):
+        """Тест поиска необязательного шаблона."""
+        env = create_environment(self.template_dir)
+        self.assertIsNotNone(resolve_template(env, 'base.html'))
+        self.assertIsNone(resolve_template(env, 'error.html'))
+
+
+class TestRenderCache(unittest.TestCase):
+    """Тесты для кэша отрендеренного HTML."""
+
+    def setUp(self):
+        """Подготовка тестов."""
+        self.cache = RenderCache(max_entries=2)
+        self.render = Mock(return_value='<p>html</p>')
+
+    def test_get_or_render(self):
+        """Тест: повторный запрос берется из кэша."""
+        self.assertEqual(self.cache.get_or_render(('page', 1), self.render), '<p>html</p>')
+        self.assertEqual(self.cache.get_or_render(('page', 1), self.render), '<p>html</p>')
+        self.cache.get_or_render(('page', 2), self.render)
+
+        self.assertEqual(self.render.call_count, 2)
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+
+    def test_invalidate(self):
+        """Тест сброса кэша при изменении данных."""
+        self.cache.get_or_render('page', self.render)
+        self.cache.invalidate()
+        self.cache.get_or_render('page', self.render)
+
+        self.assertEqual(self.render.call_count, 2)
+        self.assertEqual(self.cache.get_stats()['version'], 1)
+
+    def test_stale_render_not_stored(self):
+        """Тест: результат рендеринга во время изменения данных не сохраняется."""
+        def render():
+            self.cache.invalidate()
+            return 'stale'
+
+        self.assertEqual(self.cache.get_or_render('page', render), 'stale')
+        self.assertEqual(self.cache.get_or_render('page', self.render), '<p>html</p>')
+
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованных записей."""
+        for key in ('a', 'b', 'a', 'c'):
+            self.cache.get_or_render(key, self.render)
+        self.cache.get_or_render('a', self.render)
+
+        self.assertEqual(self.render.call_count, 3)
+        self.assertEqual(self.cache.get_stats()['entries'], 2)
+
+
+class TestEventBroadcaster(unittest.TestCase):
+    """Тесты для рассылки Server-Sent Events."""
+
+    def setUp(self):
+        """Подготовка тестов."""
+        self.broadcaster = EventBroadcaster(max_queue_size=1)
+
+    def test_format_event(self):
+        """Тест формата сообщения text/event-stream."""
+        message = format_event('rates', {'USD': 90.5}, 3)
+        self.assertEqual(message, b'id: 3\nevent: rates\ndata: {"USD": 90.5}\n\n')
+
+    def test_publish(self):
+        """Тест доставки событий подписчикам."""
+        subscriber = self.broadcaster.subscribe()
+        self.assertEqual(self.broadcaster.publish('rates', {}), 1)
+        self.assertIn(b'event: rates', subscriber.get_nowait())
+
+        # Очередь клиента переполнена - событие для него отбрасывается
+        self.broadcaster.publish('rates', {})
+        self.assertEqual(self.broadcaster.publish('rates', {}), 0)
+
+        self.broadcaster.unsubscribe(subscriber)
+        self.assertEqual(self.broadcaster.subscriber_count, 0)
+
+    def test_stream(self):
+        """Тест потока событий до остановки сервера."""
+        self.broadcaster = EventBroadcaster()
+        handler = Mock()
+        handler.wfile = BytesIO()
+
+        def write_then_close(data):
+            BytesIO.write(handler.wfile, data)
+            if b'retry' in data:
+                self.broadcaster.publish('rates', {'USD': 1})
+                self.broadcaster.close()
+
+        handler.wfile.write = write_then_close
+        self.broadcaster.stream(handler, keepalive_interval=1)
+
+        handler.send_header.assert_any_call('Content-Type', 'text/event-stream; charset=utf-8')
+        self.assertIn(b'data: {"USD": 1}', handler.wfile.getvalue())
+        self.assertEqual(self.broadcaster.subscriber_count, 0)
+
+    def test_periodic_task(self):
+        """Тест фонового обновления: вызовы повторяются, ошибки не останавливают поток."""
+        calls = []
+        done = threading.Event()
+
+        def refresh():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("API недоступен")
+            done.set()
+
+        task = PeriodicTask(refresh, 0.01, name='test-refresher')
+        task.start()
+        self.assertTrue(done.wait(2))
+        task.stop()
+        self.assertGreaterEqual(len(calls), 2)
+
+
+class TestPagination(unittest.TestCase):
+    """Тесты для постраничной выдачи."""
+
+    def test_cursor_roundtrip(self):
+        """Тест кодирования курсора."""
+        for key in (42, 'R01235'):
+            self.assertEqual(decode_cursor(encode_cursor(key)), key)
+        self.assertIsNone(decode_cursor(None))
+        with self.assertRaises(ValueError):
+            decode_cursor('не-курсор')
+
+    def test_parse_params(self):
+        """Тест разбора limit и fields."""
+        self.assertEqual(parse_limit(None, default=10), 10)
+        self.assertEqual(parse_limit('1000', maximum=500), 500)
+        with self.assertRaises(ValueError):
+            parse_limit('0')
+        with self.assertRaisesRegex(ValueError, '^limit должен быть положительным числом$'):
+            parse_limit('abc')
+
+        self.assertEqual(parse_fields('id, name,id', ('id', 'name')), ('id', 'name'))
+        self.assertIsNone(parse_fields('', ('id',)))
+        with self.assertRaises(ValueError):
+            parse_fields('password', ('id',))
+
+    def test_page_after(self):
+        """Тест выбора страниц по ключу."""
+        items = list(range(1, 11))
+
+        page, next_key = page_after(items, lambda x: x, None, 4)
+        self.assertEqual((page, next_key), ([1, 2, 3, 4], 4))
+
+        page, next_key = page_after(items, lambda x: x, 8, 4)
+        self.assertEqual((page, next_key), ([9, 10], None))
+
+        page, next_key = page_after(items, lambda x: x, 2, 2, lambda x: x % 2 == 0)
+        self.assertEqual((page, next_key), ([4, 6], 6))
+
+
+
+class TestFixedPoint(unittest.TestCase):
+    """Тесты для чисел с фиксированной точкой и разбора ответа API."""
+
+    def test_parse_scaled(self):
+        """Тест точного разбора чисел и строк."""
+        self.assertEqual(parse_scaled(93.25), 932500)
+        self.assertEqual(parse_scaled('93,2500'), 932500)
+        self.assertEqual(parse_scaled(100), 1000000)
+        self.assertEqual(parse_scaled(0.1 + 0.2), 3000)
+        self.assertEqual(parse_scaled('0.00005'), 1)
+        self.assertEqual(parse_scaled('-1.23455'), -12346)
+        self.assertEqual(parse_scaled(1e-05), 0)
+        self.assertEqual(parse_scaled_many([1.5, '2,25', 3]), [15000, 22500, 30000])
+        with self.assertRaises(ValueError):
+            parse_scaled('abc')
+        with self.assertRaises(TypeError):
+            parse_scaled(None)
+
+    def test_divide_half_up(self):
+        """Тест деления на номинал с округлением половины вверх."""
+        self.assertEqual(divide_half_up(6325, 100), 63)
+        self.assertEqual(divide_half_up(6350, 100), 64)
+        self.assertEqual(divide_half_up(-6350, 100), -64)
+        self.assertEqual(to_float(divide_half_up(parse_scaled(63.25), 100)), 0.6325)
+
+    def test_money(self):
+        """Тест арифметики и сравнения Money."""
+        usd = Money.from_value('93,25')
+        eur = Money.from_value(101.7)
+
+        self.assertEqual(str(usd), '93.2500')
+        self.assertEqual(str(-Money(5)), '-0.0005')
+        self.assertEqual(usd + eur, Money.from_value('194.95'))
+        self.assertEqual(3 * usd, Money(2797500))
+        self.assertLess(usd, eur)
+        self.assertEqual(float(Money.from_value(63.25).per_unit(100)), 0.6325)
+        self.assertEqual(str(Money.from_value(100).exchange(usd, eur)), '91.6912')
+        self.assertEqual(exchange_many([1000000, -1000000], usd.units, eur.units), [916912, -916912])
+        with self.assertRaises(TypeError):
+            Money(1.5)
+
+    @patch('utils.currencies_api.requests.get')
+    def test_get_currencies_large_nominal(self, mock_get):
+        """Тест: курс за единицу при большом номинале не округляется до 4 знаков."""
+        mock_get.return_value.json.return_value = {'Valute': {
+            'VND': {'CharCode': 'VND', 'Name': 'Донгов', 'Nominal': 10000, 'Value': 36.4812},
+            'USD': {'CharCode': 'USD', 'Name': 'Доллар США', 'Nominal': 1, 'Value': 93.25},
+        }}
+
+        self.assertEqual(get_rate_units(['VND']), {'VND': (364812, 10000)})
+        self.assertEqual(get_currencies(), {'VND': 0.00364812, 'USD': 93.25})
+        self.assertEqual(unit_rate(651234, 1000), 0.0651234)
+
+    @patch('utils.currencies_api.get_rate_units')
+    def test_calculate_exchange(self, mock_get_rate_units):
+        """Тест точного расчета обмена по курсам за номинал."""
+        rates = {'USD': (932500, 1), 'EUR': (1017000, 1), 'VND': (364812, 10000)}
+        mock_get_rate_units.side_effect = lambda codes, url: {c: rates[c] for c in codes}
+
+        self.assertEqual(calculate_exchange(100, 'USD'), 9325.0)
+        self.assertAlmostEqual(calculate_exchange(100, 'USD', 'EUR'), 100 * 93.25 / 101.7, places=12)
+        self.assertEqual(calculate_exchange(9325, 'RUB', 'USD'), 100.0)
+        self.assertEqual(calculate_exchange(5, 'RUB', 'RUB'), 5)
+        # Большой номинал и малые суммы не теряются при округлении
+        self.assertEqual(calculate_exchange(1000000, 'VND'), 3648.12)
+        self.assertAlmostEqual(calculate_exchange(0.01, 'VND', 'USD'), 0.01 * 0.00364812 / 93.25, places=15)
+        self.assertGreater(calculate_exchange(0.01, 'VND', 'USD'), 0)
+
+    def test_parse_snapshot(self):
+        """Тест разбора всего ответа API с одной отметкой времени."""
+        data = {'Valute': {
+            'USD': {'ID': 'R01235', 'NumCode': '840', 'CharCode': 'USD', 'Nominal': 1,
+                    'Name': 'Доллар США', 'Value': 93.25, 'Previous': 92.9},
+            'JPY': {'ID': 'R01820', 'NumCode': '392', 'CharCode': 'JPY', 'Nominal': 100,
+                    'Name': 'Японских иен', 'Value': '63,2575', 'Previous': 63.1},
+            'BAD': {'CharCode': 'BAD', 'Nominal': 1, 'Value': 'нет данных'},
+        }}
+
+        records = parse_snapshot(data, timestamp='2024-01-01T00:00:00')
+
+        self.assertEqual([r['char_code'] for r in records], ['USD', 'JPY'])
+        self.assertEqual(records[0]['value_units'], 932500)
+        self.assertEqual(records[0]['previous_units'], 929000)
+        self.assertEqual(records[1]['rate'], 0.632575)
+        self.assertEqual({r['timestamp'] for r in records}, {'2024-01-01T00:00:00'})
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
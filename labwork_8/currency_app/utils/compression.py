@@ -0,0 +1,173 @@
+"""
+Модуль сжатия HTTP-ответов.
+
+Содержит согласование кодировки по заголовку Accept-Encoding, сжатие
+динамических ответов (gzip, а при наличии пакета brotli - br) и
+выбор заранее сжатого варианта статического файла.
+"""
+
+import gzip
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # brotli - необязательная зависимость
+    brotli = None
+
+
+# Кодировки в порядке предпочтения сервера
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# Типы содержимого, которые имеет смысл сжимать
+COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.html', '.json', '.svg', '.txt')
+
+
+def parse_accept_encoding(header: Optional[str]) -> Dict[str, float]:
+    """
+    Разобрать заголовок Accept-Encoding.
+
+    Args:
+        header: Значение заголовка, например 'gzip, deflate;q=0.5, br'
+
+    Returns:
+        Словарь {кодировка: вес q}
+    """
+    result = {}
+    if not header:
+        return result
+
+    for part in header.split(','):
+        part = part.strip()
+        if not part:
+            continue
+
+        name, *params = part.split(';')
+        quality = 1.0
+        # q может идти после других параметров: 'br;foo=1;q=0'
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+
+        result[name.strip().lower()] = quality
+
+    return result
+
+
+def negotiate_encoding(header: Optional[str]) -> Optional[str]:
+    """
+    Выбрать кодировку ответа по заголовку Accept-Encoding.
+
+    Args:
+        header: Значение заголовка Accept-Encoding
+
+    Returns:
+        'br', 'gzip' или None, если клиент не поддерживает сжатие
+    """
+    return _best_encoding(parse_accept_encoding(header), SUPPORTED_ENCODINGS)
+
+
+def _best_encoding(accepted: Dict[str, float], encodings: Iterable[str]) -> Optional[str]:
+    """
+    Выбрать кодировку с наибольшим весом q среди доступных.
+
+    При равных весах побеждает кодировка, идущая раньше в encodings
+    (порядок предпочтения сервера).
+
+    Args:
+        accepted: Результат parse_accept_encoding
+        encodings: Доступные кодировки в порядке предпочтения сервера
+
+    Returns:
+        Кодировка или None, если ни одна не принимается клиентом
+    """
+    wildcard = accepted.get('*', 0.0)
+    best, best_quality = None, 0.0
+
+    for encoding in encodings:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def compress(data: bytes, encoding: str, level: int = 6) -> bytes:
+    """
+    Сжать данные указанным алгоритмом.
+
+    Args:
+        data: Исходные данные
+        encoding: 'gzip' или 'br'
+        level: Уровень сжатия (1-9 для gzip)
+
+    Returns:
+        Сжатые данные
+
+    Raises:
+        ValueError: Если кодировка не поддерживается
+    """
+    if encoding == 'gzip':
+        # mtime=0 делает результат детерминированным (удобно для ETag)
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == 'br' and brotli is not None:
+        return brotli.compress(data, quality=min(max(level, 0), 11))
+    raise ValueError(f"Неподдерживаемая кодировка: {encoding}")
+
+
+def compress_response(
+    data: bytes,
+    accept_encoding: Optional[str],
+    min_size: int = 1024,
+    level: int = 6
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Сжать динамический ответ, если это выгодно и поддерживается клиентом.
+
+    Args:
+        data: Тело ответа
+        accept_encoding: Значение заголовка Accept-Encoding запроса
+        min_size: Минимальный размер тела для сжатия в байтах
+        level: Уровень сжатия
+
+    Returns:
+        Кортеж (тело ответа, кодировка или None)
+    """
+    if len(data) < min_size:
+        return data, None
+
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None:
+        return data, None
+
+    compressed = compress(data, encoding, level)
+    if len(compressed) >= len(data):
+        return data, None
+
+    return compressed, encoding
+
+
+def select_variant(
+    variants: Dict[str, bytes],
+    accept_encoding: Optional[str]
+) -> Tuple[bytes, Optional[str]]:
+    """
+    Выбрать заранее сжатый вариант файла для клиента.
+
+    Args:
+        variants: Варианты файла {кодировка: байты}, исходное содержимое под ключом 'identity'
+        accept_encoding: Значение заголовка Accept-Encoding запроса
+
+    Returns:
+        Кортеж (содержимое, кодировка или None)
+    """
+    available = [encoding for encoding in SUPPORTED_ENCODINGS if encoding in variants]
+    encoding = _best_encoding(parse_accept_encoding(accept_encoding), available)
+    if encoding is None:
+        return variants['identity'], None
+
+    return variants[encoding], encoding
+
@@ -0,0 +1,202 @@
+"""
+Модуль рассылки событий через Server-Sent Events (SSE).
+
+Клиент держит одно долгоживущее соединение (EventSource), а сервер
+отправляет в него только изменившиеся курсы валют вместо того, чтобы
+клиент периодически перезагружал страницу целиком.
+"""
+
+import json
+import logging
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def format_event(event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    """
+    Сформировать сообщение в формате text/event-stream.
+
+    Args:
+        event: Тип события
+        data: Данные события (сериализуются в JSON)
+        event_id: Идентификатор события
+
+    Returns:
+        Закодированное сообщение
+    """
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False)}")
+    return ("\n".join(lines) + "\n\n").encode('utf-8')
+
+
+class EventBroadcaster:
+    """Рассылка событий всем подключенным клиентам."""
+
+    def __init__(self, max_queue_size: int = 100):
+        """
+        Инициализация рассыльщика.
+
+        Args:
+            max_queue_size: Размер очереди клиента; события для клиента,
+                            который не успевает их читать, отбрасываются
+        """
+        self.max_queue_size = max_queue_size
+        self._subscribers: List[queue.Queue] = []
+        self._lock = threading.Lock()
+        self._last_id = 0
+
+    @property
+    def subscriber_count(self) -> int:
+        """Получить количество подключенных клиентов."""
+        with self._lock:
+            return len(self._subscribers)
+
+    def subscribe(self) -> queue.Queue:
+        """
+        Подписать нового клиента.
+
+        Returns:
+            Очередь сообщений клиента
+        """
+        subscriber = queue.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: queue.Queue) -> None:
+        """
+        Отписать клиента.
+
+        Args:
+            subscriber: Очередь сообщений клиента
+        """
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, event: str, data: Any) -> int:
+        """
+        Отправить событие всем клиентам.
+
+        Args:
+            event: Тип события
+            data: Данные события
+
+        Returns:
+            Количество клиентов, получивших событие
+        """
+        with self._lock:
+            self._last_id += 1
+            message = format_event(event, data, self._last_id)
+            subscribers = list(self._subscribers)
+
+        delivered = 0
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+                delivered += 1
+            except queue.Full:
+                pass
+        return delivered
+
+    def close(self) -> None:
+        """Завершить все потоки событий (при остановке сервера)."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(None)
+            except queue.Full:
+                pass
+
+    def stream(self, handler, keepalive_interval: float = 15.0, retry_ms: int = 5000) -> None:
+        """
+        Отдать клиенту поток событий до разрыва соединения.
+
+        Args:
+            handler: Обработчик запроса (BaseHTTPRequestHandler)
+            keepalive_interval: Период отправки комментария для поддержания соединения
+            retry_ms: Задержка переподключения клиента в миллисекундах
+        """
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        handler.send_header('Cache-Control', 'no-cache')
+        handler.send_header('X-Accel-Buffering', 'no')
+        handler.end_headers()
+        handler.close_connection = True
+
+        subscriber = self.subscribe()
+        try:
+            handler.wfile.write(f"retry: {retry_ms}\n\n".encode('utf-8'))
+            handler.wfile.flush()
+
+            while True:
+                try:
+                    message = subscriber.get(timeout=keepalive_interval)
+                except queue.Empty:
+                    message = b": keepalive\n\n"
+                if message is None:
+                    break
+                handler.wfile.write(message)
+                handler.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, OSError):
+            # Клиент закрыл соединение
+            pass
+        finally:
+            self.unsubscribe(subscriber)
+
+
+class PeriodicTask:
+    """
+    Фоновый поток, вызывающий функцию с заданным периодом.
+
+    Используется для обновления курсов с сервера: клиенты с EventSource
+    не перезагружают страницу и получают изменения только через события,
+    которые публикует обновление.
+    """
+
+    def __init__(self, func: Callable[[], Any], interval: float, name: str = 'periodic-task'):
+        """
+        Инициализация задачи.
+
+        Args:
+            func: Вызываемая функция без аргументов
+            interval: Период в секундах (первый вызов - через interval)
+            name: Имя потока
+        """
+        self.func = func
+        self.interval = interval
+        self.name = name
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Запустить фоновый поток (повторный вызов ничего не делает)."""
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Остановить фоновый поток."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Вызывать функцию до остановки; ошибки не прерывают поток."""
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.func()
+            except Exception as e:
+                logger.error(f"Ошибка фоновой задачи {self.name}: {e}")
@@ -0,0 +1,349 @@
+"""
+Модуль чисел с фиксированной точкой.
+
+Курсы валют хранятся как целые числа в десятитысячных долях рубля
+(4 знака после запятой, как в данных ЦБ РФ): 93.2500 -> 932500. Целые
+числа точны, сравниваются и складываются быстрее Decimal и не требуют
+округления после каждой операции.
+
+Класс Money - неизменяемая обертка над таким целым для курсов и сумм;
+функции *_many выполняют те же операции над списками целых без
+создания объектов.
+"""
+
+from decimal import Decimal, ROUND_HALF_UP
+from functools import total_ordering
+from typing import Any, Iterable, List, Sequence, Union
+
+
+# Количество знаков после запятой и масштаб курсов
+RATE_DIGITS = 4
+RATE_SCALE = 10 ** RATE_DIGITS
+
+
+def _parse_text(text: str, digits: int) -> int:
+    """
+    Разобрать десятичную запись числа в целое с масштабом 10 ** digits.
+
+    Лишние знаки после запятой округляются половиной вверх (от нуля).
+
+    Args:
+        text: Десятичная запись числа (точка или запятая как разделитель)
+        digits: Количество знаков после запятой
+
+    Returns:
+        Масштабированное целое число
+
+    Raises:
+        ValueError: Если строка не является числом
+    """
+    text = text.strip().replace(',', '.')
+    if 'e' in text or 'E' in text:
+        # Экспоненциальная запись встречается только у очень малых или
+        # очень больших чисел - такие значения разбираются через Decimal
+        quantized = Decimal(text).scaleb(digits).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+        return int(quantized)
+
+    negative = text.startswith('-')
+    whole, _, fraction = text.lstrip('+-').partition('.')
+    if not (whole or fraction) or not (whole + fraction).isdigit():
+        raise ValueError(f"Некорректное число: {text!r}")
+
+    units = int((whole or '0') + fraction[:digits].ljust(digits, '0'))
+    if len(fraction) > digits and fraction[digits] >= '5':
+        units += 1
+    return -units if negative else units
+
+
+def parse_scaled(value: Any, digits: int = RATE_DIGITS) -> int:
+    """
+    Преобразовать число или строку в целое с масштабом 10 ** digits.
+
+    Для float сначала пробуется быстрый путь: если число без потерь
+    представимо с digits знаками, результат берется из round(value * scale).
+    Иначе используется точный разбор десятичной записи числа.
+
+    Args:
+        value: Число (int, float) или строка ("93,25" или "93.25")
+        digits: Количество знаков после запятой
+
+    Returns:
+        Масштабированное целое число
+
+    Raises:
+        ValueError: Если строка не является числом
+        TypeError: Если значение имеет неподдерживаемый тип
+    """
+    if isinstance(value, bool):
+        raise TypeError(f"Неподдерживаемый тип числа: {type(value).__name__}")
+    scale = 10 ** digits
+    if isinstance(value, int):
+        return value * scale
+    if isinstance(value, float):
+        units = round(value * scale)
+        if units / scale == value:
+            return units
+        return _parse_text(repr(value), digits)
+    if isinstance(value, str):
+        return _parse_text(value, digits)
+    raise TypeError(f"Неподдерживаемый тип числа: {type(value).__name__}")
+
+
+def parse_scaled_many(values: Iterable[Any], digits: int = RATE_DIGITS) -> List[int]:
+    """
+    Преобразовать последовательность значений в масштабированные целые.
+
+    Args:
+        values: Числа или строки
+        digits: Количество знаков после запятой
+
+    Returns:
+        Список масштабированных целых чисел
+
+    Raises:
+        ValueError: Если строка не является числом
+        TypeError: Если значение имеет неподдерживаемый тип
+    """
+    scale = 10 ** digits
+    result = []
+    append = result.append
+    for value in values:
+        if type(value) is float:
+            units = round(value * scale)
+            if units / scale == value:
+                append(units)
+                continue
+        append(parse_scaled(value, digits))
+    return result
+
+
+def divide_half_up(units: int, divisor: int) -> int:
+    """
+    Разделить масштабированное число на целое с округлением половины вверх.
+
+    Args:
+        units: Масштабированное целое число
+        divisor: Положительный целый делитель (например, номинал валюты)
+
+    Returns:
+        Частное, округленное до целого (половина - от нуля)
+
+    Raises:
+        ZeroDivisionError: Если делитель равен нулю
+    """
+    if divisor == 1:
+        return units
+    quotient = (abs(units) * 2 + divisor) // (divisor * 2)
+    return quotient if units >= 0 else -quotient
+
+
+def to_float(units: int, digits: int = RATE_DIGITS) -> float:
+    """
+    Преобразовать масштабированное целое в float (для вывода и JSON).
+
+    Args:
+        units: Масштабированное целое число
+        digits: Количество знаков после запятой
+
+    Returns:
+        Ближайшее к точному значению число float
+    """
+    return units / 10 ** digits
+
+
+def unit_rate(units: int, nominal: int, digits: int = RATE_DIGITS) -> float:
+    """
+    Получить курс за единицу валюты из курса за номинал.
+
+    Частное не округляется до digits знаков: у валют с большим номиналом
+    (VND 36.4812 за 10000) это дало бы ошибку в процентах. Точное частное
+    целых чисел округляется только при преобразовании во float.
+
+    Args:
+        units: Курс за номинал (масштабированное целое)
+        nominal: Номинал
+        digits: Количество знаков после запятой в units
+
+    Returns:
+        Курс за единицу валюты
+    """
+    return units / (nominal * 10 ** digits)
+
+
+def exchange_units(amount: int, from_rate: int, to_rate: int = RATE_SCALE) -> int:
+    """
+    Пересчитать сумму по курсам двух валют к рублю.
+
+    Все значения - целые с масштабом RATE_SCALE; результат округляется
+    до 4 знаков половиной вверх один раз, в конце расчета.
+
+    Args:
+        amount: Сумма в исходной валюте
+        from_rate: Курс исходной валюты за единицу (RATE_SCALE для рубля)
+        to_rate: Курс целевой валюты за единицу (RATE_SCALE для рубля)
+
+    Returns:
+        Сумма в целевой валюте
+
+    Raises:
+        ZeroDivisionError: Если курс целевой валюты равен нулю
+    """
+    return divide_half_up(amount * from_rate, to_rate)
+
+
+def exchange_many(amounts: Sequence[int], from_rate: int, to_rate: int = RATE_SCALE) -> List[int]:
+    """
+    Пересчитать список сумм по одной паре курсов.
+
+    Args:
+        amounts: Суммы в исходной валюте (целые с масштабом RATE_SCALE)
+        from_rate: Курс исходной валюты за единицу
+        to_rate: Курс целевой валюты за единицу
+
+    Returns:
+        Суммы в целевой валюте
+
+    Raises:
+        ZeroDivisionError: Если курс целевой валюты равен нулю
+    """
+    if to_rate <= 0:
+        raise ZeroDivisionError("Курс целевой валюты должен быть положительным")
+    double = to_rate * 2
+    result = []
+    append = result.append
+    for amount in amounts:
+        if amount >= 0:
+            append((amount * from_rate * 2 + to_rate) // double)
+        else:
+            append(-((-amount * from_rate * 2 + to_rate) // double))
+    return result
+
+
+# Создание Money без проверки в __init__ для результатов арифметики
+_new_money = object.__new__
+
+
+@total_ordering
+class Money:
+    """Сумма или курс с фиксированной точкой (RATE_DIGITS знаков)."""
+
+    __slots__ = ('units',)
+
+    def __init__(self, units: int):
+        """
+        Инициализация суммы.
+
+        Args:
+            units: Значение в десятитысячных долях (целое)
+
+        Raises:
+            TypeError: Если units не целое число
+        """
+        if type(units) is not int:
+            raise TypeError("Значение Money задается целым числом единиц")
+        self.units = units
+
+    @classmethod
+    def from_value(cls, value: Union['Money', int, float, str]) -> 'Money':
+        """
+        Создать сумму из числа или строки.
+
+        Args:
+            value: Money, число или строка ("93,25")
+
+        Returns:
+            Сумма с фиксированной точкой
+
+        Raises:
+            ValueError: Если строка не является числом
+            TypeError: Если значение имеет неподдерживаемый тип
+        """
+        if isinstance(value, Money):
+            return value
+        return cls(parse_scaled(value))
+
+    def per_unit(self, nominal: int) -> 'Money':
+        """
+        Получить курс за единицу валюты из курса за номинал.
+
+        Args:
+            nominal: Номинал
+
+        Returns:
+            Курс за единицу
+        """
+        return Money(divide_half_up(self.units, nominal))
+
+    def exchange(self, from_rate: 'Money', to_rate: 'Money' = None) -> 'Money':
+        """
+        Пересчитать сумму по курсам двух валют к рублю.
+
+        Args:
+            from_rate: Курс исходной валюты за единицу
+            to_rate: Курс целевой валюты за единицу (None - рубль)
+
+        Returns:
+            Сумма в целевой валюте
+        """
+        to_units = to_rate.units if to_rate is not None else RATE_SCALE
+        product = self.units * from_rate.units
+        result = _new_money(Money)
+        if product >= 0:
+            result.units = (product * 2 + to_units) // (to_units * 2)
+        else:
+            result.units = -((-product * 2 + to_units) // (to_units * 2))
+        return result
+
+    def __add__(self, other: 'Money') -> 'Money':
+        """Сложить суммы."""
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.units + other.units)
+
+    def __sub__(self, other: 'Money') -> 'Money':
+        """Вычесть сумму."""
+        if not isinstance(other, Money):
+            return NotImplemented
+        return Money(self.units - other.units)
+
+    def __mul__(self, factor: int) -> 'Money':
+        """Умножить сумму на целое число."""
+        if type(factor) is not int:
+            return NotImplemented
+        return Money(self.units * factor)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> 'Money':
+        """Сменить знак суммы."""
+        return Money(-self.units)
+
+    def __eq__(self, other: Any) -> bool:
+        """Сравнить суммы на равенство."""
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.units == other.units
+
+    def __lt__(self, other: 'Money') -> bool:
+        """Сравнить суммы."""
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.units < other.units
+
+    def __hash__(self) -> int:
+        """Хэш суммы."""
+        return hash(self.units)
+
+    def __float__(self) -> float:
+        """Преобразовать в float (для вывода и JSON)."""
+        return to_float(self.units)
+
+    def __str__(self) -> str:
+        """Точная десятичная запись ("93.2500")."""
+        sign = '-' if self.units < 0 else ''
+        whole, fraction = divmod(abs(self.units), RATE_SCALE)
+        return f"{sign}{whole}.{fraction:0{RATE_DIGITS}d}"
+
+    def __repr__(self) -> str:
+        """Строковое представление объекта."""
+        return f"Money('{self}')"
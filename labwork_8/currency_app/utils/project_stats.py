@@ -0,0 +1,210 @@
+"""
+Модуль статистики проекта для страницы об авторе.
+
+Подсчет строк кода и файлов требует обхода всего проекта, поэтому
+результат вычисляется один раз и хранится в памяти. Фоновый поток
+отслеживает изменения файлов (через inotify, если установлен пакет
+inotify_simple, иначе сравнением снимков mtime) и пересчитывает
+статистику только при изменениях.
+"""
+
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import inotify_simple
+except ImportError:  # inotify_simple - необязательная зависимость
+    inotify_simple = None
+
+
+# Директории для подсчета
+PROJECT_DIRECTORIES = ['models', 'templates', 'static', 'utils', '.']
+
+# Файлы, строки которых считаются кодом
+CODE_EXTENSIONS = ('.py', '.html', '.js', '.css')
+
+# Файлы, которые считаются файлами проекта
+PROJECT_FILE_EXTENSIONS = ('.py', '.html', '.js', '.css', '.txt', '.md')
+
+
+def _walk_project(directories: List[str]):
+    """Обойти директории проекта, пропуская служебные."""
+    for directory in directories:
+        if not os.path.exists(directory):
+            continue
+
+        for root, dirs, files in os.walk(directory):
+            # Пропускаем служебные директории
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d != '__pycache__']
+            yield root, files
+
+
+def count_lines_of_code(directories: List[str] = PROJECT_DIRECTORIES) -> int:
+    """
+    Подсчитать количество строк кода в проекте.
+
+    Args:
+        directories: Директории для подсчета
+
+    Returns:
+        Количество строк в файлах .py, .html, .js и .css
+    """
+    total_lines = 0
+
+    for root, files in _walk_project(directories):
+        for file in files:
+            if file.endswith(CODE_EXTENSIONS):
+                try:
+                    with open(os.path.join(root, file), 'r', encoding='utf-8') as f:
+                        total_lines += len(f.readlines())
+                except (OSError, UnicodeDecodeError):
+                    pass
+
+    return total_lines
+
+
+def count_project_files(directories: List[str] = PROJECT_DIRECTORIES) -> int:
+    """
+    Подсчитать количество файлов в проекте.
+
+    Args:
+        directories: Директории для подсчета
+
+    Returns:
+        Количество файлов проекта
+    """
+    total_files = 0
+
+    for root, files in _walk_project(directories):
+        total_files += sum(1 for file in files if file.endswith(PROJECT_FILE_EXTENSIONS))
+
+    return total_files
+
+
+def take_snapshot(directories: List[str] = PROJECT_DIRECTORIES) -> Dict[str, Tuple[int, int]]:
+    """
+    Снять снимок состояния файлов проекта.
+
+    Читаются только метаданные (os.stat), содержимое файлов не открывается.
+
+    Args:
+        directories: Директории для отслеживания
+
+    Returns:
+        Словарь {путь: (mtime_ns, размер)}
+    """
+    snapshot = {}
+
+    for root, files in _walk_project(directories):
+        for file in files:
+            if file.endswith(PROJECT_FILE_EXTENSIONS):
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+
+    return snapshot
+
+
+class ProjectStatsCache:
+    """Кэш статистики проекта с пересчетом при изменении файлов."""
+
+    def __init__(
+        self,
+        directories: Optional[List[str]] = None,
+        check_interval: float = 5.0
+    ):
+        """
+        Инициализация кэша.
+
+        Args:
+            directories: Директории проекта (по умолчанию PROJECT_DIRECTORIES)
+            check_interval: Период проверки изменений в секундах
+        """
+        self.directories = directories or PROJECT_DIRECTORIES
+        self.check_interval = check_interval
+        self._stats: Optional[Dict[str, int]] = None
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self) -> Dict[str, int]:
+        """
+        Получить статистику проекта.
+
+        Диск не читается: значение берется из памяти. Вычисление
+        выполняется, только если кэш еще ни разу не заполнялся.
+
+        Returns:
+            Словарь {'lines_of_code': ..., 'files_count': ...}
+        """
+        stats = self._stats
+        if stats is None:
+            self.refresh()
+            stats = self._stats
+        return stats
+
+    def refresh(self) -> None:
+        """Пересчитать статистику и запомнить снимок файлов."""
+        with self._lock:
+            self._snapshot = take_snapshot(self.directories)
+            self._stats = {
+                'lines_of_code': count_lines_of_code(self.directories),
+                'files_count': count_project_files(self.directories)
+            }
+
+    def refresh_if_changed(self) -> bool:
+        """
+        Пересчитать статистику, если файлы проекта изменились.
+
+        Returns:
+            True если статистика была пересчитана
+        """
+        if take_snapshot(self.directories) == self._snapshot:
+            return False
+        self.refresh()
+        return True
+
+    def start(self) -> None:
+        """Вычислить статистику и запустить фоновое отслеживание изменений."""
+        self.refresh()
+        if self._thread is not None:
+            return
+
+        self._stop_event.clear()
+        target = self._watch_inotify if inotify_simple is not None else self._watch_polling
+        self._thread = threading.Thread(target=target, name='project-stats', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Остановить фоновое отслеживание изменений."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.check_interval + 1)
+            self._thread = None
+
+    def _watch_polling(self) -> None:
+        """Отслеживать изменения сравнением снимков mtime."""
+        while not self._stop_event.wait(self.check_interval):
+            self.refresh_if_changed()
+
+    def _watch_inotify(self) -> None:
+        """Отслеживать изменения через inotify."""
+        flags = inotify_simple.flags
+        mask = flags.CREATE | flags.DELETE | flags.MODIFY | flags.MOVED_FROM | flags.MOVED_TO
+
+        with inotify_simple.INotify() as inotify:
+            for root, _ in _walk_project(self.directories):
+                try:
+                    inotify.add_watch(root, mask)
+                except OSError:
+                    continue
+
+            while not self._stop_event.is_set():
+                events = inotify.read(timeout=int(self.check_interval * 1000))
+                if events:
+                    self.refresh_if_changed()
@@ -0,0 +1,84 @@
+"""
+Модуль кэширования отрендеренного HTML.
+
+Страницы и их фрагменты (например, таблица валют) хранятся в памяти
+под ключом, в который входят версия данных и все, от чего зависит
+результат (пользователь, его подписки). При изменении данных кэш
+сбрасывается вызовом invalidate().
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable
+
+
+class RenderCache:
+    """Кэш отрендеренных страниц и фрагментов с вытеснением по LRU."""
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Инициализация кэша.
+
+        Args:
+            max_entries: Максимальное количество хранимых записей
+        """
+        self.max_entries = max_entries
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, str]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> str:
+        """
+        Получить HTML из кэша или отрендерить и сохранить его.
+
+        Args:
+            key: Ключ записи (без версии данных - она добавляется автоматически)
+            render: Функция рендеринга, вызывается при промахе
+
+        Returns:
+            HTML содержимое
+        """
+        version = self.version
+        full_key = (version, key)
+
+        with self._lock:
+            html = self._entries.get(full_key)
+            if html is not None:
+                self._entries.move_to_end(full_key)
+                self.hits += 1
+                return html
+            self.misses += 1
+
+        html = render()
+
+        with self._lock:
+            # Данные могли измениться во время рендеринга - такой результат не сохраняем
+            if version == self.version:
+                self._entries[full_key] = html
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return html
+
+    def invalidate(self) -> None:
+        """Сбросить кэш после изменения данных."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Получить статистику кэша.
+
+        Returns:
+            Словарь с версией данных, числом записей, попаданий и промахов
+        """
+        with self._lock:
+            return {
+                'version': self.version,
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses
+            }
@@ -0,0 +1,217 @@
+"""
+Модуль маршрутизации HTTP-запросов.
+
+Маршруты задаются декларативно и компилируются один раз: пути без
+параметров попадают в словарь (поиск за O(1)), пути с параметрами
+(/api/users/{id}/subscribe) - в префиксное дерево по сегментам пути.
+Для каждого маршрута хранится таблица {HTTP-метод: обработчик}.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+
+class RouteMatch(NamedTuple):
+    """Результат сопоставления пути с маршрутом."""
+    handler: Any
+    params: Dict[str, str]
+
+
+class _Node:
+    """Узел префиксного дерева маршрутов."""
+
+    __slots__ = ('children', 'param_name', 'param_child', 'rest_name', 'rest_methods', 'methods')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.param_name: Optional[str] = None
+        self.param_child: Optional['_Node'] = None
+        self.rest_name: Optional[str] = None
+        self.rest_methods: Dict[str, Any] = {}
+        self.methods: Dict[str, Any] = {}
+
+
+class Router:
+    """
+    Маршрутизатор со статической таблицей и деревом параметрических путей.
+
+    Синтаксис шаблонов:
+        /users                      - точный путь
+        /api/users/{id}             - один сегмент пути как параметр
+        /static/{path:path}         - остаток пути (только в конце шаблона)
+    """
+
+    def __init__(self):
+        """Инициализация пустого маршрутизатора."""
+        # Для точных путей результат сопоставления создается заранее
+        self._static: Dict[str, Dict[str, RouteMatch]] = {}
+        self._root = _Node()
+
+    @classmethod
+    def from_table(cls, routes: Iterable[Tuple[str, str, Any]]) -> 'Router':
+        """
+        Создать маршрутизатор из таблицы маршрутов.
+
+        Args:
+            routes: Кортежи (метод, шаблон пути, обработчик)
+
+        Returns:
+            Скомпилированный маршрутизатор
+        """
+        router = cls()
+        for method, pattern, handler in routes:
+            router.add(method, pattern, handler)
+        return router
+
+    def add(self, method: str, pattern: str, handler: Any) -> None:
+        """
+        Добавить маршрут.
+
+        Args:
+            method: HTTP-метод ('GET', 'POST', ...)
+            pattern: Шаблон пути
+            handler: Обработчик (любой объект, например имя метода)
+
+        Raises:
+            ValueError: Если шаблон некорректен или маршрут уже задан
+        """
+        method = method.upper()
+
+        if '{' not in pattern:
+            methods = self._static.setdefault(pattern, {})
+            self._register(methods, method, pattern, RouteMatch(handler, {}))
+            return
+
+        node = self._root
+        segments = self._split(pattern)
+        for index, segment in enumerate(segments):
+            if not (segment.startswith('{') and segment.endswith('}')):
+                node = node.children.setdefault(segment, _Node())
+                continue
+
+            name, _, kind = segment[1:-1].partition(':')
+            if not name:
+                raise ValueError(f"Пустое имя параметра в шаблоне '{pattern}'")
+
+            if kind == 'path':
+                if index != len(segments) - 1:
+                    raise ValueError(f"Параметр '{name}:path' должен быть последним в '{pattern}'")
+                if node.rest_name not in (None, name):
+                    raise ValueError(f"Конфликт имен параметров в шаблоне '{pattern}'")
+                node.rest_name = name
+                self._register(node.rest_methods, method, pattern, handler)
+                return
+
+            if kind:
+                raise ValueError(f"Неизвестный тип параметра '{kind}' в шаблоне '{pattern}'")
+            if node.param_child is None:
+                node.param_name = name
+                node.param_child = _Node()
+            elif node.param_name != name:
+                raise ValueError(f"Конфликт имен параметров в шаблоне '{pattern}'")
+            node = node.param_child
+
+        self._register(node.methods, method, pattern, handler)
+
+    def match(self, method: str, path: str) -> Optional[RouteMatch]:
+        """
+        Найти обработчик для метода и пути.
+
+        Args:
+            method: HTTP-метод запроса в верхнем регистре
+            path: Путь запроса без строки параметров
+
+        Returns:
+            RouteMatch или None, если маршрут не найден
+        """
+        methods = self._static.get(path)
+        if methods is not None:
+            match = methods.get(method)
+            if match is not None:
+                return match
+
+        found = self._match_node(self._root, self._split(path), 0, method, {})
+        if found is None:
+            return None
+        return RouteMatch(*found)
+
+    def allowed_methods(self, path: str) -> List[str]:
+        """
+        Получить методы, для которых путь зарегистрирован.
+
+        Используется, когда match вернул None: непустой список означает,
+        что путь известен и ответом должен быть 405, а не 404.
+
+        Args:
+            path: Путь запроса без строки параметров
+
+        Returns:
+            Отсортированный список HTTP-методов
+        """
+        allowed = set(self._static.get(path, ()))
+        self._collect_methods(self._root, self._split(path), 0, allowed)
+        return sorted(allowed)
+
+    def _match_node(
+        self,
+        node: _Node,
+        segments: List[str],
+        index: int,
+        method: str,
+        params: Dict[str, str]
+    ) -> Optional[Tuple[Any, Dict[str, str]]]:
+        """Найти обработчик в поддереве (приоритет: сегмент, параметр, остаток пути)."""
+        if index == len(segments):
+            handler = node.methods.get(method)
+            return (handler, params) if handler is not None else None
+
+        segment = segments[index]
+
+        child = node.children.get(segment)
+        if child is not None:
+            found = self._match_node(child, segments, index + 1, method, params)
+            if found is not None:
+                return found
+
+        if node.param_child is not None and segment:
+            params[node.param_name] = segment
+            found = self._match_node(node.param_child, segments, index + 1, method, params)
+            if found is not None:
+                return found
+            del params[node.param_name]
+
+        if node.rest_name is not None and method in node.rest_methods:
+            params[node.rest_name] = '/'.join(segments[index:])
+            return node.rest_methods[method], params
+
+        return None
+
+    def _collect_methods(self, node: _Node, segments: List[str], index: int, allowed: Set[str]) -> None:
+        """Собрать методы всех ветвей поддерева, которым соответствует путь."""
+        if index == len(segments):
+            allowed.update(node.methods)
+            return
+
+        segment = segments[index]
+
+        child = node.children.get(segment)
+        if child is not None:
+            self._collect_methods(child, segments, index + 1, allowed)
+
+        if node.param_child is not None and segment:
+            self._collect_methods(node.param_child, segments, index + 1, allowed)
+
+        if node.rest_name is not None:
+            allowed.update(node.rest_methods)
+
+    @staticmethod
+    def _split(path: str) -> List[str]:
+        """Разбить путь на сегменты."""
+        return path.strip('/').split('/') if path != '/' else ['']
+
+    @staticmethod
+    def _register(methods: Dict[str, Any], method: str, pattern: str, handler: Any) -> None:
+        """Зарегистрировать обработчик метода."""
+        if method in methods:
+            raise ValueError(f"Маршрут {method} {pattern} уже зарегистрирован")
+        methods[method] = handler
+
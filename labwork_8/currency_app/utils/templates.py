@@ -0,0 +1,86 @@
+"""
+Модуль настройки шаблонизатора Jinja2.
+
+Создает окружение с постоянным кэшем байт-кода на диске, чтобы после
+перезапуска шаблоны не компилировались заново, и заранее загружает все
+шаблоны при старте сервера.
+"""
+
+import os
+from typing import Optional
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+    select_autoescape
+)
+
+
+def create_environment(
+    template_dir: str = 'templates',
+    bytecode_cache_dir: Optional[str] = None,
+    auto_reload: bool = True
+) -> Environment:
+    """
+    Создать окружение Jinja2.
+
+    Args:
+        template_dir: Директория с шаблонами
+        bytecode_cache_dir: Директория кэша байт-кода (None - без кэша)
+        auto_reload: Проверять ли изменение файлов шаблонов при каждом обращении
+
+    Returns:
+        Настроенное окружение Jinja2
+    """
+    bytecode_cache = None
+    if bytecode_cache_dir:
+        os.makedirs(bytecode_cache_dir, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(['html', 'xml']),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+        auto_reload=auto_reload,
+        # Все шаблоны приложения помещаются в кэш без вытеснения
+        cache_size=-1
+    )
+
+
+def warm_up(env: Environment) -> int:
+    """
+    Загрузить и скомпилировать все шаблоны окружения.
+
+    Args:
+        env: Окружение Jinja2
+
+    Returns:
+        Количество загруженных шаблонов
+    """
+    count = 0
+    for name in env.list_templates(extensions=['html', 'xml']):
+        env.get_template(name)
+        count += 1
+    return count
+
+
+def resolve_template(env: Environment, name: str) -> Optional[Template]:
+    """
+    Найти шаблон, если он существует.
+
+    Args:
+        env: Окружение Jinja2
+        name: Имя шаблона
+
+    Returns:
+        Шаблон или None, если файла нет
+    """
+    try:
+        return env.get_template(name)
+    except TemplateNotFound:
+        return None
@@ -0,0 +1,163 @@
+"""
+Бенчмарк разбора ответа API курсов валют ЦБ РФ.
+
+Сравнивает прежнюю обработку записей (строковая замена, float, Decimal
+и datetime.now() на каждую запись) с parse_snapshot, который разбирает
+весь снимок за один проход в целые числа с фиксированной точкой, а также
+пересчет сумм по кросс-курсу через Decimal, Money и exchange_many.
+Ответ API генерируется локально, сеть не используется.
+"""
+
+import random
+import time
+from datetime import datetime
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Any, Dict, List
+
+from utils.currencies_api import parse_snapshot
+from utils.fixed_point import Money, exchange_many
+
+
+# Размеры снимков: реальный ответ ЦБ РФ содержит около 40 валют
+SNAPSHOT_SIZES = (43, 10000)
+REPEAT = 5
+
+# Количество сумм для пересчета по курсу
+EXCHANGE_COUNT = 100000
+
+
+def make_feed(size: int) -> Dict[str, Any]:
+    """
+    Сгенерировать ответ API со случайными курсами.
+
+    Args:
+        size: Количество валют
+
+    Returns:
+        Словарь в формате daily_json.js
+    """
+    rng = random.Random(size)
+    valutes = {}
+    for i in range(size):
+        code = f"C{i:04d}"
+        nominal = rng.choice((1, 1, 1, 10, 100, 10000))
+        valutes[code] = {
+            'ID': f"R{i:05d}",
+            'NumCode': f"{i % 1000:03d}",
+            'CharCode': code,
+            'Nominal': nominal,
+            'Name': f"Валюта {i}",
+            'Value': round(rng.uniform(0.01, 200.0), 4),
+            'Previous': round(rng.uniform(0.01, 200.0), 4)
+        }
+    return {'Valute': valutes}
+
+
+def legacy_parse(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Разобрать ответ API так, как это делали get_currencies и
+    get_all_currencies до перехода на фиксированную точку.
+
+    Args:
+        data: Ответ API
+
+    Returns:
+        Список словарей с курсами
+    """
+    result = []
+    for code, currency_data in data['Valute'].items():
+        value = float(str(currency_data['Value']).replace(',', '.'))
+        actual_value = Decimal(str(value / currency_data['Nominal'])).quantize(
+            Decimal('0.0001'), rounding=ROUND_HALF_UP
+        )
+        result.append({
+            'id': currency_data.get('ID', ''),
+            'num_code': currency_data.get('NumCode', ''),
+            'char_code': currency_data.get('CharCode', ''),
+            'nominal': currency_data.get('Nominal', 1),
+            'name': currency_data.get('Name', ''),
+            'value': float(str(currency_data.get('Value', 0)).replace(',', '.')),
+            'previous': float(str(currency_data.get('Previous', 0)).replace(',', '.')),
+            'rate': float(actual_value),
+            'timestamp': datetime.now().isoformat()
+        })
+    return result
+
+
+def best_time(func, *args) -> float:
+    """Минимальное время выполнения из REPEAT запусков."""
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def count_mismatches(data: Dict[str, Any]) -> int:
+    """
+    Подсчитать курсы за единицу, которые прежнее округление до 4 знаков
+    искажает относительно точного частного курса и номинала.
+
+    Args:
+        data: Ответ API
+
+    Returns:
+        Количество расхождений
+    """
+    exact = {r['char_code']: r['rate'] for r in parse_snapshot(data)}
+    return sum(1 for r in legacy_parse(data) if r['rate'] != exact[r['char_code']])
+
+
+def main():
+    """Запустить бенчмарк и вывести таблицу результатов."""
+    print(f"{'Валют':>8} {'Прежний, мс':>14} {'parse_snapshot, мс':>20} {'Ускорение':>10} {'Расхождений':>12}")
+    print("-" * 68)
+    for size in SNAPSHOT_SIZES:
+        data = make_feed(size)
+        legacy = best_time(legacy_parse, data) * 1000
+        fast = best_time(parse_snapshot, data) * 1000
+        print(f"{size:>8} {legacy:>14.3f} {fast:>20.3f} {legacy / fast:>9.1f}x {count_mismatches(data):>12}")
+
+    benchmark_exchange()
+
+
+
+def exchange_decimal(amounts: List[Decimal], from_rate: Decimal, to_rate: Decimal) -> List[Decimal]:
+    """Пересчитать суммы через Decimal с округлением до 4 знаков."""
+    quantum = Decimal('0.0001')
+    return [(a * from_rate / to_rate).quantize(quantum, rounding=ROUND_HALF_UP) for a in amounts]
+
+
+def exchange_money(amounts: List[Money], from_rate: Money, to_rate: Money) -> List[Money]:
+    """Пересчитать суммы через объекты Money."""
+    return [a.exchange(from_rate, to_rate) for a in amounts]
+
+
+def benchmark_exchange() -> None:
+    """Сравнить пересчет сумм по кросс-курсу USD -> EUR."""
+    rng = random.Random(EXCHANGE_COUNT)
+    amounts = [rng.randint(1, 10 ** 10) for _ in range(EXCHANGE_COUNT)]
+    usd, eur = Money.from_value(93.25), Money.from_value(101.7)
+
+    decimal_amounts = [Decimal(a).scaleb(-4) for a in amounts]
+    money_amounts = [Money(a) for a in amounts]
+    variants = [
+        ('Decimal', exchange_decimal, (decimal_amounts, Decimal('93.25'), Decimal('101.7'))),
+        ('Money', exchange_money, (money_amounts, usd, eur)),
+        ('exchange_many', exchange_many, (amounts, usd.units, eur.units)),
+    ]
+
+    expected = [str(d) for d in exchange_decimal(*variants[0][2])]
+    print()
+    print(f"{'Пересчет ' + str(EXCHANGE_COUNT) + ' сумм':<24} {'Время, мс':>10} {'Совпадает с Decimal':>20}")
+    print("-" * 56)
+    for label, func, args in variants:
+        elapsed = best_time(func, *args) * 1000
+        result = func(*args)
+        same = [str(Money(r) if isinstance(r, int) else r) for r in result] == expected
+        print(f"{label:<24} {elapsed:>10.1f} {'да' if same else 'нет':>20}")
+
+
+if __name__ == '__main__':
+    main()
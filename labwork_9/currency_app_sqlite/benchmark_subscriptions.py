@@ -0,0 +1,108 @@
+"""
+Бенчмарк массового импорта и выгрузки подписок.
+
+Сравнивает построчный subscribe_user (отдельный commit на каждую
+подписку) с import_subscriptions (executemany в одной транзакции, с
+отключением индексов и без него) и замеряет потоковую выгрузку в CSV.
+База создается во временном файле: в базе в памяти commit почти ничего
+не стоит, и разница между вариантами была бы незаметна.
+"""
+
+import io
+import os
+import tempfile
+import time
+from typing import List, Tuple
+
+from controllers.databasecontroller import DatabaseController
+
+
+# Размер набора данных: пользователи x валюты = количество подписок
+USER_COUNT = 20000
+CURRENCY_COUNT = 10
+
+# Количество подписок для построчного варианта (он намного медленнее)
+ROW_BY_ROW_SAMPLE = 5000
+
+
+def create_database(path: str) -> Tuple[DatabaseController, List[Tuple[int, int]]]:
+    """
+    Создать базу с пользователями и валютами без подписок.
+
+    Args:
+        path: Путь к файлу базы данных
+
+    Returns:
+        (контроллер базы данных, пары (user_id, currency_id) для импорта)
+    """
+    if os.path.exists(path):
+        os.remove(path)
+    db = DatabaseController(path)
+    db.connection.executemany(
+        "INSERT INTO user (name) VALUES (?)",
+        ((f"Пользователь {i}",) for i in range(USER_COUNT))
+    )
+    db.connection.executemany(
+        "INSERT INTO currency (num_code, char_code, name, value_units, nominal) VALUES (?, ?, ?, ?, ?)",
+        ((f"{900 + i}", f"X{i:02d}", f"Валюта {i}", (1 + i) * 10000, 1) for i in range(CURRENCY_COUNT))
+    )
+    db.connection.commit()
+
+    user_ids = [row[0] for row in db.connection.execute("SELECT id FROM user")]
+    currency_ids = [row[0] for row in db.connection.execute("SELECT id FROM currency")]
+    pairs = [(user_id, currency_id) for user_id in user_ids for currency_id in currency_ids]
+    return db, pairs
+
+
+def report(label: str, rows: int, seconds: float) -> None:
+    """Вывести строку результата."""
+    print(f"{label:<44} {rows:>10} {seconds:>10.3f} {rows / seconds:>14,.0f}")
+
+
+def main():
+    """Запустить бенчмарк и вывести таблицу результатов."""
+    with tempfile.TemporaryDirectory() as tmp:
+        run(os.path.join(tmp, 'benchmark.db'))
+
+
+def run(path: str) -> None:
+    """
+    Выполнить замеры.
+
+    Args:
+        path: Путь к временному файлу базы данных
+    """
+    print(f"{'Операция':<44} {'Строк':>10} {'Время, с':>10} {'Строк/с':>14}")
+    print("-" * 81)
+
+    db, pairs = create_database(path)
+    start = time.perf_counter()
+    for user_id, currency_id in pairs[:ROW_BY_ROW_SAMPLE]:
+        db.subscribe_user(user_id, currency_id)
+    report("subscribe_user (commit на каждую строку)", ROW_BY_ROW_SAMPLE, time.perf_counter() - start)
+    db.close()
+
+    for defer_indexes in (False, True):
+        db, pairs = create_database(path)
+        start = time.perf_counter()
+        inserted = db.import_subscriptions(pairs, defer_indexes=defer_indexes)
+        label = "import_subscriptions" + (" (defer_indexes)" if defer_indexes else "")
+        report(label, inserted, time.perf_counter() - start)
+
+        if defer_indexes:
+            csv_text = io.StringIO()
+            start = time.perf_counter()
+            exported = db.export_subscriptions_csv(csv_text)
+            report("export_subscriptions_csv", exported, time.perf_counter() - start)
+
+            db.connection.execute("DELETE FROM user_currency")
+            db.connection.commit()
+            csv_text.seek(0)
+            start = time.perf_counter()
+            inserted = db.import_subscriptions_csv(csv_text, defer_indexes=True)
+            report("import_subscriptions_csv (defer_indexes)", inserted, time.perf_counter() - start)
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
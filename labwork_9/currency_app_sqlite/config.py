@@ -33,6 +33,21 @@ class Config:
     # Настройки кэширования
     CACHE_ENABLED = True
     CACHE_TTL = 300  # 5 минут в секундах
+    READ_CACHE_MAX_ENTRIES = 256  # Результаты чтения валют из базы данных
+    
+    # Настройки сжатия ответов (Accept-Encoding)
+    COMPRESSION_ENABLED = True
+    COMPRESSION_MIN_SIZE = 1024  # Не сжимать ответы меньше 1 КБ
+    COMPRESSION_LEVEL = 6  # Уровень сжатия динамических ответов
+    STATIC_COMPRESSION_LEVEL = 9  # Статика сжимается один раз при старте
+    
+    # Настройки статических файлов
+    STATIC_DIR = 'static'
+    STATIC_MEMORY_LIMIT = 256 * 1024  # Файлы больше отдаются через sendfile/mmap
+    STATIC_MAX_AGE = 3600  # Кэширование адресов без отпечатка, в секундах
+    
+    # Период проверки изменений файлов проекта для статистики на /author, в секундах
+    PROJECT_STATS_CHECK_INTERVAL = 5.0
     
     # Настройки сессии
     SESSION_TIMEOUT = timedelta(hours=1)
@@ -86,6 +101,25 @@ class Config:
         'lstrip_blocks': True
     }
     
+    # Шаблоны: кэш байт-кода на диске и проверка изменений файлов
+    TEMPLATE_DIR = 'templates'
+    TEMPLATE_BYTECODE_CACHE_DIR = os.environ.get('TEMPLATE_CACHE_DIR', '.jinja_cache')
+    TEMPLATE_AUTO_RELOAD = True
+    
+    # Максимальное количество отрендеренных страниц и фрагментов в кэше
+    RENDER_CACHE_MAX_ENTRIES = 128
+    
+    # Постраничная выдача списков в API (?limit=, ?cursor=)
+    API_PAGE_SIZE = 50
+    API_MAX_PAGE_SIZE = 500
+    
+    # Количество пользователей на странице /users
+    USERS_PAGE_SIZE = 50
+    
+    # Поток изменений курсов (Server-Sent Events)
+    SSE_KEEPALIVE_INTERVAL = 15.0
+    SSE_RETRY_MS = 5000
+    
     # Начальные данные
     INITIAL_USERS = [
         {'id': 1, 'name': 'Иван Иванов'},
@@ -188,6 +222,7 @@ class ProductionConfig(Config):
     DEBUG = False
     SERVER_HOST = "0.0.0.0"
     SERVER_PORT = 80
+    TEMPLATE_AUTO_RELOAD = False
     SECRET_KEY = os.environ.get('SECRET_KEY', 'production-secret-key')
 
 
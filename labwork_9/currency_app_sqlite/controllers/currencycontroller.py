@@ -3,9 +3,11 @@
 Использует DatabaseController для работы с базой данных.
 """
 
-from typing import List, Dict, Any, Optional
+import time
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from datetime import datetime
 from controllers.databasecontroller import CurrencyRatesCRUD
+from utils.currencies_api import get_all_currencies
 
 
 class CurrencyController:
@@ -29,6 +31,24 @@ class CurrencyController:
         """
         return self.db._read()
     
+    def list_currencies_page(self, after_id: Optional[int] = None, limit: int = 50,
+                             char_code: Optional[str] = None, query: Optional[str] = None,
+                             fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Получить страницу списка валют.
+        
+        Args:
+            after_id: ID последней валюты предыдущей страницы (None - с начала)
+            limit: Размер страницы
+            char_code: Точный символьный код
+            query: Подстрока для поиска в коде и названии
+            fields: Поля для выдачи (None - все поля)
+        
+        Returns:
+            (валюты страницы, ID для следующей страницы или None)
+        """
+        return self.db._read_page(after_id, limit, char_code, query, fields)
+    
     def get_currency(self, currency_id: int) -> Optional[Dict[str, Any]]:
         """
         Получить информацию о валюте по ID.
@@ -45,6 +65,19 @@ class CurrencyController:
                 return currency
         return None
     
+    def get_currency_by_char_code(self, char_code: str) -> Optional[Dict[str, Any]]:
+        """
+        Получить информацию о валюте по символьному коду.
+        
+        Args:
+            char_code: Символьный код валюты
+        
+        Returns:
+            Словарь с информацией о валюте или None
+        """
+        result = self.db._read(char_code)
+        return result[0] if result else None
+    
     def update_currency(self, char_code: str, value: float) -> bool:
         """
         Обновить курс валюты.
@@ -95,6 +128,28 @@ class CurrencyController:
         
         return self.db._create(currencies)
     
+    def sync_currencies(
+        self,
+        fetch: Callable[[], List[Dict[str, Any]]] = get_all_currencies
+    ) -> Dict[str, Any]:
+        """
+        Загрузить курсы из API и синхронизировать их с базой данных.
+        
+        Args:
+            fetch: Функция получения снимка курсов (по умолчанию API ЦБ РФ)
+        
+        Returns:
+            Отчет о синхронизации: inserted, updated, unchanged, skipped,
+            changed, elapsed_ms и fetch_ms (время загрузки снимка)
+        """
+        start = time.perf_counter()
+        currencies = fetch()
+        fetch_ms = (time.perf_counter() - start) * 1000
+        
+        report = self.db._sync(currencies)
+        report['fetch_ms'] = fetch_ms
+        return report
+    
     def get_currencies_for_user(self, user_id: int) -> List[Dict[str, Any]]:
         """
         Получить список валют для конкретного пользователя.
@@ -3,11 +3,196 @@
 Реализует CRUD операции для всех сущностей приложения.
 """
 
+import csv
+import logging
 import sqlite3
 import json
-from typing import Optional, List, Dict, Any, Tuple
+import time
+from itertools import islice
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Iterator, TextIO
 from datetime import datetime
 
+from utils.fixed_point import RATE_SCALE, parse_scaled
+from utils.read_cache import ReadCache
+
+
+logger = logging.getLogger(__name__)
+
+# Денормализованное количество подписок пользователя: покрывающий индекс
+# для списка пользователей по имени и триггеры, поддерживающие счетчик
+USER_SUBSCRIPTION_COUNT_SQL = (
+    "CREATE INDEX IF NOT EXISTS idx_user_name ON user(name, id, subscription_count, created_at)",
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_user_currency_insert
+    AFTER INSERT ON user_currency
+    BEGIN
+        UPDATE user SET subscription_count = subscription_count + 1 WHERE id = NEW.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_user_currency_delete
+    AFTER DELETE ON user_currency
+    BEGIN
+        UPDATE user SET subscription_count = subscription_count - 1 WHERE id = OLD.user_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS trg_user_currency_update
+    AFTER UPDATE OF user_id ON user_currency
+    WHEN OLD.user_id <> NEW.user_id
+    BEGIN
+        UPDATE user SET subscription_count = subscription_count - 1 WHERE id = OLD.user_id;
+        UPDATE user SET subscription_count = subscription_count + 1 WHERE id = NEW.user_id;
+    END
+    """,
+)
+
+# Исходная схема базы данных (миграция 1)
+INITIAL_SCHEMA_SQL = (
+    """
+    CREATE TABLE IF NOT EXISTS author (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        group_name TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS app (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        version TEXT NOT NULL,
+        author_id INTEGER NOT NULL,
+        FOREIGN KEY (author_id) REFERENCES author(id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        subscription_count INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS currency (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        num_code TEXT NOT NULL,
+        char_code TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        value REAL NOT NULL,
+        nominal INTEGER NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        CHECK (value > 0),
+        CHECK (nominal > 0)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS user_currency (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        currency_id INTEGER NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
+        FOREIGN KEY (currency_id) REFERENCES currency(id) ON DELETE CASCADE,
+        UNIQUE(user_id, currency_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_currency_char_code ON currency(char_code)",
+    "CREATE INDEX IF NOT EXISTS idx_user_currency_user_id ON user_currency(user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_user_currency_currency_id ON user_currency(currency_id)",
+)
+
+
+def _migration_initial_schema(cursor: sqlite3.Cursor) -> None:
+    """Исходная схема: таблицы и индексы."""
+    for statement in INITIAL_SCHEMA_SQL:
+        cursor.execute(statement)
+
+
+def _migration_subscription_count(cursor: sqlite3.Cursor) -> None:
+    """Счетчик подписок пользователя и покрывающий индекс по имени."""
+    # Столбец мог быть добавлен до появления миграций
+    columns = [row[1] for row in cursor.execute("PRAGMA table_info(user)")]
+    if 'subscription_count' not in columns:
+        cursor.execute(
+            "ALTER TABLE user ADD COLUMN subscription_count INTEGER NOT NULL DEFAULT 0"
+        )
+        cursor.execute("""
+            UPDATE user SET subscription_count = (
+                SELECT COUNT(*) FROM user_currency uc WHERE uc.user_id = user.id
+            )
+        """)
+    for statement in USER_SUBSCRIPTION_COUNT_SQL:
+        cursor.execute(statement)
+
+
+# Курс валюты хранится целым числом в десятитысячных долях рубля
+# (value_units); столбец value вычисляется из него для чтения
+CURRENCY_VALUE_UNITS_SQL = (
+    f"""
+    CREATE TABLE currency_new (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        num_code TEXT NOT NULL,
+        char_code TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        value_units INTEGER NOT NULL,
+        value REAL GENERATED ALWAYS AS (value_units / {RATE_SCALE}.0) VIRTUAL,
+        nominal INTEGER NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        CHECK (value_units > 0),
+        CHECK (nominal > 0)
+    )
+    """,
+    f"""
+    INSERT INTO currency_new (id, num_code, char_code, name, value_units, nominal, updated_at)
+    SELECT id, num_code, char_code, name, CAST(ROUND(value * {RATE_SCALE}) AS INTEGER), nominal, updated_at
+    FROM currency
+    """,
+    "DROP TABLE currency",
+    "ALTER TABLE currency_new RENAME TO currency",
+    "CREATE INDEX IF NOT EXISTS idx_currency_char_code ON currency(char_code)",
+)
+
+
+def _migration_currency_value_units(cursor: sqlite3.Cursor) -> None:
+    """Курс валюты в целых десятитысячных долях рубля (value_units)."""
+    # Таблица пересоздается: SQLite не меняет тип столбца с CHECK.
+    # Ссылки user_currency на currency(id) сохраняются, так как id копируются
+    for statement in CURRENCY_VALUE_UNITS_SQL:
+        cursor.execute(statement)
+
+
+# Миграции схемы по порядку; номер версии = позиция в списке + 1.
+# Применяются к базам с меньшим PRAGMA user_version. Новые миграции
+# добавляются только в конец списка.
+MIGRATIONS = [
+    _migration_initial_schema,
+    _migration_subscription_count,
+    _migration_currency_value_units,
+]
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# Вторичные индексы user_currency, которые можно отключить на время массового импорта
+USER_CURRENCY_INDEXES = {
+    'idx_user_currency_user_id': "CREATE INDEX IF NOT EXISTS idx_user_currency_user_id ON user_currency(user_id)",
+    'idx_user_currency_currency_id': "CREATE INDEX IF NOT EXISTS idx_user_currency_currency_id ON user_currency(currency_id)",
+}
+
+# Вставка или обновление валюты по символьному коду (синхронизация с API)
+CURRENCY_UPSERT_SQL = """
+    INSERT INTO currency (num_code, char_code, name, value_units, nominal, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(char_code) DO UPDATE SET
+        num_code = excluded.num_code,
+        name = excluded.name,
+        value_units = excluded.value_units,
+        nominal = excluded.nominal,
+        updated_at = excluded.updated_at
+"""
+
+# Столбцы таблицы currency, доступные для выборки
+CURRENCY_COLUMNS = ('id', 'num_code', 'char_code', 'name', 'value', 'value_units', 'nominal', 'updated_at')
+
 
 class DatabaseController:
     """Контроллер для управления SQLite базой данных."""
@@ -16,102 +201,79 @@ class DatabaseController:
         """
         Инициализация контроллера базы данных.
         
+        Схема приводится к текущей версии (migrate). Начальные данные
+        не добавляются автоматически - для этого есть метод seed().
+        
         Args:
             db_path: Путь к файлу БД или ":memory:" для базы в памяти
         """
         self.db_path = db_path
         self.connection = None
         self._connect()
-        self._create_tables()
-        self._seed_initial_data()
+        self.migrate()
     
     def _connect(self) -> None:
         """Установить соединение с базой данных."""
         try:
-            self.connection = sqlite3.connect(self.db_path)
+            # Запросы приходят из потоков сервера; сервер выполняет их по одному
+            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
             self.connection.row_factory = sqlite3.Row  # Возвращать строки как словари
-            print(f"✅ Соединение с базой данных установлено: {self.db_path}")
-        except sqlite3.Error as e:
-            print(f"❌ Ошибка подключения к базе данных: {e}")
+            logger.debug("Соединение с базой данных установлено: %s", self.db_path)
+        except sqlite3.Error:
+            logger.exception("Ошибка подключения к базе данных: %s", self.db_path)
             raise
     
-    def _create_tables(self) -> None:
-        """Создать таблицы в базе данных."""
-        create_tables_sql = """
-        -- Таблица авторов
-        CREATE TABLE IF NOT EXISTS author (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            group_name TEXT NOT NULL
-        );
-        
-        -- Таблица приложений
-        CREATE TABLE IF NOT EXISTS app (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            version TEXT NOT NULL,
-            author_id INTEGER NOT NULL,
-            FOREIGN KEY (author_id) REFERENCES author(id)
-        );
-        
-        -- Таблица пользователей
-        CREATE TABLE IF NOT EXISTS user (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        -- Таблица валют
-        CREATE TABLE IF NOT EXISTS currency (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            num_code TEXT NOT NULL,
-            char_code TEXT NOT NULL UNIQUE,
-            name TEXT NOT NULL,
-            value REAL NOT NULL,
-            nominal INTEGER NOT NULL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            CHECK (value > 0),
-            CHECK (nominal > 0)
-        );
-        
-        -- Таблица подписок пользователей на валюты
-        CREATE TABLE IF NOT EXISTS user_currency (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            user_id INTEGER NOT NULL,
-            currency_id INTEGER NOT NULL,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE,
-            FOREIGN KEY (currency_id) REFERENCES currency(id) ON DELETE CASCADE,
-            UNIQUE(user_id, currency_id)
-        );
-        
-        -- Индексы для ускорения поиска
-        CREATE INDEX IF NOT EXISTS idx_currency_char_code ON currency(char_code);
-        CREATE INDEX IF NOT EXISTS idx_user_currency_user_id ON user_currency(user_id);
-        CREATE INDEX IF NOT EXISTS idx_user_currency_currency_id ON user_currency(currency_id);
+    def migrate(self) -> int:
+        """
+        Привести схему базы данных к текущей версии.
+        
+        Версия схемы хранится в PRAGMA user_version. Если она совпадает с
+        SCHEMA_VERSION, DDL не выполняется совсем; иначе недостающие
+        миграции применяются по порядку в одной транзакции.
+        
+        Returns:
+            Количество примененных миграций
+        
+        Raises:
+            RuntimeError: Если схема базы новее, чем знает приложение
         """
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version == SCHEMA_VERSION:
+            return 0
+        if version > SCHEMA_VERSION:
+            raise RuntimeError(
+                f"Версия схемы базы данных ({version}) новее поддерживаемой ({SCHEMA_VERSION})"
+            )
         
+        cursor = self.connection.cursor()
         try:
-            cursor = self.connection.cursor()
-            cursor.executescript(create_tables_sql)
+            cursor.execute("BEGIN")
+            for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+                migration(cursor)
+                logger.info("Применена миграция схемы %d: %s", number, migration.__doc__)
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
             self.connection.commit()
-            print("✅ Таблицы созданы успешно")
-        except sqlite3.Error as e:
-            print(f"❌ Ошибка создания таблиц: {e}")
+        except sqlite3.Error:
+            self.connection.rollback()
+            logger.exception("Ошибка миграции схемы базы данных")
             raise
-    
-    def _seed_initial_data(self) -> None:
-        """Заполнить базу данных начальными данными."""
-        # Проверяем, есть ли уже данные
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT COUNT(*) FROM currency")
-        currency_count = cursor.fetchone()[0]
         
-        if currency_count == 0:
-            self._insert_initial_data()
+        return SCHEMA_VERSION - version
     
-    def _insert_initial_data(self) -> None:
-        """Вставить начальные данные в таблицы."""
+    def seed(self) -> bool:
+        """
+        Заполнить базу данных начальными данными (идемпотентно).
+        
+        Повторный вызов ничего не меняет: данные добавляются, только если
+        таблица app пуста, а валюты и подписки вставляются через
+        INSERT OR IGNORE.
+        
+        Returns:
+            True если данные были добавлены
+        """
+        if self.connection.execute("SELECT 1 FROM app LIMIT 1").fetchone():
+            return False
+        
         try:
             cursor = self.connection.cursor()
             
@@ -130,16 +292,11 @@ class DatabaseController:
             """, ("Currency Tracker", "1.0.0", author_id))
             
             # Добавляем пользователей
-            users = [
-                ("Иван Иванов",),
-                ("Мария Петрова",),
-                ("Алексей Сидоров",)
-            ]
-            
-            cursor.executemany("""
-                INSERT INTO user (name) 
-                VALUES (?)
-            """, users)
+            users = ["Иван Иванов", "Мария Петрова", "Алексей Сидоров"]
+            user_ids = []
+            for name in users:
+                cursor.execute("INSERT INTO user (name) VALUES (?)", (name,))
+                user_ids.append(cursor.lastrowid)
             
             # Добавляем валюты
             currencies = [
@@ -151,28 +308,30 @@ class DatabaseController:
             ]
             
             cursor.executemany("""
-                INSERT INTO currency (num_code, char_code, name, value, nominal) 
+                INSERT OR IGNORE INTO currency (num_code, char_code, name, value_units, nominal) 
                 VALUES (?, ?, ?, ?, ?)
-            """, currencies)
+            """, [(num, code, name, parse_scaled(value), nominal)
+                  for num, code, name, value, nominal in currencies])
             
-            # Добавляем подписки
+            # Добавляем подписки (пользователь, символьный код валюты)
             subscriptions = [
-                (1, 1),  # Иван подписан на USD
-                (1, 2),  # Иван подписан на EUR
-                (2, 2),  # Мария подписан на EUR
-                (3, 3),  # Алексей подписан на GBP
+                (user_ids[0], "USD"),  # Иван подписан на USD
+                (user_ids[0], "EUR"),  # Иван подписан на EUR
+                (user_ids[1], "EUR"),  # Мария подписан на EUR
+                (user_ids[2], "GBP"),  # Алексей подписан на GBP
             ]
             
             cursor.executemany("""
-                INSERT INTO user_currency (user_id, currency_id) 
-                VALUES (?, ?)
+                INSERT OR IGNORE INTO user_currency (user_id, currency_id) 
+                SELECT ?, id FROM currency WHERE char_code = ?
             """, subscriptions)
             
             self.connection.commit()
-            print("✅ Начальные данные добавлены успешно")
+            logger.info("Начальные данные добавлены")
+            return True
             
-        except sqlite3.Error as e:
-            print(f"❌ Ошибка добавления начальных данных: {e}")
+        except sqlite3.Error:
+            logger.exception("Ошибка добавления начальных данных")
             self.connection.rollback()
             raise
     
@@ -198,8 +357,8 @@ class DatabaseController:
                 self.connection.commit()
                 return []
                 
-        except sqlite3.Error as e:
-            print(f"❌ Ошибка выполнения запроса: {e}")
+        except sqlite3.Error:
+            logger.exception("Ошибка выполнения запроса")
             self.connection.rollback()
             raise
     
@@ -215,8 +374,8 @@ class DatabaseController:
             cursor = self.connection.cursor()
             cursor.executemany(sql, params_list)
             self.connection.commit()
-        except sqlite3.Error as e:
-            print(f"❌ Ошибка выполнения запроса: {e}")
+        except sqlite3.Error:
+            logger.exception("Ошибка выполнения запроса")
             self.connection.rollback()
             raise
     
@@ -238,11 +397,11 @@ class DatabaseController:
             ID созданной валюты
         """
         sql = """
-        INSERT INTO currency (num_code, char_code, name, value, nominal, updated_at)
+        INSERT INTO currency (num_code, char_code, name, value_units, nominal, updated_at)
         VALUES (?, ?, ?, ?, ?, ?)
         """
         
-        params = (num_code, char_code, name, value, nominal, datetime.now())
+        params = (num_code, char_code, name, parse_scaled(value), nominal, datetime.now())
         cursor = self.connection.cursor()
         cursor.execute(sql, params)
         self.connection.commit()
@@ -268,6 +427,69 @@ class DatabaseController:
         
         return self.execute_query(sql, params)
     
+    def read_currency_page(self, after_id: Optional[int] = None, limit: int = 50,
+                           char_code: Optional[str] = None, query: Optional[str] = None,
+                           fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Получить страницу валют (курсорная пагинация по ID).
+        
+        Фильтры, выбор столбцов и ограничение размера выполняются в SQL:
+        начало страницы находится по первичному ключу (id > ?), точный
+        код - по индексу idx_currency_char_code.
+        
+        Args:
+            after_id: ID последней валюты предыдущей страницы (None - с начала)
+            limit: Размер страницы
+            char_code: Точный символьный код
+            query: Подстрока для поиска в коде и названии
+            fields: Столбцы для выборки (None - все столбцы)
+        
+        Returns:
+            (валюты страницы, ID для следующей страницы или None)
+        
+        Raises:
+            ValueError: Если запрошен неизвестный столбец
+        """
+        columns = list(fields) if fields else list(CURRENCY_COLUMNS)
+        unknown = [c for c in columns if c not in CURRENCY_COLUMNS]
+        if unknown:
+            raise ValueError(f"Неизвестные поля: {', '.join(unknown)}")
+        # ID нужен для курсора, даже если он не запрошен
+        select_columns = columns if 'id' in columns else ['id'] + columns
+        
+        conditions = []
+        params: List[Any] = []
+        if after_id is not None:
+            conditions.append("id > ?")
+            params.append(after_id)
+        if char_code:
+            conditions.append("char_code = ?")
+            params.append(char_code.upper())
+        if query:
+            pattern = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions.append("(char_code LIKE ? ESCAPE '\\' OR name LIKE ? ESCAPE '\\')")
+            params.extend([pattern, pattern])
+        
+        sql = f"SELECT {', '.join(select_columns)} FROM currency"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        # Запрашиваем на одну запись больше, чтобы узнать, есть ли следующая страница
+        sql += " ORDER BY id LIMIT ?"
+        params.append(limit + 1)
+        
+        rows = self.execute_query(sql, tuple(params))
+        
+        next_id = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_id = rows[-1]['id']
+        
+        if 'id' not in columns:
+            for row in rows:
+                del row['id']
+        
+        return rows, next_id
+    
     def read_currency_by_char_code(self, char_code: str) -> Optional[Dict[str, Any]]:
         """
         Получить информацию о валюте по символьному коду.
@@ -297,11 +519,11 @@ class DatabaseController:
         try:
             sql = """
             UPDATE currency 
-            SET value = ?, updated_at = ?
+            SET value_units = ?, updated_at = ?
             WHERE char_code = ?
             """
             
-            params = (value, datetime.now(), char_code)
+            params = (parse_scaled(value), datetime.now(), char_code)
             cursor = self.connection.cursor()
             cursor.execute(sql, params)
             self.connection.commit()
@@ -324,6 +546,10 @@ class DatabaseController:
         if not kwargs:
             return False
         
+        # Курс хранится в столбце value_units (value только для чтения)
+        if 'value' in kwargs:
+            kwargs['value_units'] = parse_scaled(kwargs.pop('value'))
+        
         set_clause = ", ".join([f"{key} = ?" for key in kwargs.keys()])
         sql = f"UPDATE currency SET {set_clause}, updated_at = ? WHERE id = ?"
         
@@ -340,6 +566,92 @@ class DatabaseController:
         except sqlite3.Error:
             return False
     
+    def sync_currencies(self, currencies: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Синхронизировать таблицу валют со снимком курсов из API.
+        
+        Снимок сравнивается с сохраненными значениями (курсы - как целые
+        value_units, без погрешности float), и только новые или
+        изменившиеся валюты записываются одним пакетным
+        INSERT ... ON CONFLICT(char_code) DO UPDATE в одной транзакции.
+        Валюты, отсутствующие в снимке, не удаляются.
+        
+        Args:
+            currencies: Записи вида get_all_currencies() (char_code,
+                        num_code, name, value, nominal) или parse_snapshot()
+                        (value_units вместо value)
+        
+        Returns:
+            Словарь с количеством добавленных (inserted), обновленных
+            (updated), неизменных (unchanged) и пропущенных некорректных
+            (skipped) валют, кодами измененных валют (changed) и временем
+            синхронизации в миллисекундах (elapsed_ms)
+        
+        Raises:
+            sqlite3.Error: При ошибке записи (транзакция откатывается)
+        """
+        start = time.perf_counter()
+        
+        stored = {
+            row[0]: tuple(row[1:])
+            for row in self.connection.execute(
+                "SELECT char_code, num_code, name, value_units, nominal FROM currency"
+            )
+        }
+        
+        # Одна отметка времени на весь снимок
+        updated_at = datetime.now()
+        rows = {}
+        inserted = updated = unchanged = skipped = 0
+        for currency in currencies:
+            try:
+                char_code = currency['char_code']
+                values = (
+                    str(currency.get('num_code', '')),
+                    currency.get('name', ''),
+                    currency['value_units'] if 'value_units' in currency
+                    else parse_scaled(currency['value']),
+                    int(currency.get('nominal', 1))
+                )
+            except (KeyError, TypeError, ValueError):
+                skipped += 1
+                continue
+            
+            if not char_code or values[2] <= 0 or values[3] <= 0:
+                skipped += 1
+                continue
+            
+            current = stored.get(char_code)
+            if current == values:
+                unchanged += 1
+                continue
+            
+            if char_code not in rows:
+                if current is None:
+                    inserted += 1
+                else:
+                    updated += 1
+            rows[char_code] = (values[0], char_code, values[1], values[2], values[3], updated_at)
+        
+        if rows:
+            try:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(CURRENCY_UPSERT_SQL, rows.values())
+                self.connection.commit()
+            except sqlite3.Error:
+                self.connection.rollback()
+                logger.exception("Ошибка синхронизации валют")
+                raise
+        
+        return {
+            'inserted': inserted,
+            'updated': updated,
+            'unchanged': unchanged,
+            'skipped': skipped,
+            'changed': list(rows),
+            'elapsed_ms': (time.perf_counter() - start) * 1000
+        }
+    
     def delete_currency(self, currency_id: int) -> bool:
         """
         Удалить валюту.
@@ -389,29 +701,63 @@ class DatabaseController:
         Returns:
             Список словарей с информацией о пользователях
         """
+        # Количество подписок хранится в user.subscription_count (триггеры)
         if user_id:
-            sql = """
-            SELECT u.*, 
-                   COUNT(uc.id) as subscription_count
-            FROM user u
-            LEFT JOIN user_currency uc ON u.id = uc.user_id
-            WHERE u.id = ?
-            GROUP BY u.id
-            """
+            sql = "SELECT id, name, created_at, subscription_count FROM user WHERE id = ?"
             params = (user_id,)
         else:
             sql = """
-            SELECT u.*, 
-                   COUNT(uc.id) as subscription_count
-            FROM user u
-            LEFT JOIN user_currency uc ON u.id = uc.user_id
-            GROUP BY u.id
-            ORDER BY u.name
+            SELECT id, name, created_at, subscription_count
+            FROM user
+            ORDER BY name, id
             """
             params = ()
         
         return self.execute_query(sql, params)
     
+    def read_user_page(self, after: Optional[Tuple[str, int]] = None,
+                       limit: int = 50) -> Tuple[List[Dict[str, Any]], Optional[Tuple[str, int]]]:
+        """
+        Получить страницу пользователей, упорядоченных по имени (keyset-пагинация).
+        
+        Запрос читает только индекс idx_user_name: начало страницы находится
+        по ключу (name, id), поэтому время не зависит от числа пользователей
+        и номера страницы.
+        
+        Args:
+            after: Ключ (имя, ID) последнего пользователя предыдущей страницы
+            limit: Размер страницы
+        
+        Returns:
+            (пользователи страницы, ключ для следующей страницы или None)
+        """
+        if after is not None:
+            sql = """
+            SELECT id, name, created_at, subscription_count
+            FROM user
+            WHERE (name, id) > (?, ?)
+            ORDER BY name, id
+            LIMIT ?
+            """
+            params = (after[0], after[1], limit + 1)
+        else:
+            sql = """
+            SELECT id, name, created_at, subscription_count
+            FROM user
+            ORDER BY name, id
+            LIMIT ?
+            """
+            params = (limit + 1,)
+        
+        rows = self.execute_query(sql, params)
+        
+        next_key = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_key = (rows[-1]['name'], rows[-1]['id'])
+        
+        return rows, next_key
+    
     def update_user(self, user_id: int, name: str) -> bool:
         """
         Обновить информацию о пользователе.
@@ -527,6 +873,153 @@ class DatabaseController:
         
         return self.execute_query(sql, (user_id,))
     
+    def import_subscriptions(self, subscriptions: Iterable[Tuple[int, int]],
+                             batch_size: int = 10000, defer_indexes: bool = False) -> int:
+        """
+        Массово импортировать подписки одной транзакцией.
+        
+        Строки вставляются пачками через executemany с INSERT OR IGNORE:
+        существующие подписки и ссылки на несуществующих пользователей или
+        валюты пропускаются. При ошибке импорт откатывается целиком.
+        
+        Args:
+            subscriptions: Пары (user_id, currency_id), в том числе генератор
+            batch_size: Количество строк в одном вызове executemany
+            defer_indexes: Удалить вторичные индексы и триггеры счетчика подписок
+                           на время импорта и перестроить их в конце (быстрее
+                           для импорта, сравнимого по размеру с таблицей)
+        
+        Returns:
+            Количество добавленных подписок
+        """
+        sql = """
+        INSERT OR IGNORE INTO user_currency (user_id, currency_id)
+        SELECT ?1, ?2
+        WHERE EXISTS (SELECT 1 FROM user WHERE id = ?1)
+          AND EXISTS (SELECT 1 FROM currency WHERE id = ?2)
+        """
+        
+        rows = iter(subscriptions)
+        inserted = 0
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("BEGIN")
+            if defer_indexes:
+                for index_name in USER_CURRENCY_INDEXES:
+                    cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                for trigger_name in ('trg_user_currency_insert', 'trg_user_currency_delete',
+                                     'trg_user_currency_update'):
+                    cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+            
+            while True:
+                batch = list(islice(rows, batch_size))
+                if not batch:
+                    break
+                cursor.executemany(sql, batch)
+                inserted += cursor.rowcount
+            
+            if defer_indexes:
+                for create_sql in USER_CURRENCY_INDEXES.values():
+                    cursor.execute(create_sql)
+                # Счетчики пересчитываются один раз вместо обновления на каждую строку
+                cursor.execute("""
+                    UPDATE user SET subscription_count = (
+                        SELECT COUNT(*) FROM user_currency uc WHERE uc.user_id = user.id
+                    )
+                """)
+                for statement in USER_SUBSCRIPTION_COUNT_SQL:
+                    cursor.execute(statement)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        
+        return inserted
+    
+    def import_subscriptions_csv(self, stream: TextIO, **kwargs) -> int:
+        """
+        Импортировать подписки из CSV (столбцы user_id, currency_id).
+        
+        Строка заголовка, если она есть, пропускается. Файл читается
+        потоково и не загружается в память целиком.
+        
+        Args:
+            stream: Текстовый поток с CSV
+            **kwargs: Параметры import_subscriptions (batch_size, defer_indexes)
+        
+        Returns:
+            Количество добавленных подписок
+        
+        Raises:
+            ValueError: Если строка CSV некорректна
+        """
+        def parse_rows() -> Iterator[Tuple[int, int]]:
+            for line_number, row in enumerate(csv.reader(stream), start=1):
+                if not row:
+                    continue
+                if line_number == 1 and not row[0].strip().isdigit():
+                    continue
+                try:
+                    yield int(row[0]), int(row[1])
+                except (IndexError, ValueError) as e:
+                    raise ValueError(f"Некорректная строка CSV {line_number}: {row}") from e
+        
+        return self.import_subscriptions(parse_rows(), **kwargs)
+    
+    def export_subscriptions(self, batch_size: int = 10000) -> Iterator[Dict[str, Any]]:
+        """
+        Потоково выгрузить все подписки.
+        
+        Подписки читаются пачками по первичному ключу (id > ?), поэтому в
+        памяти находится не больше batch_size строк.
+        
+        Args:
+            batch_size: Количество строк в одном запросе
+        
+        Yields:
+            Словари с полями user_id, currency_id, created_at
+        """
+        sql = """
+        SELECT id, user_id, currency_id, created_at
+        FROM user_currency
+        WHERE id > ?
+        ORDER BY id
+        LIMIT ?
+        """
+        last_id = 0
+        while True:
+            rows = self.connection.execute(sql, (last_id, batch_size)).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield {
+                    'user_id': row['user_id'],
+                    'currency_id': row['currency_id'],
+                    'created_at': row['created_at']
+                }
+            last_id = rows[-1]['id']
+    
+    def export_subscriptions_csv(self, stream: TextIO, batch_size: int = 10000) -> int:
+        """
+        Выгрузить все подписки в CSV.
+        
+        Args:
+            stream: Текстовый поток для записи
+            batch_size: Количество строк в одном запросе
+        
+        Returns:
+            Количество выгруженных подписок
+        """
+        writer = csv.writer(stream)
+        writer.writerow(['user_id', 'currency_id', 'created_at'])
+        
+        count = 0
+        for subscription in self.export_subscriptions(batch_size):
+            writer.writerow([subscription['user_id'], subscription['currency_id'],
+                             subscription['created_at']])
+            count += 1
+        return count
+    
     def get_app_info(self) -> Dict[str, Any]:
         """
         Получить информацию о приложении и авторе.
@@ -581,7 +1074,7 @@ class DatabaseController:
         """Закрыть соединение с базой данных."""
         if self.connection:
             self.connection.close()
-            print("✅ Соединение с базой данных закрыто")
+            logger.debug("Соединение с базой данных закрыто: %s", self.db_path)
     
     def __enter__(self):
         """Контекстный менеджер для использования with."""
@@ -598,14 +1091,33 @@ class CurrencyRatesCRUD:
     Реализует интерфейс, совместимый с примером из задания.
     """
     
-    def __init__(self, db_controller: DatabaseController):
+    def __init__(self, db_controller: DatabaseController, cache: Optional[ReadCache] = None):
         """
         Инициализация контроллера курсов валют.
         
         Args:
             db_controller: Контроллер базы данных
+            cache: Кэш результатов чтения (по умолчанию создается новый)
         """
         self.db = db_controller
+        self.cache = cache or ReadCache()
+        # Версия данных о валютах: увеличивается при каждом изменении,
+        # по ней сбрасываются кэши отрендеренных страниц
+        self.version = 0
+    
+    def _changed(self) -> None:
+        """Отметить изменение данных о валютах и сбросить кэш чтения."""
+        self.version += 1
+        self.cache.invalidate()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Получить статистику кэша чтения.
+        
+        Returns:
+            Словарь со статистикой кэша (попадания, промахи, hit_rate)
+        """
+        return self.cache.get_stats()
     
     def _create(self, currencies: List[Dict[str, Any]]) -> bool:
         """
@@ -626,6 +1138,7 @@ class CurrencyRatesCRUD:
                     value=currency.get('value', 0.0),
                     nominal=currency.get('nominal', 1)
                 )
+                self._changed()
             return True
         except Exception:
             return False
@@ -634,6 +1147,9 @@ class CurrencyRatesCRUD:
         """
         Прочитать информацию о валюте(ах).
         
+        Результат берется из кэша, а при промахе читается из базы данных.
+        Вызывающий код получает копии записей и может их изменять.
+        
         Args:
             char_code: Символьный код валюты (если None - все валюты)
         
@@ -641,10 +1157,43 @@ class CurrencyRatesCRUD:
             Список словарей с информацией о валютах
         """
         if char_code:
-            currency = self.db.read_currency_by_char_code(char_code)
-            return [currency] if currency else []
+            rows = self.cache.get_or_load(('char_code', char_code), lambda: self._load(char_code))
         else:
-            return self.db.read_currency()
+            rows = self.cache.get_or_load(('all',), lambda: self._load(None))
+        return [dict(row) for row in rows]
+    
+    def _load(self, char_code: Optional[str]) -> Tuple[Dict[str, Any], ...]:
+        """
+        Прочитать валюту(ы) из базы данных в обход кэша.
+        
+        Args:
+            char_code: Символьный код валюты (если None - все валюты)
+        
+        Returns:
+            Кортеж словарей с информацией о валютах
+        """
+        if char_code:
+            currency = self.db.read_currency_by_char_code(char_code)
+            return (currency,) if currency else ()
+        return tuple(self.db.read_currency(None))
+    
+    def _read_page(self, after_id: Optional[int] = None, limit: int = 50,
+                   char_code: Optional[str] = None, query: Optional[str] = None,
+                   fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Прочитать страницу валют.
+        
+        Args:
+            after_id: ID последней валюты предыдущей страницы
+            limit: Размер страницы
+            char_code: Точный символьный код
+            query: Подстрока для поиска в коде и названии
+            fields: Столбцы для выборки
+        
+        Returns:
+            (валюты страницы, ID для следующей страницы или None)
+        """
+        return self.db.read_currency_page(after_id, limit, char_code, query, fields)
     
     def _update(self, rates: Dict[str, float]) -> bool:
         """
@@ -659,12 +1208,29 @@ class CurrencyRatesCRUD:
         try:
             success = True
             for char_code, value in rates.items():
-                if not self.db.update_currency_value(char_code, value):
+                if self.db.update_currency_value(char_code, value):
+                    self._changed()
+                else:
                     success = False
             return success
         except Exception:
             return False
     
+    def _sync(self, currencies: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Синхронизировать валюты со снимком курсов из API.
+        
+        Args:
+            currencies: Записи вида get_all_currencies()
+        
+        Returns:
+            Отчет о синхронизации (см. DatabaseController.sync_currencies)
+        """
+        report = self.db.sync_currencies(currencies)
+        if report['changed']:
+            self._changed()
+        return report
+    
     def _delete(self, currency_id: int) -> bool:
         """
         Удалить валюту.
@@ -675,4 +1241,7 @@ class CurrencyRatesCRUD:
         Returns:
             True если удаление успешно, False в противном случае
         """
-        return self.db.delete_currency(currency_id)
\ No newline at end of file
+        deleted = self.db.delete_currency(currency_id)
+        if deleted:
+            self._changed()
+        return deleted
\ No newline at end of file
@@ -2,28 +2,51 @@
 Контроллер для рендеринга HTML страниц через Jinja2.
 """
 
-from typing import Dict, Any, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from html import escape
+from typing import Dict, Any, Optional, Callable, Tuple
 from controllers.databasecontroller import DatabaseController
 from controllers.currencycontroller import CurrencyController
+from utils.templates import create_environment, warm_up, resolve_template
+from utils.render_cache import RenderCache
+from utils.pagination import encode_cursor
+from markupsafe import Markup
 
 
 class PagesController:
     """Контроллер для рендеринга страниц."""
     
-    def __init__(self, template_dir: str = "templates"):
+    def __init__(self, template_dir: str = "templates",
+                 static_url: Optional[Callable[[str], str]] = None,
+                 bytecode_cache_dir: Optional[str] = None,
+                 auto_reload: bool = True,
+                 render_cache: Optional[RenderCache] = None):
         """
         Инициализация контроллера страниц.
         
         Args:
             template_dir: Директория с шаблонами
+            static_url: Функция построения адреса статического файла
+                        (по умолчанию - адрес без отпечатка)
+            bytecode_cache_dir: Директория кэша байт-кода шаблонов (None - без кэша)
+            auto_reload: Проверять ли изменение файлов шаблонов при каждом обращении
+            render_cache: Кэш отрендеренных страниц (по умолчанию создается новый)
         """
-        self.env = Environment(
-            loader=FileSystemLoader(template_dir),
-            autoescape=select_autoescape(['html', 'xml']),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        self.env = create_environment(template_dir, bytecode_cache_dir, auto_reload)
+        self.env.globals['static_url'] = static_url or (lambda path: f"/static/{path}")
+        
+        # Шаблон страницы ошибки ищется один раз (None - шаблона нет)
+        self.error_template = resolve_template(self.env, 'error.html')
+        
+        self.render_cache = render_cache or RenderCache()
+    
+    def warm_up(self) -> int:
+        """
+        Заранее скомпилировать все шаблоны.
+        
+        Returns:
+            Количество загруженных шаблонов
+        """
+        return warm_up(self.env)
     
     def render_index(self, db: DatabaseController) -> str:
         """
@@ -65,6 +88,9 @@ class PagesController:
         """
         Рендерить страницу со списком валют.
         
+        Готовая страница берется из кэша, пока не изменилась версия
+        данных о валютах (CurrencyRatesCRUD.version).
+        
         Args:
             db: Контроллер базы данных
             currency_controller: Контроллер валют
@@ -72,6 +98,14 @@ class PagesController:
         Returns:
             HTML содержимое страницы
         """
+        return self.render_cache.get_or_render(
+            ('currencies', currency_controller.db.version),
+            lambda: self._render_currencies(db, currency_controller)
+        )
+    
+    def _render_currencies(self, db: DatabaseController,
+                           currency_controller: CurrencyController) -> str:
+        """Отрендерить страницу со списком валют без кэша."""
         template = self.env.get_template('currencies.html')
         
         # Получаем все валюты
@@ -83,8 +117,13 @@ class PagesController:
         # Получаем информацию о приложении
         app_info = db.get_app_info()
         
+        currency_list = self.env.get_template('currency_list.html').render(
+            currencies=currencies
+        )
+        
         context = {
             'currencies': currencies,
+            'currency_list': Markup(currency_list),
             'stats': stats,
             'app_name': app_info.get('app_name', 'Currency Tracker'),
             'app_version': app_info.get('app_version', '1.0.0'),
@@ -94,26 +133,30 @@ class PagesController:
         
         return template.render(**context)
     
-    def render_users(self, db: DatabaseController) -> str:
+    def render_users(self, db: DatabaseController, after: Optional[Tuple[str, int]] = None,
+                     limit: int = 50) -> str:
         """
         Рендерить страницу со списком пользователей.
         
         Args:
             db: Контроллер базы данных
+            after: Ключ (имя, ID) последнего пользователя предыдущей страницы
+            limit: Количество пользователей на странице
         
         Returns:
             HTML содержимое страницы
         """
         template = self.env.get_template('users.html')
         
-        # Получаем всех пользователей
-        users = db.read_user()
+        # Получаем одну страницу пользователей
+        users, next_key = db.read_user_page(after, limit)
         
         # Получаем информацию о приложении
         app_info = db.get_app_info()
         
         context = {
             'users': users,
+            'next_cursor': encode_cursor(list(next_key)) if next_key else None,
             'app_name': app_info.get('app_name', 'Currency Tracker'),
             'app_version': app_info.get('app_version', '1.0.0'),
             'author_name': app_info.get('author_name', 'Иван Иванов'),
@@ -140,11 +183,7 @@ class PagesController:
         
         if not users:
             # Пользователь не найден
-            error_template = self.env.get_template('error.html')
-            return error_template.render(
-                error_code=404,
-                error_message="Пользователь не найден"
-            )
+            return self.render_error(404, "Пользователь не найден")
         
         user = users[0]
         
@@ -204,11 +243,12 @@ class PagesController:
         Returns:
             HTML содержимое страницы
         """
-        template = self.env.get_template('error.html')
+        if self.error_template is None:
+            return f"<h1>Ошибка {error_code}</h1><p>{escape(error_message)}</p>"
         
         context = {
             'error_code': error_code,
             'error_message': error_message
         }
         
-        return template.render(**context)
\ No newline at end of file
+        return self.error_template.render(**context)
\ No newline at end of file
@@ -3,14 +3,26 @@
 """
 
 import sqlite3
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs, unquote
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from datetime import datetime
 import json
 
-from controllers.databasecontroller import DatabaseController, CurrencyRatesCRUD
+from controllers.databasecontroller import DatabaseController, CurrencyRatesCRUD, CURRENCY_COLUMNS
 from controllers.currencycontroller import CurrencyController
 from controllers.pages import PagesController
+from utils.compression import compress_response
+from utils.static_assets import StaticAssetStore
+from utils.router import Router
+from utils.render_cache import RenderCache
+from utils.read_cache import ReadCache
+from utils.events import EventBroadcaster, PeriodicTask
+from utils.currencies_api import get_all_currencies
+from utils.pagination import decode_cursor, encode_cursor, parse_fields, parse_limit
+from config import current_config as config
 
 
 class CurrencyApp(BaseHTTPRequestHandler):
@@ -22,108 +34,174 @@ class CurrencyApp(BaseHTTPRequestHandler):
     currency_controller = None
     pages_controller = None
     
+    static_assets = None
+    
+    # Поток изменений курсов для клиентов (Server-Sent Events)
+    rate_events = EventBroadcaster()
+    
+    # Обычные запросы выполняются по одному (соединение с БД общее);
+    # потоки событий работают параллельно и блокировку не держат
+    request_lock = threading.Lock()
+    streaming_handlers = frozenset({'handle_rates_stream'})
+    # Обработчики, которые берут блокировку сами: запрос к API ЦБ РФ
+    # выполняется без нее, под блокировкой - только запись в базу
+    self_locking_handlers = frozenset({'handle_currency_sync'})
+    
+    # Таблица маршрутов: (метод, шаблон пути, имя обработчика).
+    # Обработчик получает параметры строки запроса и параметры пути.
+    router = Router.from_table([
+        ('GET', '/', 'handle_index'),
+        ('GET', '/author', 'handle_author'),
+        ('GET', '/users', 'handle_users'),
+        ('GET', '/user', 'handle_user'),
+        ('GET', '/currencies', 'handle_currencies'),
+        ('GET', '/currency/delete', 'handle_currency_delete'),
+        ('GET', '/currency/update', 'handle_currency_update'),
+        ('GET', '/currency/show', 'handle_currency_show'),
+        ('GET', '/currency/sync', 'handle_currency_sync'),
+        ('GET', '/static/{path:path}', 'handle_static'),
+        ('GET', '/api/rates/stream', 'handle_rates_stream'),
+        ('GET', '/api/stats/cache', 'handle_cache_stats'),
+    ])
+    
     @classmethod
     def init_controllers(cls):
         """Инициализировать контроллеры приложения."""
         # Создаем контроллер базы данных (в памяти)
         cls.db_controller = DatabaseController(":memory:")
+        cls.db_controller.seed()
         
         # Создаем CRUD контроллер для валют
-        cls.currency_crud = CurrencyRatesCRUD(cls.db_controller)
+        cls.currency_crud = CurrencyRatesCRUD(cls.db_controller, ReadCache(
+            max_entries=config.READ_CACHE_MAX_ENTRIES if config.CACHE_ENABLED else 0,
+            ttl=config.CACHE_TTL
+        ))
         
         # Создаем контроллер бизнес-логики для валют
         cls.currency_controller = CurrencyController(cls.currency_crud)
         
+        # Читаем, сжимаем и снабжаем отпечатками статические файлы один раз
+        cls.static_assets = StaticAssetStore(
+            config.STATIC_DIR,
+            memory_limit=config.STATIC_MEMORY_LIMIT,
+            compress_assets=config.COMPRESSION_ENABLED,
+            compression_min_size=config.COMPRESSION_MIN_SIZE,
+            compression_level=config.STATIC_COMPRESSION_LEVEL,
+            max_age=config.STATIC_MAX_AGE
+        )
+        cls.static_assets.load()
+        
         # Создаем контроллер для рендеринга страниц
-        cls.pages_controller = PagesController("templates")
+        # (шаблоны компилируются заранее, байт-код кэшируется на диске)
+        cls.pages_controller = PagesController(
+            config.TEMPLATE_DIR,
+            cls.static_assets.url_for,
+            bytecode_cache_dir=config.TEMPLATE_BYTECODE_CACHE_DIR,
+            auto_reload=config.TEMPLATE_AUTO_RELOAD,
+            render_cache=RenderCache(max_entries=config.RENDER_CACHE_MAX_ENTRIES)
+        )
+        cls.pages_controller.warm_up()
     
     def do_GET(self):
         """Обработать GET запрос."""
+        self.handle_request('GET')
+    
+    def do_POST(self):
+        """Обработать POST запрос."""
+        self.handle_request('POST')
+    
+    def do_PUT(self):
+        """Обработать PUT запрос."""
+        self.handle_request('PUT')
+    
+    def do_DELETE(self):
+        """Обработать DELETE запрос."""
+        self.handle_request('DELETE')
+    
+    def handle_request(self, method: str):
+        """
+        Передать запрос обработчику из таблицы маршрутов.
+        
+        Args:
+            method: HTTP-метод запроса
+        """
         parsed_url = urlparse(self.path)
         path = parsed_url.path
         query_params = parse_qs(parsed_url.query)
         
         # Маршрутизация
-        if path == '/':
-            self.handle_index()
-        elif path == '/author':
-            self.handle_author()
-        elif path == '/users':
-            self.handle_users()
-        elif path == '/user':
-            self.handle_user(query_params)
-        elif path == '/currencies':
-            self.handle_currencies()
-        elif path == '/currency/delete':
-            self.handle_currency_delete(query_params)
-        elif path == '/currency/update':
-            self.handle_currency_update(query_params)
-        elif path == '/currency/show':
-            self.handle_currency_show()
-        elif path.startswith('/static/'):
-            self.handle_static(path)
-        else:
-            self.handle_404()
+        match = self.router.match(method, path)
+        if match is not None and (match.handler in self.streaming_handlers
+                                  or match.handler in self.self_locking_handlers):
+            getattr(self, match.handler)(query_params, *match.params.values())
+            return
+        
+        allowed = self.router.allowed_methods(path) if match is None else None
+        with self.request_lock:
+            if match is not None:
+                getattr(self, match.handler)(query_params, *match.params.values())
+            elif allowed:
+                self.handle_405(allowed)
+            else:
+                self.handle_404()
     
-    def handle_index(self):
+    def handle_index(self, query_params: Dict[str, list]):
         """Обработать главную страницу."""
         html_content = self.pages_controller.render_index(self.db_controller)
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.send_html_response(200, html_content)
     
-    def handle_author(self):
+    def handle_author(self, query_params: Dict[str, list]):
         """Обработать страницу об авторе."""
         html_content = self.pages_controller.render_author(self.db_controller)
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.send_html_response(200, html_content)
     
-    def handle_users(self):
-        """Обработать страницу пользователей."""
-        html_content = self.pages_controller.render_users(self.db_controller)
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+    def handle_users(self, query_params: Dict[str, list]):
+        """Обработать страницу пользователей (?cursor= - следующая страница)."""
+        try:
+            after = decode_cursor(query_params.get('cursor', [None])[0])
+            if after is not None:
+                name, user_id = after
+                if type(name) is not str or type(user_id) is not int:
+                    raise ValueError("Некорректный курсор")
+                after = (name, user_id)
+        except (ValueError, TypeError) as e:
+            self.handle_error(400, str(e))
+            return
+        
+        html_content = self.pages_controller.render_users(
+            self.db_controller, after, config.USERS_PAGE_SIZE
+        )
+        self.send_html_response(200, html_content)
     
     def handle_user(self, query_params: Dict[str, list]):
         """Обработать страницу конкретного пользователя."""
         user_id = query_params.get('id', [None])[0]
         
         if user_id is None:
-            self.send_error(400, "Не указан ID пользователя")
+            self.handle_error(400, "Не указан ID пользователя")
             return
         
         try:
             user_id = int(user_id)
             html_content = self.pages_controller.render_user(self.db_controller, user_id)
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html; charset=utf-8')
-            self.end_headers()
-            self.wfile.write(html_content.encode('utf-8'))
+            self.send_html_response(200, html_content)
         except ValueError:
-            self.send_error(400, "Неверный формат ID пользователя")
+            self.handle_error(400, "Неверный формат ID пользователя")
     
-    def handle_currencies(self):
+    def handle_currencies(self, query_params: Dict[str, list]):
         """Обработать страницу валют."""
         html_content = self.pages_controller.render_currencies(
             self.db_controller, 
             self.currency_controller
         )
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.send_html_response(200, html_content)
     
     def handle_currency_delete(self, query_params: Dict[str, list]):
         """Обработать удаление валюты."""
         currency_id = query_params.get('id', [None])[0]
         
         if currency_id is None:
-            self.send_error(400, "Не указан ID валюты")
+            self.handle_error(400, "Не указан ID валюты")
             return
         
         try:
@@ -138,10 +216,10 @@ class CurrencyApp(BaseHTTPRequestHandler):
                 self.send_header('Location', '/currencies')
                 self.end_headers()
             else:
-                self.send_error(404, "Валюта не найдена")
+                self.handle_error(404, "Валюта не найдена")
                 
         except ValueError:
-            self.send_error(400, "Неверный формат ID валюты")
+            self.handle_error(400, "Неверный формат ID валюты")
     
     def handle_currency_update(self, query_params: Dict[str, list]):
         """Обработать обновление курса валюты."""
@@ -156,95 +234,223 @@ class CurrencyApp(BaseHTTPRequestHandler):
                     continue
         
         if not updates:
-            self.send_error(400, "Не указаны курсы для обновления")
+            self.handle_error(400, "Не указаны курсы для обновления")
             return
         
         # Обновляем курсы
         success = True
+        changed = {}
         for char_code, value in updates.items():
-            if not self.currency_controller.update_currency(char_code, value):
+            if self.currency_controller.update_currency(char_code, value):
+                currency = self.currency_controller.get_currency_by_char_code(char_code)
+                changed[char_code] = {'value': currency['value'], 'nominal': currency['nominal']}
+            else:
                 success = False
         
+        # Клиентам отправляются только изменившиеся курсы
+        if changed:
+            self.rate_events.publish('rates', {
+                'rates': changed,
+                'updated_at': datetime.now().isoformat()
+            })
+        
         if success:
             # Перенаправляем на страницу валют
             self.send_response(302)
             self.send_header('Location', '/currencies')
             self.end_headers()
         else:
-            self.send_error(400, "Ошибка обновления курсов")
+            self.handle_error(400, "Ошибка обновления курсов")
+    
+    def handle_currency_sync(self, query_params: Dict[str, list]):
+        """Синхронизировать курсы валют с API ЦБ РФ и вернуть отчет в JSON."""
+        try:
+            report = self.sync_rates()
+        except sqlite3.Error as e:
+            self.handle_error(500, f"Ошибка синхронизации курсов: {e}")
+            return
+        
+        json_response = json.dumps({'success': True, **report}, ensure_ascii=False, separators=(',', ':'))
+        self.send_body(200, 'application/json; charset=utf-8', json_response.encode('utf-8'))
+    
+    @classmethod
+    def sync_rates(cls) -> Dict[str, Any]:
+        """
+        Синхронизировать курсы с API ЦБ РФ и разослать изменившиеся.
+        
+        Снимок курсов загружается без request_lock; блокировка берется
+        только на запись в базу и рассылку события, поэтому вызывать
+        метод нужно без удержания request_lock.
+        
+        Returns:
+            Отчет синхронизации (см. CurrencyController.sync_currencies)
+        """
+        start = time.perf_counter()
+        snapshot = get_all_currencies(config.CURRENCY_API_URL)
+        fetch_ms = (time.perf_counter() - start) * 1000
+        
+        with cls.request_lock:
+            report = cls.currency_controller.sync_currencies(lambda: snapshot)
+            report['fetch_ms'] = fetch_ms
+            
+            # Клиентам отправляются только изменившиеся курсы
+            if report['changed']:
+                changed = set(report['changed'])
+                cls.rate_events.publish('rates', {
+                    'rates': {
+                        c['char_code']: {'value': c['value'], 'nominal': c['nominal']}
+                        for c in cls.currency_controller.list_currencies() if c['char_code'] in changed
+                    },
+                    'updated_at': datetime.now().isoformat()
+                })
+        return report
     
-    def handle_currency_show(self):
-        """Показать информацию о валютах в консоли (для отладки)."""
-        currencies = self.currency_controller.list_currencies()
+    def handle_rates_stream(self, query_params: Dict[str, list]):
+        """Отдать поток изменений курсов валют (Server-Sent Events)."""
+        self.rate_events.stream(
+            self,
+            keepalive_interval=config.SSE_KEEPALIVE_INTERVAL,
+            retry_ms=config.SSE_RETRY_MS
+        )
+    
+    def handle_currency_show(self, query_params: Dict[str, list]):
+        """
+        Показать страницу списка валют в JSON.
+        
+        Параметры: cursor, limit, fields, char_code (точный код),
+        q (поиск по коду и названию).
+        """
+        def param(name):
+            values = query_params.get(name)
+            return values[0] if values else None
+        
+        try:
+            after_id = decode_cursor(param('cursor'))
+            if after_id is not None and type(after_id) is not int:
+                raise ValueError("Некорректный курсор")
+            limit = parse_limit(param('limit'), config.API_PAGE_SIZE, config.API_MAX_PAGE_SIZE)
+            fields = parse_fields(param('fields'), CURRENCY_COLUMNS)
+        except ValueError as e:
+            # Ошибка отдается в JSON, как и успешный ответ
+            json_response = json.dumps({'success': False, 'message': str(e)}, ensure_ascii=False)
+            self.send_body(400, 'application/json; charset=utf-8', json_response.encode('utf-8'))
+            return
+        
+        currencies, next_id = self.currency_controller.list_currencies_page(
+            after_id, limit, param('char_code'), param('q'), fields
+        )
         
         response = {
             'success': True,
             'count': len(currencies),
-            'currencies': currencies
+            'currencies': currencies,
+            'next_cursor': encode_cursor(next_id) if next_id is not None else None
         }
         
-        json_response = json.dumps(response, ensure_ascii=False, indent=2)
+        json_response = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
+        self.send_body(200, 'application/json; charset=utf-8', json_response.encode('utf-8'))
+    
+    def handle_cache_stats(self, query_params: Dict[str, list]):
+        """Показать статистику кэшей чтения и отрендеренных страниц в JSON."""
+        response = {
+            'read_cache': self.currency_crud.get_cache_stats(),
+            'render_cache': self.pages_controller.render_cache.get_stats()
+        }
         
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json; charset=utf-8')
-        self.end_headers()
-        self.wfile.write(json_response.encode('utf-8'))
+        json_response = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
+        self.send_body(200, 'application/json; charset=utf-8', json_response.encode('utf-8'))
     
-    def handle_static(self, path: str):
+    def handle_static(self, query_params: Dict[str, list], path: str):
         """Обработать статические файлы."""
         try:
-            # Убираем /static/ из пути
-            file_path = unquote(path[7:])  # 7 = len('/static/')
+            # Путь уже без префикса /static/
+            file_path = unquote(path)
             
             # Защита от directory traversal
             if '..' in file_path or file_path.startswith('/'):
-                self.send_error(403, "Доступ запрещен")
+                self.handle_error(403, "Доступ запрещен")
                 return
             
-            # Определяем MIME тип
-            mime_types = {
-                '.css': 'text/css',
-                '.js': 'application/javascript',
-                '.png': 'image/png',
-                '.jpg': 'image/jpeg',
-                '.jpeg': 'image/jpeg',
-                '.gif': 'image/gif',
-                '.svg': 'image/svg+xml',
-                '.ico': 'image/x-icon'
-            }
-            
-            # Полный путь к файлу
-            full_path = f"static/{file_path}"
-            
-            # Читаем файл
-            with open(full_path, 'rb') as f:
-                content = f.read()
-            
-            # Определяем расширение
-            import os
-            _, ext = os.path.splitext(file_path)
-            content_type = mime_types.get(ext.lower(), 'application/octet-stream')
+            # Файлы подготовлены при старте - здесь только поиск в словаре
+            found = self.static_assets.lookup(file_path) if self.static_assets else None
+            if found is None:
+                self.handle_error(404, "Файл не найден")
+                return
             
-            self.send_response(200)
-            self.send_header('Content-type', content_type)
-            self.send_header('Content-Length', str(len(content)))
-            self.end_headers()
-            self.wfile.write(content)
+            asset, immutable = found
+            self.static_assets.send(self, asset, immutable)
             
-        except FileNotFoundError:
-            self.send_error(404, "Файл не найден")
         except Exception as e:
-            self.send_error(500, f"Ошибка сервера: {str(e)}")
+            self.handle_error(500, f"Ошибка сервера: {str(e)}")
+    
+    def handle_error(self, status_code: int, message: str):
+        """
+        Отправить страницу ошибки.
+        
+        send_error не подходит: текст ошибки он кодирует в latin-1, и на
+        русском сообщении падает с UnicodeEncodeError, не отправив ответ.
+        
+        Args:
+            status_code: HTTP статус
+            message: Сообщение об ошибке
+        """
+        html_content = self.pages_controller.render_error(status_code, message)
+        self.send_html_response(status_code, html_content)
     
     def handle_404(self):
         """Обработать 404 ошибку."""
         html_content = self.pages_controller.render_error(
             404, "Страница не найдена"
         )
-        self.send_response(404)
-        self.send_header('Content-type', 'text/html; charset=utf-8')
+        self.send_html_response(404, html_content)
+    
+    def handle_405(self, allowed: List[str]):
+        """
+        Обработать 405 ошибку (путь существует, но не для этого метода).
+        
+        Args:
+            allowed: Методы, зарегистрированные для пути (заголовок Allow)
+        """
+        html_content = self.pages_controller.render_error(
+            405, "Метод не поддерживается"
+        )
+        self.send_html_response(405, html_content, {'Allow': ', '.join(allowed)})
+    
+    def send_html_response(self, status_code: int, html_content: str,
+                           headers: Optional[Dict[str, str]] = None):
+        """Отправить HTML ответ."""
+        self.send_body(status_code, 'text/html; charset=utf-8', html_content.encode('utf-8'), headers)
+    
+    def send_body(self, status_code: int, content_type: str, body: bytes,
+                  headers: Optional[Dict[str, str]] = None):
+        """
+        Отправить тело ответа, сжимая его при поддержке клиентом.
+        
+        Args:
+            status_code: HTTP статус
+            content_type: Значение заголовка Content-type
+            body: Тело ответа
+            headers: Дополнительные заголовки ответа
+        """
+        encoding = None
+        if config.COMPRESSION_ENABLED:
+            body, encoding = compress_response(
+                body,
+                self.headers.get('Accept-Encoding'),
+                min_size=config.COMPRESSION_MIN_SIZE,
+                level=config.COMPRESSION_LEVEL
+            )
+        
+        self.send_response(status_code)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
-        self.wfile.write(html_content.encode('utf-8'))
+        self.wfile.write(body)
     
     def log_message(self, format, *args):
         """Логировать сообщения сервера."""
@@ -263,8 +469,19 @@ def run_server(host: str = "localhost", port: int = 8080):
     # Инициализируем контроллеры
     CurrencyApp.init_controllers()
     
+    # Курсы обновляются на сервере, клиенты получают изменения через
+    # /api/rates/stream и сами страницу не перезагружают
+    rate_refresher = PeriodicTask(
+        CurrencyApp.sync_rates,
+        config.CURRENCY_UPDATE_INTERVAL.total_seconds(),
+        name='rate-refresher'
+    )
+    rate_refresher.start()
+    
     server_address = (host, port)
-    httpd = HTTPServer(server_address, CurrencyApp)
+    # Каждое соединение обслуживается в своем потоке, чтобы потоки
+    # событий (/api/rates/stream) не блокировали остальные запросы
+    httpd = ThreadingHTTPServer(server_address, CurrencyApp)
     
     print("=" * 60)
     print(f"Сервер Currency Tracker запущен!")
@@ -279,11 +496,14 @@ def run_server(host: str = "localhost", port: int = 8080):
     print("  /currency/delete?id=... - Удаление валюты")
     print("  /currency/update?USD=... - Обновление курса")
     print("  /currency/show     - JSON с валютами (для отладки)")
+    print("  /api/rates/stream  - Поток изменений курсов (SSE)")
     print("=" * 60)
     
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
+        rate_refresher.stop()
+        CurrencyApp.rate_events.close()
         print("\nСервер остановлен")
         
         # Закрываем соединение с БД
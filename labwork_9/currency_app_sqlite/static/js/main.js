@@ -26,8 +26,11 @@ document.addEventListener('DOMContentLoaded', function() {
     // Настройка обработчиков событий
     setupEventListeners();
     
-    // Автоматическое обновление данных (каждые 5 минут)
-    startAutoRefresh();
+    // Курсы на странице обновляются через поток событий; если курсов на
+    // странице нет или браузер не поддерживает EventSource - автообновление
+    if (!startRateStream()) {
+        startAutoRefresh();
+    }
 });
 
 /**
@@ -226,6 +229,47 @@ function startAutoRefresh() {
     }, 300000);
 }
 
+/**
+ * Подписка на поток изменений курсов (Server-Sent Events).
+ * Возвращает true, если поток запущен
+ */
+function startRateStream() {
+    if (!window.EventSource || !document.querySelector('[data-rate]')) {
+        return false;
+    }
+    
+    // Одно соединение на страницу; при разрыве браузер переподключается сам
+    const source = new EventSource('/api/rates/stream');
+    source.addEventListener('rates', function(event) {
+        const data = JSON.parse(event.data);
+        applyRateChanges(data.rates);
+    });
+    
+    window.addEventListener('beforeunload', () => source.close());
+    return true;
+}
+
+/**
+ * Обновление изменившихся курсов на странице без перезагрузки
+ */
+function applyRateChanges(rates) {
+    const codes = Object.keys(rates);
+    
+    codes.forEach(charCode => {
+        const rate = rates[charCode];
+        document.querySelectorAll(`[data-rate="${charCode}"]`).forEach(element => {
+            element.textContent = rate.value;
+        });
+        document.querySelectorAll(`[data-rate-unit="${charCode}"]`).forEach(element => {
+            element.textContent = (rate.value / rate.nominal).toFixed(4);
+        });
+    });
+    
+    if (codes.length > 0) {
+        showNotification(`Курсы обновлены: ${codes.join(', ')}`, 'info');
+    }
+}
+
 /**
  * Показать уведомление
  */
@@ -3,6 +3,9 @@
 Используют unittest.mock для изоляции тестируемых компонентов.
 """
 
+import io
+import sqlite3
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch, Mock
 import sys
@@ -67,6 +70,17 @@ class TestCurrencyController(unittest.TestCase):
         self.assertIsNone(result)
         self.mock_db._read.assert_called_once()
     
+    def test_get_currency_by_char_code(self):
+        """Тест получения валюты по символьному коду."""
+        expected_currency = {"id": 1, "char_code": "USD", "value": 90.0}
+        self.mock_db._read.return_value = [expected_currency]
+        
+        self.assertEqual(self.controller.get_currency_by_char_code("USD"), expected_currency)
+        self.mock_db._read.assert_called_once_with("USD")
+        
+        self.mock_db._read.return_value = []
+        self.assertIsNone(self.controller.get_currency_by_char_code("XXX"))
+    
     def test_update_currency_success(self):
         """Тест успешного обновления курса валюты."""
         # Настраиваем mock
@@ -359,6 +373,199 @@ class TestDatabaseControllerIntegration(unittest.TestCase):
         self.assertIsInstance(stats["currency_count"], int)
         self.assertIsInstance(stats["subscription_count"], int)
     
+    def test_read_currency_page(self):
+        """Тест постраничного чтения валют с выбором полей."""
+        self.db.seed()
+        all_ids = [c["id"] for c in self.db.read_currency()]
+        
+        first, next_id = self.db.read_currency_page(limit=2, fields=("char_code",))
+        self.assertEqual(len(first), 2)
+        self.assertEqual(set(first[0]), {"char_code"})
+        self.assertEqual(next_id, sorted(all_ids)[1])
+        
+        # Все страницы вместе содержат каждую валюту ровно один раз
+        seen = [c["id"] for c in self.db.read_currency_page(limit=2)[0]]
+        while next_id is not None:
+            page, next_id = self.db.read_currency_page(after_id=next_id, limit=2)
+            seen.extend(c["id"] for c in page)
+        self.assertEqual(seen, sorted(all_ids))
+    
+    def test_read_currency_page_filters(self):
+        """Тест фильтров постраничного чтения."""
+        self.db.seed()
+        page, next_id = self.db.read_currency_page(char_code="usd")
+        self.assertEqual([c["char_code"] for c in page], ["USD"])
+        self.assertIsNone(next_id)
+        
+        page, _ = self.db.read_currency_page(query="%")
+        self.assertEqual(page, [])
+        
+        with self.assertRaises(ValueError):
+            self.db.read_currency_page(fields=("id; DROP TABLE currency",))
+    
+    def test_subscription_count_triggers(self):
+        """Тест поддержки счетчика подписок триггерами."""
+        self.db.seed()
+        user_id = self.db.create_user("Тестовый пользователь")
+        currency_ids = [c["id"] for c in self.db.read_currency()][:2]
+        
+        for currency_id in currency_ids:
+            self.db.subscribe_user(user_id, currency_id)
+        self.assertEqual(self.db.read_user(user_id)[0]["subscription_count"], 2)
+        
+        self.db.unsubscribe_user(user_id, currency_ids[0])
+        self.assertEqual(self.db.read_user(user_id)[0]["subscription_count"], 1)
+    
+    def test_read_user_page(self):
+        """Тест keyset-пагинации пользователей по имени."""
+        for name in ("Яков", "Борис", "Борис"):
+            self.db.create_user(name)
+        expected = [(u["name"], u["id"]) for u in self.db.read_user()]
+        
+        seen = []
+        after = None
+        while True:
+            page, after = self.db.read_user_page(after, limit=2)
+            self.assertLessEqual(len(page), 2)
+            seen.extend((u["name"], u["id"]) for u in page)
+            if after is None:
+                break
+        
+        self.assertEqual(seen, expected)
+        self.assertEqual(seen, sorted(seen))
+    
+    def test_import_and_export_subscriptions(self):
+        """Тест массового импорта и выгрузки подписок."""
+        self.db.seed()
+        user_id = self.db.create_user("Импорт")
+        currency_ids = [c["id"] for c in self.db.read_currency()]
+        
+        # Дубликаты и ссылки на несуществующие записи пропускаются
+        rows = [(user_id, cid) for cid in currency_ids] + [(user_id, currency_ids[0]), (10**6, currency_ids[0])]
+        inserted = self.db.import_subscriptions(rows, batch_size=2, defer_indexes=True)
+        self.assertEqual(inserted, len(currency_ids))
+        self.assertEqual(self.db.read_user(user_id)[0]["subscription_count"], len(currency_ids))
+        
+        exported = io.StringIO()
+        count = self.db.export_subscriptions_csv(exported, batch_size=2)
+        self.assertEqual(count, self.db.get_statistics()["subscription_count"])
+        
+        # Повторный импорт выгрузки ничего не добавляет
+        exported.seek(0)
+        self.assertEqual(self.db.import_subscriptions_csv(exported), 0)
+    
+    def test_sync_currencies(self):
+        """Тест синхронизации валют со снимком курсов из API."""
+        self.db.seed()
+        usd = self.db.read_currency_by_char_code("USD")
+        snapshot = [
+            {"char_code": "USD", "num_code": "840", "name": "Доллар США", "value": 93.25, "nominal": 1},
+            {"char_code": "EUR", "num_code": "978", "name": "Евро", "value": 99.5, "nominal": 1},
+            {"char_code": "AUD", "num_code": "036", "name": "Австралийский доллар", "value": 60.1, "nominal": 1},
+            {"char_code": "XXX", "num_code": "999", "name": "Без курса", "value": 0, "nominal": 1},
+            {"num_code": "000", "name": "Без кода"},
+        ]
+        
+        report = self.db.sync_currencies(snapshot)
+        
+        self.assertEqual((report["inserted"], report["updated"], report["unchanged"], report["skipped"]),
+                         (1, 1, 1, 2))
+        self.assertEqual(sorted(report["changed"]), ["AUD", "EUR"])
+        self.assertGreaterEqual(report["elapsed_ms"], 0)
+        self.assertEqual(self.db.read_currency_by_char_code("EUR")["value"], 99.5)
+        self.assertEqual(self.db.read_currency_by_char_code("AUD")["nominal"], 1)
+        # Неизменная валюта не перезаписывается, валюты вне снимка остаются
+        self.assertEqual(self.db.read_currency_by_char_code("USD"), usd)
+        self.assertIsNotNone(self.db.read_currency_by_char_code("JPY"))
+        
+        # Повторная синхронизация того же снимка ничего не меняет
+        report = self.db.sync_currencies(snapshot)
+        self.assertEqual((report["inserted"], report["updated"], report["unchanged"]), (0, 0, 3))
+    
+    def test_currency_value_units(self):
+        """Тест хранения курса целым числом с фиксированной точкой."""
+        currency_id = self.db.create_currency("036", "AUD", "Австралийский доллар", 60.1, 1)
+        self.db.update_currency(currency_id, value=60.12345)
+        
+        currency = self.db.read_currency(currency_id)[0]
+        self.assertEqual((currency["value_units"], currency["value"]), (601235, 60.1235))
+        
+        self.db.update_currency_value("AUD", 0.1 + 0.2)
+        self.assertEqual(self.db.read_currency_by_char_code("AUD")["value_units"], 3000)
+    
+    def test_seed_is_idempotent(self):
+        """Тест повторного заполнения начальными данными."""
+        self.assertEqual(self.db.read_currency(), [])
+        
+        self.assertTrue(self.db.seed())
+        stats = self.db.get_statistics()
+        self.assertEqual(stats["currency_count"], 5)
+        
+        self.assertFalse(self.db.seed())
+        self.assertEqual(self.db.get_statistics(), stats)
+    
+    def test_migrate(self):
+        """Тест версионирования схемы через PRAGMA user_version."""
+        from controllers.databasecontroller import DatabaseController, SCHEMA_VERSION
+        
+        version = self.db.connection.execute("PRAGMA user_version").fetchone()[0]
+        self.assertEqual(version, SCHEMA_VERSION)
+        
+        # Схема уже актуальна - миграции не применяются
+        self.assertEqual(self.db.migrate(), 0)
+        
+        # База версии 1 (без счетчика подписок, курс в REAL) догоняется до текущей
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "legacy.db")
+            legacy = sqlite3.connect(path)
+            legacy.executescript("""
+                CREATE TABLE user (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL,
+                                   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP);
+                CREATE TABLE user_currency (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                                            user_id INTEGER NOT NULL, currency_id INTEGER NOT NULL,
+                                            UNIQUE(user_id, currency_id));
+                CREATE TABLE currency (id INTEGER PRIMARY KEY AUTOINCREMENT, num_code TEXT NOT NULL,
+                                       char_code TEXT NOT NULL UNIQUE, name TEXT NOT NULL,
+                                       value REAL NOT NULL, nominal INTEGER NOT NULL,
+                                       updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                                       CHECK (value > 0), CHECK (nominal > 0));
+                INSERT INTO currency (num_code, char_code, name, value, nominal)
+                VALUES ('840', 'USD', 'Доллар США', 93.25, 1), ('392', 'JPY', 'Японская иена', 0.63, 100);
+                INSERT INTO user (name) VALUES ('Старый пользователь');
+                INSERT INTO user_currency (user_id, currency_id) VALUES (1, 1), (1, 2);
+                PRAGMA user_version = 1;
+            """)
+            legacy.close()
+            
+            db = DatabaseController(path)
+            try:
+                self.assertEqual(db.read_user(1)[0]["subscription_count"], 2)
+                db.connection.execute("DELETE FROM user_currency WHERE currency_id = 2")
+                self.assertEqual(db.read_user(1)[0]["subscription_count"], 1)
+                jpy = db.read_currency_by_char_code("JPY")
+                self.assertEqual((jpy["id"], jpy["value_units"], jpy["value"]), (2, 6300, 0.63))
+                version = db.connection.execute("PRAGMA user_version").fetchone()[0]
+                self.assertEqual(version, SCHEMA_VERSION)
+            finally:
+                db.close()
+            
+            # Схема новее приложения - открывать такую базу нельзя
+            newer = sqlite3.connect(path)
+            newer.execute(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+            newer.close()
+            with self.assertRaises(RuntimeError):
+                DatabaseController(path)
+    
+    def test_import_subscriptions_rollback(self):
+        """Тест отката импорта при ошибке в данных."""
+        user_id = self.db.create_user("Импорт")
+        before = self.db.get_statistics()["subscription_count"]
+        
+        with self.assertRaises(ValueError):
+            self.db.import_subscriptions_csv(io.StringIO(f"{user_id},1\n{user_id},abc\n"))
+        
+        self.assertEqual(self.db.get_statistics()["subscription_count"], before)
+    
     def tearDown(self):
         """Очистка после тестов."""
         self.db.close()
@@ -451,6 +658,62 @@ class TestCurrencyRatesCRUD(unittest.TestCase):
         # Проверяем результат
         self.assertTrue(result)
         self.mock_db.delete_currency.assert_called_once_with(1)
+    
+    def test_read_is_cached(self):
+        """Тест повторного чтения валюты из кэша."""
+        self.mock_db.read_currency_by_char_code.return_value = {"id": 1, "char_code": "USD", "value": 93.25}
+        
+        first = self.crud._read("USD")
+        first[0]["value"] = 0.0  # Изменение копии не портит кэш
+        second = self.crud._read("USD")
+        
+        self.assertEqual(second[0]["value"], 93.25)
+        self.mock_db.read_currency_by_char_code.assert_called_once_with("USD")
+        stats = self.crud.get_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+    
+    def test_write_invalidates_cache(self):
+        """Тест сброса кэша при изменении курсов."""
+        self.mock_db.read_currency.side_effect = [
+            [{"id": 1, "char_code": "USD", "value": 93.25}],
+            [{"id": 1, "char_code": "USD", "value": 95.0}]
+        ]
+        self.mock_db.update_currency_value.return_value = True
+        
+        self.assertEqual(self.crud._read()[0]["value"], 93.25)
+        self.crud._update({"USD": 95.0})
+        self.assertEqual(self.crud._read()[0]["value"], 95.0)
+        self.assertEqual(self.mock_db.read_currency.call_count, 2)
+    
+    def test_sync_invalidates_cache(self):
+        """Тест сброса кэша только при изменении данных синхронизацией."""
+        self.mock_db.sync_currencies.side_effect = [{"changed": []}, {"changed": ["USD"]}]
+        
+        self.crud._sync([])
+        self.assertEqual(self.crud.version, 0)
+        self.crud._sync([])
+        self.assertEqual(self.crud.version, 1)
+    
+    def test_cache_ttl(self):
+        """Тест устаревания записей кэша по времени."""
+        from controllers.databasecontroller import CurrencyRatesCRUD
+        from utils.read_cache import ReadCache
+        
+        now = [0.0]
+        crud = CurrencyRatesCRUD(self.mock_db, ReadCache(max_entries=1, ttl=10, clock=lambda: now[0]))
+        self.mock_db.read_currency_by_char_code.side_effect = lambda code: {"char_code": code}
+        
+        crud._read("USD")
+        now[0] = 5.0
+        crud._read("USD")
+        now[0] = 20.0
+        crud._read("USD")
+        crud._read("EUR")  # Вытесняет USD из кэша на одну запись
+        
+        stats = crud.get_cache_stats()
+        self.assertEqual(self.mock_db.read_currency_by_char_code.call_count, 3)
+        self.assertEqual((stats["hits"], stats["expired"], stats["evicted"]), (1, 1, 1))
 
 
 def run_tests():
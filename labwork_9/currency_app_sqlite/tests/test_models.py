@@ -268,6 +268,10 @@ class TestCurrencyModel(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.currency.value = -10.0
         
+        # Положительный курс, равный 0 при 4 знаках после запятой
+        with self.assertRaises(ValueError):
+            self.currency.value = 0.00001
+        
         # Можно передавать int
         self.currency.value = 100
         self.assertEqual(self.currency.value, 100.0)
@@ -1,14 +1,24 @@
 """
 Модуль для работы с API курсов валют ЦБ РФ.
 
-Содержит функцию get_currencies для получения актуальных курсов валют.
+Содержит функцию get_currencies для получения актуальных курсов валют,
+get_rate_units для получения курсов за номинал в целых числах с
+фиксированной точкой и parse_snapshot для быстрого разбора всего ответа
+API.
 """
 
 import json
 import requests
-from typing import Dict, List, Optional, Any
+from fractions import Fraction
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from decimal import Decimal, ROUND_HALF_UP
+
+from utils.fixed_point import (
+    RATE_SCALE,
+    parse_scaled,
+    parse_scaled_many,
+    unit_rate
+)
 
 
 def get_currencies(
@@ -17,7 +27,35 @@ def get_currencies(
     timeout: float = 10.0
 ) -> Dict[str, float]:
     """
-    Получить курсы валют от API ЦБ РФ.
+    Получить курсы валют за единицу от API ЦБ РФ.
+    
+    Курс за единицу не округляется до 4 знаков (см. unit_rate).
+    
+    Args:
+        currency_codes: Список кодов валют для получения (если None - все доступные)
+        url: URL API ЦБ РФ
+        timeout: Таймаут запроса в секундах
+    
+    Returns:
+        Словарь вида {'USD': 93.25, 'EUR': 101.7, 'VND': 0.00364812}
+    
+    Raises:
+        ConnectionError: Если API недоступен
+        ValueError: Если получен некорректный JSON
+        KeyError: Если отсутствует ключ 'Valute' или валюта
+        TypeError: Если курс валюты имеет неверный тип
+    """
+    rates = get_rate_units(currency_codes, url, timeout)
+    return {code: unit_rate(units, nominal) for code, (units, nominal) in rates.items()}
+
+
+def get_rate_units(
+    currency_codes: Optional[List[str]] = None,
+    url: str = "https://www.cbr-xml-daily.ru/daily_json.js",
+    timeout: float = 10.0
+) -> Dict[str, Tuple[int, int]]:
+    """
+    Получить курсы валют за номинал в целых числах с фиксированной точкой.
     
     Args:
         currency_codes: Список кодов валют для получения (если None - все доступные)
@@ -25,7 +63,8 @@ def get_currencies(
         timeout: Таймаут запроса в секундах
     
     Returns:
-        Словарь вида {'USD': 93.25, 'EUR': 101.7}
+        Словарь вида {'USD': (932500, 1), 'VND': (364812, 10000)}:
+        курс за номинал в десятитысячных долях рубля и номинал
     
     Raises:
         ConnectionError: Если API недоступен
@@ -67,23 +106,14 @@ def get_currencies(
                 raise KeyError(f"Ключ '{field}' отсутствует для валюты '{code}'")
         
         # Получаем и валидируем значение курса
-        value_str = str(currency_data['Value'])
         nominal = currency_data['Nominal']
         
         try:
-            # Преобразуем строку с запятой в число
-            value_str = value_str.replace(',', '.')
-            value = float(value_str)
-            
-            # Корректируем курс с учетом номинала
-            actual_value = value / nominal
-            
-            # Округляем до 4 знаков после запятой
-            actual_value = Decimal(str(actual_value)).quantize(
-                Decimal('0.0001'), rounding=ROUND_HALF_UP
-            )
-            
-            result[code] = float(actual_value)
+            if type(nominal) is not int or nominal <= 0:
+                raise ValueError(f"некорректный номинал {nominal!r}")
+            # Курс и номинал хранятся раздельно: деление на номинал с
+            # округлением до 4 знаков теряет точность у VND, KRW и т.п.
+            result[code] = (parse_scaled(currency_data['Value']), nominal)
             
         except (ValueError, TypeError) as e:
             raise TypeError(
@@ -159,6 +189,8 @@ def get_all_currencies(
         if 'Valute' not in data:
             return []
         
+        # Одна отметка времени на весь снимок
+        timestamp = datetime.now().isoformat()
         result = []
         for code, currency_data in data['Valute'].items():
             try:
@@ -168,9 +200,9 @@ def get_all_currencies(
                     'char_code': currency_data.get('CharCode', ''),
                     'nominal': currency_data.get('Nominal', 1),
                     'name': currency_data.get('Name', ''),
-                    'value': float(str(currency_data.get('Value', 0)).replace(',', '.')),
-                    'previous': float(str(currency_data.get('Previous', 0)).replace(',', '.')),
-                    'timestamp': datetime.now().isoformat()
+                    'value': _to_number(currency_data.get('Value', 0)),
+                    'previous': _to_number(currency_data.get('Previous', 0)),
+                    'timestamp': timestamp
                 }
                 result.append(currency_info)
             except (ValueError, TypeError):
@@ -182,6 +214,90 @@ def get_all_currencies(
         return []
 
 
+def _to_number(value: Any) -> float:
+    """
+    Преобразовать значение курса из ответа API в float.
+    
+    Числа JSON уже имеют тип float - строковое преобразование нужно только
+    для строк с запятой в качестве разделителя.
+    
+    Args:
+        value: Значение курса (число или строка)
+    
+    Returns:
+        Значение курса
+    """
+    if type(value) is float:
+        return value
+    return float(str(value).replace(',', '.'))
+
+
+def parse_snapshot(
+    data: Dict[str, Any],
+    timestamp: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Разобрать весь ответ API в курсы с фиксированной точкой.
+    
+    Значения всего снимка преобразуются за один проход в целые числа
+    в десятитысячных долях рубля (см. utils.fixed_point) без Decimal и
+    промежуточных строк. Записи с некорректными данными пропускаются.
+    
+    Args:
+        data: Ответ API (словарь с ключом 'Valute')
+        timestamp: Отметка времени снимка (по умолчанию - текущее время)
+    
+    Returns:
+        Список словарей с ключами id, num_code, char_code, name, nominal,
+        value_units (курс за номинал), previous_units, rate (курс за
+        единицу валюты, без округления) и timestamp
+    
+    Raises:
+        KeyError: Если отсутствует ключ 'Valute'
+    """
+    valutes = data['Valute']
+    if timestamp is None:
+        timestamp = datetime.now().isoformat()
+    
+    records = []
+    for currency_data in valutes.values():
+        nominal = currency_data.get('Nominal', 1)
+        if type(nominal) is int and nominal > 0 and 'Value' in currency_data:
+            records.append(currency_data)
+    
+    try:
+        values = parse_scaled_many([r['Value'] for r in records])
+        previous = parse_scaled_many([r.get('Previous', 0) for r in records])
+    except (ValueError, TypeError):
+        # Редкий случай: в снимке есть некорректные значения - записи
+        # разбираются по одной, а некорректные пропускаются
+        values, previous, valid = [], [], []
+        for r in records:
+            try:
+                value, prev = parse_scaled(r['Value']), parse_scaled(r.get('Previous', 0))
+            except (ValueError, TypeError):
+                continue
+            values.append(value)
+            previous.append(prev)
+            valid.append(r)
+        records = valid
+    
+    return [
+        {
+            'id': r.get('ID', ''),
+            'num_code': r.get('NumCode', ''),
+            'char_code': r.get('CharCode', ''),
+            'name': r.get('Name', ''),
+            'nominal': r.get('Nominal', 1),
+            'value_units': value,
+            'previous_units': prev,
+            'rate': unit_rate(value, r['Nominal']),
+            'timestamp': timestamp
+        }
+        for r, value, prev in zip(records, values, previous)
+    ]
+
+
 def calculate_exchange(
     amount: float,
     from_currency: str,
@@ -191,6 +307,10 @@ def calculate_exchange(
     """
     Рассчитать обмен валют.
     
+    Кросс-курс считается точно по курсам за номинал и номиналам (см.
+    get_rate_units), без промежуточных округлений. Результат не
+    округляется до 4 знаков - это делается при выводе.
+    
     Args:
         amount: Сумма для обмена
         from_currency: Исходная валюта
@@ -205,30 +325,18 @@ def calculate_exchange(
         if from_currency == to_currency:
             return amount
         
-        # Получаем курсы
-        if to_currency == "RUB":
-            # Прямой расчет в рубли
-            currencies = get_currencies([from_currency], url)
-            if from_currency not in currencies:
-                return None
-            return amount * currencies[from_currency]
-        
-        elif from_currency == "RUB":
-            # Расчет из рублей
-            currencies = get_currencies([to_currency], url)
-            if to_currency not in currencies:
-                return None
-            return amount / currencies[to_currency]
+        # Получаем курсы за номинал (рубль - курс 1 за 1)
+        codes = [code for code in (from_currency, to_currency) if code != "RUB"]
+        rates = get_rate_units(codes, url)
+        if any(code not in rates for code in codes):
+            return None
+        rates["RUB"] = (RATE_SCALE, 1)
         
-        else:
-            # Кросс-курс через рубли
-            currencies = get_currencies([from_currency, to_currency], url)
-            if from_currency not in currencies or to_currency not in currencies:
-                return None
-            
-            # Конвертируем в рубли, затем в целевую валюту
-            amount_in_rub = amount * currencies[from_currency]
-            return amount_in_rub / currencies[to_currency]
+        # amount * (from_value / from_nominal) / (to_value / to_nominal):
+        # точная дробь, округляемая один раз при преобразовании во float
+        from_units, from_nominal = rates[from_currency]
+        to_units, to_nominal = rates[to_currency]
+        return float(Fraction(amount) * from_units * to_nominal / (from_nominal * to_units))
             
     except Exception:
         return None
@@ -0,0 +1,157 @@
+"""
+Модуль постраничной выдачи списков в API.
+
+Используется курсорная пагинация: клиент получает непрозрачный курсор
+next_cursor (закодированный ключ последней выданной записи) и передает
+его в следующем запросе. В отличие от offset, поиск начала страницы по
+ключу не зависит от номера страницы, а размер ответа ограничен limit.
+"""
+
+import base64
+import json
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Размер страницы по умолчанию и максимальный размер страницы
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def encode_cursor(key: Any) -> str:
+    """
+    Закодировать ключ записи в курсор.
+
+    Args:
+        key: Ключ последней выданной записи (сериализуемый в JSON)
+
+    Returns:
+        Курсор в виде строки, безопасной для URL
+    """
+    raw = json.dumps(key, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: Optional[str]) -> Any:
+    """
+    Раскодировать курсор.
+
+    Args:
+        cursor: Курсор из запроса (None или пустая строка - первая страница)
+
+    Returns:
+        Ключ записи или None
+
+    Raises:
+        ValueError: Если курсор поврежден
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Некорректный курсор") from e
+
+
+def parse_limit(value: Optional[str], default: int = DEFAULT_PAGE_SIZE,
+                maximum: int = MAX_PAGE_SIZE) -> int:
+    """
+    Разобрать размер страницы.
+
+    Args:
+        value: Значение параметра limit
+        default: Размер страницы по умолчанию
+        maximum: Максимальный размер страницы
+
+    Returns:
+        Размер страницы от 1 до maximum
+
+    Raises:
+        ValueError: Если значение не является положительным числом
+    """
+    if value is None or value == '':
+        return default
+    try:
+        limit = int(value)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        raise ValueError("limit должен быть положительным числом")
+    return min(limit, maximum)
+
+
+def parse_fields(value: Optional[str], allowed: Iterable[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Разобрать список полей для выдачи (?fields=id,char_code).
+
+    Args:
+        value: Значение параметра fields
+        allowed: Допустимые поля
+
+    Returns:
+        Кортеж полей или None, если нужны все поля
+
+    Raises:
+        ValueError: Если указано неизвестное поле
+    """
+    if not value:
+        return None
+    fields = tuple(dict.fromkeys(f.strip() for f in value.split(',') if f.strip()))
+    unknown = [f for f in fields if f not in allowed]
+    if unknown:
+        raise ValueError(f"Неизвестные поля: {', '.join(unknown)}")
+    return fields or None
+
+
+def project(item: Dict[str, Any], fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+    """
+    Оставить в записи только запрошенные поля.
+
+    Args:
+        item: Запись
+        fields: Поля (None - все поля)
+
+    Returns:
+        Запись с выбранными полями
+    """
+    if fields is None:
+        return item
+    return {field: item[field] for field in fields if field in item}
+
+
+def page_after(
+    items: Sequence[Any],
+    key: Callable[[Any], Any],
+    after: Any = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    predicate: Optional[Callable[[Any], bool]] = None
+) -> Tuple[List[Any], Any]:
+    """
+    Выбрать страницу из последовательности, упорядоченной по ключу.
+
+    Начало страницы находится двоичным поиском, поэтому стоимость не
+    зависит от того, насколько далеко от начала находится курсор.
+
+    Args:
+        items: Последовательность, отсортированная по возрастанию key
+        key: Функция получения ключа записи
+        after: Ключ последней записи предыдущей страницы (None - с начала)
+        limit: Размер страницы
+        predicate: Фильтр записей
+
+    Returns:
+        (записи страницы, ключ для следующей страницы или None)
+    """
+    start = bisect_right(items, after, key=key) if after is not None else 0
+
+    page = []
+    for index in range(start, len(items)):
+        item = items[index]
+        if predicate is not None and not predicate(item):
+            continue
+        if len(page) == limit:
+            return page, key(page[-1])
+        page.append(item)
+
+    return page, None
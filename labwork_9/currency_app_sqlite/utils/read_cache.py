@@ -0,0 +1,101 @@
+"""
+Модуль кэширования результатов чтения из базы данных.
+
+Результаты запросов хранятся в памяти с вытеснением по LRU и временем
+жизни записи (TTL). Операции записи сбрасывают кэш вызовом invalidate(),
+а TTL ограничивает устаревание данных, измененных в обход кэша.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ReadCache:
+    """Read-through кэш с вытеснением по LRU и ограничением времени жизни."""
+
+    def __init__(self, max_entries: int = 256, ttl: Optional[float] = 300.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Инициализация кэша.
+
+        Args:
+            max_entries: Максимальное количество хранимых записей
+            ttl: Время жизни записи в секундах (None - без ограничения)
+            clock: Источник времени (монотонные часы)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        """
+        Получить значение из кэша или загрузить и сохранить его.
+
+        Args:
+            key: Ключ записи
+            load: Функция загрузки значения, вызывается при промахе
+
+        Returns:
+            Значение из кэша или результат load()
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expired += 1
+            self.misses += 1
+            version = self.version
+
+        value = load()
+
+        with self._lock:
+            # Данные могли измениться во время загрузки - такой результат не сохраняем
+            if version == self.version:
+                expires_at = self.clock() + self.ttl if self.ttl is not None else float('inf')
+                self._entries[key] = (expires_at, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evicted += 1
+
+        return value
+
+    def invalidate(self) -> None:
+        """Сбросить кэш после изменения данных."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Получить статистику кэша.
+
+        Returns:
+            Словарь с числом записей, попаданий, промахов, устаревших и
+            вытесненных записей и долей попаданий
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'version': self.version,
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'expired': self.expired,
+                'evicted': self.evicted,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
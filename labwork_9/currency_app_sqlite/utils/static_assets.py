@@ -0,0 +1,245 @@
+"""
+Модуль обслуживания статических файлов.
+
+Файлы каталога static читаются один раз при старте сервера: небольшие
+хранятся в памяти вместе с заранее сжатыми вариантами, большие отдаются
+через os.sendfile (socket.sendfile) или отображение в память (mmap).
+Каждый файл получает отпечаток содержимого, поэтому адрес вида
+/static/css/style.<hash>.css можно кэшировать в браузере бессрочно.
+"""
+
+import hashlib
+import mmap
+import os
+import socket
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+
+from utils.compression import COMPRESSIBLE_EXTENSIONS, SUPPORTED_ENCODINGS, compress, select_variant
+
+
+# MIME-типы статических файлов
+MIME_TYPES = {
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+    '.json': 'application/json'
+}
+
+# Заголовок для адресов с отпечатком: содержимое по такому адресу не меняется
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+@dataclass
+class StaticAsset:
+    """Статический файл, подготовленный к отдаче."""
+    path: str
+    file_path: str
+    content_type: str
+    size: int
+    digest: str
+    # Варианты содержимого {кодировка: байты}; пусто для больших файлов
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> str:
+        """Получить ETag файла (слабый - один на все варианты сжатия)."""
+        return f'W/"{self.digest}"'
+
+    @property
+    def in_memory(self) -> bool:
+        """Хранится ли содержимое файла в памяти."""
+        return bool(self.variants)
+
+    @property
+    def hashed_path(self) -> str:
+        """Получить путь с отпечатком содержимого (css/style.<hash>.css)."""
+        base, ext = os.path.splitext(self.path)
+        return f"{base}.{self.digest}{ext}"
+
+
+class StaticAssetStore:
+    """Хранилище статических файлов приложения."""
+
+    def __init__(
+        self,
+        static_dir: str = 'static',
+        url_prefix: str = '/static/',
+        memory_limit: int = 256 * 1024,
+        compress_assets: bool = True,
+        compression_min_size: int = 1024,
+        compression_level: int = 9,
+        max_age: int = 3600
+    ):
+        """
+        Инициализация хранилища.
+
+        Args:
+            static_dir: Каталог со статическими файлами
+            url_prefix: Префикс адресов статики
+            memory_limit: Файлы больше этого размера не держатся в памяти
+            compress_assets: Готовить ли сжатые варианты файлов
+            compression_min_size: Минимальный размер файла для сжатия
+            compression_level: Уровень сжатия статики
+            max_age: Время кэширования (с) для адресов без отпечатка
+        """
+        self.static_dir = static_dir
+        self.url_prefix = url_prefix
+        self.memory_limit = memory_limit
+        self.compress_assets = compress_assets
+        self.compression_min_size = compression_min_size
+        self.compression_level = compression_level
+        self.max_age = max_age
+        self.loaded = False
+        self._assets: Dict[str, StaticAsset] = {}
+        self._routes: Dict[str, Tuple[StaticAsset, bool]] = {}
+
+    def load(self) -> int:
+        """
+        Прочитать, сжать и снабдить отпечатками все файлы каталога.
+
+        Returns:
+            Количество загруженных файлов
+        """
+        assets = {}
+        routes = {}
+
+        if os.path.isdir(self.static_dir):
+            for root, dirs, files in os.walk(self.static_dir):
+                dirs[:] = [d for d in dirs if not d.startswith('.')]
+
+                for file in files:
+                    file_path = os.path.join(root, file)
+                    rel_path = os.path.relpath(file_path, self.static_dir).replace(os.sep, '/')
+                    asset = self._load_asset(rel_path, file_path)
+
+                    assets[rel_path] = asset
+                    routes[rel_path] = (asset, False)
+                    routes[asset.hashed_path] = (asset, True)
+
+        self._assets = assets
+        self._routes = routes
+        self.loaded = True
+        return len(assets)
+
+    def _load_asset(self, rel_path: str, file_path: str) -> StaticAsset:
+        """Подготовить один файл к отдаче."""
+        _, ext = os.path.splitext(rel_path)
+        content_type = MIME_TYPES.get(ext.lower(), 'application/octet-stream')
+        size = os.path.getsize(file_path)
+        hasher = hashlib.sha256()
+        variants = {}
+
+        with open(file_path, 'rb') as f:
+            if size <= self.memory_limit:
+                content = f.read()
+                hasher.update(content)
+                variants['identity'] = content
+
+                if (self.compress_assets
+                        and ext.lower() in COMPRESSIBLE_EXTENSIONS
+                        and size >= self.compression_min_size):
+                    for encoding in SUPPORTED_ENCODINGS:
+                        compressed = compress(content, encoding, self.compression_level)
+                        if len(compressed) < size:
+                            variants[encoding] = compressed
+            else:
+                # Большие файлы только хэшируем по частям
+                for chunk in iter(lambda: f.read(64 * 1024), b''):
+                    hasher.update(chunk)
+
+        return StaticAsset(
+            path=rel_path,
+            file_path=file_path,
+            content_type=content_type,
+            size=size,
+            digest=hasher.hexdigest()[:12],
+            variants=variants
+        )
+
+    def lookup(self, rel_path: str) -> Optional[Tuple[StaticAsset, bool]]:
+        """
+        Найти файл по относительному пути.
+
+        Args:
+            rel_path: Путь без префикса, например 'css/style.css'
+
+        Returns:
+            Кортеж (файл, адрес с отпечатком) или None
+        """
+        return self._routes.get(rel_path)
+
+    def url_for(self, rel_path: str) -> str:
+        """
+        Получить адрес файла с отпечатком содержимого.
+
+        Args:
+            rel_path: Путь без префикса, например 'css/style.css'
+
+        Returns:
+            Адрес с отпечатком или обычный адрес, если файл не загружен
+        """
+        asset = self._assets.get(rel_path)
+        if asset is None:
+            return self.url_prefix + rel_path
+        return self.url_prefix + asset.hashed_path
+
+    def send(self, handler, asset: StaticAsset, immutable: bool) -> None:
+        """
+        Отправить файл клиенту.
+
+        Args:
+            handler: Обработчик запроса (BaseHTTPRequestHandler)
+            asset: Отправляемый файл
+            immutable: Запрошен ли адрес с отпечатком
+        """
+        headers = getattr(handler, 'headers', None) or {}
+
+        if headers.get('If-None-Match') == asset.etag:
+            handler.send_response(304)
+            handler.send_header('ETag', asset.etag)
+            handler.end_headers()
+            return
+
+        handler.send_response(200)
+        handler.send_header('Content-type', asset.content_type)
+        handler.send_header('ETag', asset.etag)
+        handler.send_header(
+            'Cache-Control',
+            IMMUTABLE_CACHE_CONTROL if immutable else f'public, max-age={self.max_age}'
+        )
+
+        if asset.in_memory:
+            content, encoding = select_variant(asset.variants, headers.get('Accept-Encoding'))
+            handler.send_header('Content-Length', str(len(content)))
+            if len(asset.variants) > 1:
+                handler.send_header('Vary', 'Accept-Encoding')
+            if encoding:
+                handler.send_header('Content-Encoding', encoding)
+            handler.end_headers()
+            handler.wfile.write(content)
+            return
+
+        handler.send_header('Content-Length', str(asset.size))
+        handler.end_headers()
+        self._send_file(handler, asset)
+
+    def _send_file(self, handler, asset: StaticAsset) -> None:
+        """Отправить большой файл без копирования в память процесса."""
+        if asset.size == 0:
+            return
+
+        with open(asset.file_path, 'rb') as f:
+            connection = getattr(handler, 'connection', None)
+            if isinstance(connection, socket.socket):
+                # Использует os.sendfile, если он доступен в системе
+                handler.wfile.flush()
+                connection.sendfile(f, 0, asset.size)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    handler.wfile.write(mapped)